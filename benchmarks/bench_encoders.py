@@ -0,0 +1,55 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import sys
+import time
+from pathlib import Path
+from PIL import Image
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SAMPLE_PATH = ROOT_DIR / "assets" / "welcome" / "welcome1.png"
+
+sys.path.insert(0, str(ROOT_DIR / "bot"))
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from imaging.effects import apply_effect
+from imaging.encoder import encode_image
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+SIZE = 512                   # Render size (px), the default avatar size
+REPEATS = 3                  # Best-of runs per effect and format
+
+EFFECTS = [
+    "blur", "contour", "detail", "edge_enhance", "edge_enhance_more", "emboss", "find_edges",
+    "sharpen", "smooth", "smooth_more", "grayscale", "sepia", "invert", "brighten", "darken",
+    "high_contrast", "low_contrast", "saturate", "desaturate", "pro_enhance",
+]
+
+FORMATS = ["png", "webp_lossless", "webp", "jpeg", "auto"]
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Best-of encode time in milliseconds and the encoded size
+def _encode(img: Image.Image, fmt: str) -> tuple:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        data = encode_image(img, {"format": fmt})
+        best = min(best, time.perf_counter() - start)
+
+    return best * 1000, len(data)
+
+# (2) Print encode-time vs. bytes-sent for every effect and format
+def main():
+    source = Image.open(SAMPLE_PATH).convert("RGB").resize((SIZE, SIZE), Image.LANCZOS)
+
+    header = f"{'effect':<19}" + "".join(f"{fmt:>22}" for fmt in FORMATS)
+    print(header)
+    print(f"{'':<19}" + "".join(f"{'ms / KB':>22}" for _ in FORMATS))
+    print("-" * len(header))
+
+    for effect in EFFECTS:
+        img = apply_effect(source, effect)
+        cells = [_encode(img, fmt) for fmt in FORMATS]
+        print(f"{effect:<19}" + "".join(f"{ms:>12.1f} / {size / 1024:>6.0f}" for ms, size in cells))
+
+if __name__ == "__main__":
+    main()
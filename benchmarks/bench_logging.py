@@ -0,0 +1,121 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import os
+import re
+import sys
+import time
+import logging
+from pathlib import Path
+from colorama import Fore, Style
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+sys.path.insert(0, str(ROOT_DIR / "bot"))
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from core.logger import ColoredFormatter, FileFormatter
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+FMT = "[%(asctime)s] | %(levelname)s | %(message)s"
+DATEFMT = "%d-%m-%Y %H:%M:%S"
+COLORS = {"debug": Fore.CYAN, "info": Fore.GREEN, "warning": Fore.YELLOW, "error": Fore.RED, "critical": Fore.RED}
+
+RECORDS = 20000              # Records per timing run
+REPEATS = 5                  # Best-of runs per formatter
+
+# LEGACY IMPLEMENTATIONS ---------------------------------------------------------------------------------------------------------------------------|
+# (1) Record-cloning formatters that used to live in core/logger.py
+class LegacyColoredFormatter(logging.Formatter):
+    def __init__(self, fmt, datefmt, colors, show_traceback):
+        super().__init__(fmt = fmt, datefmt = datefmt)
+        self.colors = colors
+        self.show_traceback = show_traceback
+
+    def format(self, record):
+        record_copy = logging.makeLogRecord(record.__dict__.copy())
+        color = self.colors.get(record_copy.levelname.lower(), "")
+        record_copy.levelname = f"{color}{record_copy.levelname}{Style.RESET_ALL}"
+        log_msg = super().format(record_copy)
+
+        if record_copy.exc_info and self.show_traceback:
+            log_msg += f"\n{self.formatException(record_copy.exc_info)}"
+
+        return log_msg
+
+class LegacyFileFormatter(logging.Formatter):
+    ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+
+    def __init__(self, fmt, datefmt, show_traceback):
+        super().__init__(fmt = fmt, datefmt = datefmt)
+        self.show_traceback = show_traceback
+
+    def format(self, record):
+        record_copy = logging.makeLogRecord(record.__dict__.copy())
+        if hasattr(record_copy, 'msg') and isinstance(record_copy.msg, str):
+            record_copy.msg = self.ANSI_ESCAPE_PATTERN.sub('', record_copy.msg)
+
+        if hasattr(record_copy, 'levelname'):
+            record_copy.levelname = self.ANSI_ESCAPE_PATTERN.sub('', str(record_copy.levelname))
+
+        log_msg = self.ANSI_ESCAPE_PATTERN.sub('', super().format(record_copy))
+
+        if record_copy.exc_info and self.show_traceback:
+            log_msg += f"\n{self.ANSI_ESCAPE_PATTERN.sub('', self.formatException(record_copy.exc_info))}"
+
+        return log_msg
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) DEBUG-volume records like the bot emits (short messages with args, all in the same second or two)
+def _records() -> list:
+    return [
+        logging.LogRecord("bot", logging.DEBUG, __file__, 0, "Rendered %s for user %d in %.1f ms", ("blur", 1234567890 + i, 12.5), None)
+        for i in range(RECORDS)
+    ]
+
+# (2) Best-of records per second through format() alone
+def _format_rate(formatter: logging.Formatter, records: list) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for record in records:
+            formatter.format(record)
+
+        best = min(best, time.perf_counter() - start)
+
+    return len(records) / best
+
+# (3) Best-of records per second through a handler writing to os.devnull (format + write, no disk latency)
+def _handler_rate(formatter: logging.Formatter, records: list) -> float:
+    with open(os.devnull, "w", encoding = "utf-8") as sink:
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(formatter)
+
+        best = float("inf")
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            for record in records:
+                handler.handle(record)
+
+            best = min(best, time.perf_counter() - start)
+
+    return len(records) / best
+
+# (4) Print a records/second table for console and file output
+def main():
+    records = _records()
+    pairs = {
+        "console": (LegacyColoredFormatter(FMT, DATEFMT, COLORS, False), ColoredFormatter(FMT, DATEFMT, COLORS, False)),
+        "file": (LegacyFileFormatter(FMT, DATEFMT, True), FileFormatter(FMT, DATEFMT, True)),
+    }
+
+    print(f"{'output':<10}{'stage':<10}{'legacy rec/s':>15}{'current rec/s':>15}{'speedup':>10}")
+    print("-" * 60)
+
+    for name, (legacy, current) in pairs.items():
+        for stage, measure in (("format", _format_rate), ("handler", _handler_rate)):
+            legacy_rate = measure(legacy, records)
+            current_rate = measure(current, records)
+            print(f"{name:<10}{stage:<10}{legacy_rate:>15,.0f}{current_rate:>15,.0f}{current_rate / legacy_rate:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
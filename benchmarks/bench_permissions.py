@@ -0,0 +1,79 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import sys
+import time
+import yaml
+from pathlib import Path
+from types import SimpleNamespace
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+ROOT_DIR = Path(__file__).resolve().parent.parent
+PERMISSIONS_PATH = ROOT_DIR / "config" / "permissions.yaml"
+
+sys.path.insert(0, str(ROOT_DIR / "bot"))
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from commands.admin import has_admin_role, has_permissions, get_mod_logs_channel
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+ROLE_COUNTS = (5, 25, 100)   # Roles held by the member being checked
+CALLS = 2000                 # Checks per timing run
+REPEATS = 5                  # Best-of runs per check
+
+# LEGACY IMPLEMENTATIONS ---------------------------------------------------------------------------------------------------------------------------|
+# (1) Per-call YAML read and list scan that used to live in commands/admin.py
+def _legacy_load_permissions() -> dict:
+    with open(PERMISSIONS_PATH, "r", encoding = "utf-8") as f:
+        return yaml.safe_load(f)
+
+def _legacy_has_admin_role(interaction) -> bool:
+    permissions = _legacy_load_permissions()
+    admin_roles = permissions.get('Roles', {}).get('Admin', [])
+    user_role_ids = [role.id for role in interaction.user.roles]
+    return any(role_id in admin_roles for role_id in user_role_ids)
+
+def _legacy_has_mod_role(interaction) -> bool:
+    permissions = _legacy_load_permissions()
+    mod_roles = permissions.get('Roles', {}).get('Mods', [])
+    user_role_ids = [role.id for role in interaction.user.roles]
+    return any(role_id in mod_roles for role_id in user_role_ids)
+
+def _legacy_has_permissions(interaction) -> bool:
+    return _legacy_has_admin_role(interaction) or _legacy_has_mod_role(interaction)
+
+def _legacy_get_mod_logs_channel():
+    mod_logs = _legacy_load_permissions().get('mod_logs')
+    return None if mod_logs in (None, False, 0) else mod_logs
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Best-of timing in microseconds per call
+def _time_us(func, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            func(*args)
+
+        best = min(best, time.perf_counter() - start)
+
+    return best / CALLS * 1_000_000
+
+# (2) Print per-check latency for members with a growing number of roles (worst case: no staff role, every role is scanned)
+def main():
+    print(f"{'check':<22}{'roles':>6}{'legacy us':>12}{'index us':>12}{'speedup':>10}")
+    print("-" * 62)
+
+    for count in ROLE_COUNTS:
+        interaction = SimpleNamespace(user = SimpleNamespace(roles = [SimpleNamespace(id = 10 ** 17 + i) for i in range(count)]))
+        checks = {
+            "has_admin_role": (_legacy_has_admin_role, has_admin_role, (interaction,)),
+            "has_permissions": (_legacy_has_permissions, has_permissions, (interaction,)),
+            "get_mod_logs_channel": (_legacy_get_mod_logs_channel, get_mod_logs_channel, ()),
+        }
+
+        for name, (legacy_check, check, args) in checks.items():
+            legacy = _time_us(legacy_check, *args)
+            indexed = _time_us(check, *args)
+            print(f"{name:<22}{count:>6}{legacy:>12.2f}{indexed:>12.2f}{legacy / indexed:>9.0f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import sys
+import time
+from pathlib import Path
+from PIL import Image, ImageEnhance, ImageOps
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+ROOT_DIR = Path(__file__).resolve().parent.parent
+SAMPLE_PATH = ROOT_DIR / "assets" / "welcome" / "welcome1.png"
+
+sys.path.insert(0, str(ROOT_DIR / "bot"))
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from imaging.pointops import POINT_EFFECTS, apply_point_effect
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+SIZES = (128, 512, 1024)     # Square input sizes (px)
+REPEATS = 5                  # Best-of runs per effect and size
+
+# LEGACY IMPLEMENTATIONS ---------------------------------------------------------------------------------------------------------------------------|
+# (1) Per-pixel sepia loop that used to live in FunCommands._apply_filter
+def _legacy_sepia(img: Image.Image) -> Image.Image:
+    img = img.convert('L')
+    sepia_img = Image.new('RGB', img.size)
+    pixels = sepia_img.load()
+    original = img.load()
+
+    for y in range(img.size[1]):
+        for x in range(img.size[0]):
+            gray = original[x, y]
+            pixels[x, y] = (gray, int(gray * 0.95), int(gray * 0.82))
+
+    return sepia_img
+
+LEGACY = {
+    "grayscale": lambda img: img.convert('L').convert('RGB'),
+    "sepia": _legacy_sepia,
+    "invert": ImageOps.invert,
+    "brighten": lambda img: ImageEnhance.Brightness(img).enhance(1.5),
+    "darken": lambda img: ImageEnhance.Brightness(img).enhance(0.6),
+    "high_contrast": lambda img: ImageEnhance.Contrast(img).enhance(2.0),
+    "low_contrast": lambda img: ImageEnhance.Contrast(img).enhance(0.5),
+    "saturate": lambda img: ImageEnhance.Color(img).enhance(2.0),
+    "desaturate": lambda img: ImageEnhance.Color(img).enhance(0.3),
+}
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Best-of timing in milliseconds
+def _time_ms(func, img: Image.Image) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(img)
+        best = min(best, time.perf_counter() - start)
+
+    return best * 1000
+
+# (2) Print a per-effect table for every input size
+def main():
+    source = Image.open(SAMPLE_PATH).convert("RGB")
+
+    print(f"{'effect':<15}{'size':>6}{'legacy ms':>12}{'engine ms':>12}{'speedup':>10}")
+    print("-" * 55)
+
+    for name in POINT_EFFECTS:
+        for size in SIZES:
+            img = source.resize((size, size), Image.LANCZOS)
+
+            legacy = _time_ms(LEGACY[name], img)
+            engine = _time_ms(lambda i: apply_point_effect(i, name), img)
+
+            print(f"{name:<15}{size:>6}{legacy:>12.2f}{engine:>12.2f}{legacy / engine:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -1,56 +1,39 @@
 # LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
-import yaml
-from pathlib import Path
 from typing import Optional
 from datetime import datetime
 from nextcord.ext import commands
 from nextcord import slash_command, Interaction, SlashOption, Embed, Color
 
 # LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
-from core import get_logger
+from core import get_logger, get_config, PermissionIndex
 
 # DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
 divider = f"=" * 70
 sub_divider = f"-" * 70
 
-# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
-# (1) Premissions Config Path
-PERMISSIONS_DIR = Path(__file__).resolve().parent.parent.parent
-PERMISSIONS_PATH = PERMISSIONS_DIR / "config" / "permissions.yaml"
-
 # PERMISSION UTILITIES -----------------------------------------------------------------------------------------------------------------------------|
-# (1) Load permissions from YAML file
-def load_permissions() -> dict:
-    with open(PERMISSIONS_PATH, "r", encoding = "utf-8") as f:
-        return yaml.safe_load(f)
+# (1) Role and channel IDs from the shared config snapshot, as ints in frozensets (no file I/O per check)
+def load_permissions() -> PermissionIndex:
+    return get_config().permission_index
 
 # (2) Check if use has admin role
 def has_admin_role(interaction: Interaction) -> bool:
-    permissions = load_permissions()
-    admin_roles = permissions.get('Roles', {}).get('Admin', [])
-    user_role_ids = [role.id for role in interaction.user.roles]
-    return any(role_id in admin_roles for role_id in user_role_ids)
+    admin_roles = load_permissions().admin
+    return any(role.id in admin_roles for role in interaction.user.roles)
 
 # (3) Check if user has moderator role
 def has_mod_role(interaction: Interaction) -> bool:
-    permissions = load_permissions()
-    mod_roles = permissions.get('Roles', {}).get('Mods', [])
-    user_role_ids = [role.id for role in interaction.user.roles]
-    return any(role_id in mod_roles for role_id in user_role_ids)
+    mod_roles = load_permissions().mods
+    return any(role.id in mod_roles for role in interaction.user.roles)
 
-# (4) Check if user has admin or moderator role
+# (4) Check if user has admin or moderator role (one pass over the user's roles)
 def has_permissions(interaction: Interaction) -> bool:
-    return has_admin_role(interaction) or has_mod_role(interaction)
+    staff_roles = load_permissions().staff
+    return any(role.id in staff_roles for role in interaction.user.roles)
 
-# (5) Get mod logs channel ID
+# (5) Get mod logs channel ID (None when mod_logs is disabled or not an ID)
 def get_mod_logs_channel() -> Optional[int]:
-    permissions = load_permissions()
-    mod_logs = permissions.get('mod_logs')
-    
-    # --- Return None if mod_logs is disabled ---
-    if mod_logs in (None, False, 0):
-        return None
-    return mod_logs
+    return load_permissions().mod_logs
 
 # MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
 class AdminCommands(commands.Cog):
@@ -1,5 +1,4 @@
 # LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
-import json
 import nextcord
 from pathlib import Path
 from datetime import datetime
@@ -7,7 +6,7 @@ from nextcord.ext import commands
 from nextcord import slash_command, Interaction, SlashOption, Embed, Color
 
 # LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
-from core import get_logger
+from core import get_logger, get_config
 
 # DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
 divider = f"=" * 70
@@ -18,10 +17,6 @@ sub_divider = f"-" * 70
 PROFILE_DIR = Path(__file__).resolve().parent.parent.parent
 PROFILE_PATH = PROFILE_DIR / "assets" / "profile"
 
-# (2) Help Config Path
-HELP_CMD_DIR = Path(__file__).resolve().parent.parent.parent
-HELP_CMD_PATH = HELP_CMD_DIR / "config" / "commands" / "help.json"
-
 # MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
 class BasicCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -29,6 +24,9 @@ class BasicCommands(commands.Cog):
         self.logger = get_logger()
         self.logger.info("Basic Commands initialized")
 
+        # --- Profile banner stays resident; botinfo never touches the filesystem ---
+        self.bot.assets.register("profile", PROFILE_PATH)
+
     # (1) Ping Command
     @slash_command(
         name = "ping",
@@ -127,10 +125,15 @@ class BasicCommands(commands.Cog):
             )
             embed.set_footer(text = "Thank you for using this bot • Built with nextcord")
 
-            banner_path = PROFILE_PATH / "banner.png"
-            if banner_path.exists():
+            banner = self.bot.assets.get("profile", "banner.png")
+            banner_url = await self.bot.attachments.url_for("profile", banner) if banner is not None else None
+            if banner_url:
+                embed.set_image(url = banner_url)
+                await interaction.response.send_message(embed = embed)
+
+            elif banner is not None:
                 embed.set_image(url = "attachment://banner.png")
-                file = nextcord.File(banner_path, filename = "banner.png")
+                file = banner.to_file()
                 await interaction.response.send_message(embed = embed, file = file)
 
             else:
@@ -329,9 +332,8 @@ class BasicCommands(commands.Cog):
         )
     ):
         try:
-            # --- Load help configuration ---
-            with open(HELP_CMD_PATH, "r", encoding = "utf-8") as f:
-                help_data = json.load(f)
+            # --- Help configuration (parsed once at startup) ---
+            help_data = get_config().help
 
             # --- Fetch command help data ---
             command_data = help_data.get(name)
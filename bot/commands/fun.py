@@ -1,25 +1,25 @@
 # LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
 import io
-import json
+import time
+import asyncio
 import random
-import aiohttp
 import nextcord
 from pathlib import Path
+from typing import Awaitable, Callable
 from nextcord.ext import commands
-from PIL import Image, ImageFilter, ImageEnhance, ImageOps, ImageDraw
 from nextcord import slash_command, Interaction, SlashOption, Embed, Color
 
 # LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
-from core import get_logger
+from core import get_logger, get_config, thaw
+from imaging import render_effects, render_animated_effects, warm_render_caches, sniff_extension, RenderExecutor, RenderCache, SingleFlight, RenderQueue
 
 # DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
 divider = f"=" * 70
 sub_divider = f"-" * 70
 
 # PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
-# (1) Fun Commands Input Path
+# (1) Project Root (cache paths in bot.yaml are relative to it)
 FUN_DIR = Path(__file__).resolve().parent.parent.parent
-FUN_PATH = FUN_DIR / "config" / "commands" / "fun.json"
 
 # (2) CoinFlip Command Assets Path
 COIN_FLIP_DIR = Path(__file__).resolve().parent.parent.parent
@@ -30,6 +30,33 @@ MAX_TEXT_LENGTH = 500        # Maximum character limit for text commands
 
 MAX_RECENT = 20              # How many recent messages to avoid repeating
 
+DEFAULT_AVATAR_SIZE = 512    # Render size (px) for effects without an entry in avatar.sizes
+
+QUEUE_REFRESH_SECONDS = 3    # How often a queued user's position message is refreshed
+
+AVATAR_EFFECTS = {           # Effect choices for the avatar command (display name -> effect)
+    "Blur": "blur",
+    "Contour": "contour",
+    "Detail": "detail",
+    "Edge Enhance": "edge_enhance",
+    "Edge Enhance More": "edge_enhance_more",
+    "Emboss": "emboss",
+    "Find Edges": "find_edges",
+    "Sharpen": "sharpen",
+    "Smooth": "smooth",
+    "Smooth More": "smooth_more",
+    "Grayscale": "grayscale",
+    "Sepia": "sepia",
+    "Invert": "invert",
+    "Brighten": "brighten",
+    "Darken": "darken",
+    "High Contrast": "high_contrast",
+    "Low Contrast": "low_contrast",
+    "Saturate": "saturate",
+    "Desaturate": "desaturate",
+    "Pro Enhance": "pro_enhance"
+}
+
 # MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
 class FunCommands(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -38,12 +65,71 @@ class FunCommands(commands.Cog):
         self.logger.info("Fun Commands initialized")
 
         # --- Compliemnt and Insult commands ---
-        with open(FUN_PATH, "r", encoding = "utf-8") as f:
-            self.fun_data = json.load(f)
-
         self.recent_compliments = []
         self.recent_insults = []
 
+        # --- Coin images stay resident; flips never touch the filesystem ---
+        self.bot.assets.register("coinflip", COIN_FLIP_PATH)
+
+        # --- Avatar render workers ---
+        avatar_cfg = self.bot.config.avatar
+        self.render_executor = RenderExecutor(
+            kind = avatar_cfg.executor,
+            max_workers = avatar_cfg.max_workers,
+            initializer = warm_render_caches
+        )
+
+        # --- Avatar render cache ---
+        cache_cfg = avatar_cfg.cache
+        self.render_cache = RenderCache(
+            max_bytes = int(cache_cfg.memory_mb * 1024 * 1024),
+            disk_dir = FUN_DIR / cache_cfg.disk_dir if cache_cfg.disk else None,
+            disk_max_bytes = int(cache_cfg.disk_max_mb * 1024 * 1024)
+        )
+
+        # --- Resolution policy: CDN size and static format fetched per effect ---
+        self.avatar_sizes = avatar_cfg.sizes
+        self.avatar_source_format = avatar_cfg.source_format
+
+        # --- Per-effect output stats ---
+        self.avatar_output_stats = {}
+
+        # --- Identical renders running at the same time share one job ---
+        self.render_flights = SingleFlight()
+
+        # --- Admission control: bounded worker slots and waiting line for renders ---
+        queue_cfg = avatar_cfg.queue
+        self.render_queue = RenderQueue(
+            slots = queue_cfg.slots,
+            max_queue = queue_cfg.max_queue
+        )
+
+    # --- Compliment and insult lines (swapped in place when fun.json is edited) ---
+    @property
+    def fun_data(self):
+        return get_config().fun
+
+    # --- Animated avatars: rendered frame by frame into an animated GIF/WebP (follows config reloads) ---
+    @property
+    def avatar_animation(self):
+        return get_config().avatar.animated
+
+    # --- Output encoding profile (format, quality, size ceiling), overridable per effect (follows config reloads) ---
+    @property
+    def avatar_encoding(self) -> dict:
+        return thaw(get_config().avatar.encoding)
+
+    # --- Release render workers when the cog is removed ---
+    def cog_unload(self):
+        self.render_executor.shutdown()
+        self.logger.info(f"Fun Commands unloaded (render stats: {self.render_executor.stats()}, cache: {self.render_cache.stats()}, coalescing: {self.render_flights.stats()}, queue: {self.render_queue.stats()}, http pool: {self.bot.http_pool.stats()})")
+
+        for effect, stats in self.avatar_output_stats.items():
+            self.logger.info(
+                f"Avatar output '{effect}': {stats['renders']} render(s), "
+                f"avg encode {stats['encode_ms'] / stats['renders']:.1f} ms, avg {stats['bytes'] // stats['renders']} bytes"
+            )
+
     # --- Helper function for compliment/insult commands ---
     def _get_random_line(self, category: str, recent_list: list) -> str:
         items = list(self.fun_data[category].values())
@@ -62,165 +148,119 @@ class FunCommands(commands.Cog):
 
         return choice
     
-    # --- Helper function for avatar command ---
-    async def _apply_filter(self, image_url: str, filter_name: str) -> io.BytesIO:
-        # --- Downlaod the image ---
-        async with aiohttp.ClientSession() as session:
-            async with session.get(image_url) as resp:
-                if resp.status != 200:
-                    raise Exception("Failed to download image")
-                
-                image_data = await resp.read()
-
-        # --- Open image with PIL ---
-        img = Image.open(io.BytesIO(image_data))
-
-        # --- Convert to RGB if necessary (for PNG with transparency) ---
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-
-            background.paste(img, mask = img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-
-        # --- Apply the selected filter ---
-        # (1) Applies a basic blur effect
-        if filter_name == "blur":
-            img = img.filter(ImageFilter.BLUR)
-
-        # (2) Outlines edges in the image
-        elif filter_name == "contour":
-            img = img.filter(ImageFilter.CONTOUR)
-
-        # (3) Enhance fine details
-        elif filter_name == "detail":
-            img = img.filter(ImageFilter.DETAIL)
-    
-        # (4) Sharpens the edges moderately
-        elif filter_name == "edge_enhance":
-            img = img.filter(ImageFilter.EDGE_ENHANCE)
-    
-        # (5) Aggresive edge sharpening
-        elif filter_name == "edge_enhance_more":
-            img = img.filter(ImageFilter.EDGE_ENHANCE_MORE)
-    
-        # (6) Create a 3D raised/curved effect
-        elif filter_name == "emboss":
-            img = img.filter(ImageFilter.EMBOSS)
-    
-        # (7) Detects and highlights all edges
-        elif filter_name == "find_edges":
-            img = img.filter(ImageFilter.FIND_EDGES)
-    
-        # (8) Makes the entire image crisper
-        elif filter_name == "sharpen":
-            img = img.filter(ImageFilter.SHARPEN)
-    
-        # (9) Light smoothing effect
-        elif filter_name == "smooth":
-            img = img.filter(ImageFilter.SMOOTH)
-    
-        # (10) Stronger smoothing
-        elif filter_name == "smooth_more":
-            img = img.filter(ImageFilter.SMOOTH_MORE)
-    
-        # (11) Removes all colors
-        elif filter_name == "grayscale":
-            img = img.convert('L').convert('RGB')
-
-        # (12) Vintage brown-toned effect
-        elif filter_name == "sepia":
-            img = img.convert('L')
-            sepia_img = Image.new('RGB', img.size)
-            pixels = sepia_img.load()
-            original = img.load()
-        
-            for y in range(img.size[1]):
-                for x in range(img.size[0]):
-                    gray = original[x, y]
-                    pixels[x, y] = (gray, int(gray * 0.95), int(gray * 0.82))
-            img = sepia_img
-    
-        # (13) Reverses all colors
-        elif filter_name == "invert":
-            if img.mode != 'RGB':
-                img = img.convert('RGB')
-            
-            img = ImageOps.invert(img)
-    
-        # (14) Increases overall brightness by 50%
-        elif filter_name == "brighten":
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(1.5)
-    
-        # (15) Reduces brightness by 40%
-        elif filter_name == "darken":
-            enhancer = ImageEnhance.Brightness(img)
-            img = enhancer.enhance(0.6)
-    
-        # (16) Doubles contrast
-        elif filter_name == "high_contrast":
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(2.0)
-    
-        # (17) Reduces contrast by 50%
-        elif filter_name == "low_contrast":
-            enhancer = ImageEnhance.Contrast(img)
-            img = enhancer.enhance(0.5)
-    
-        # (18) Doubles Color intensity
-        elif filter_name == "saturate":
-            enhancer = ImageEnhance.Color(img)
-            img = enhancer.enhance(2.0)
-    
-        # (19) Refuces color intensity by 70%
-        elif filter_name == "desaturate":
-            enhancer = ImageEnhance.Color(img)
-            img = enhancer.enhance(0.3)
-
-        # (20) Give the avatar an artistic touch
-        elif filter_name == "pro_enhance":
-            # --- Resize for consistency ---
-            img = img.resize((512, 512), Image.LANCZOS)
-
-            # --- Auto contrast with safety cutoff ---
-            if img.mode != "RGB":
-                img = img.convert("RGB")
+    # --- Keep a queued user's position message current until their render starts ---
+    async def _track_queue_position(self, ticket, notice: nextcord.WebhookMessage):
+        shown = ticket.position
+
+        while True:
+            await asyncio.sleep(QUEUE_REFRESH_SECONDS)
+            position = ticket.position
+            if position == 0:
+                return
 
-            # --- Smart contrast & exposure ---
-            img = ImageOps.autocontrast(img, cutoff = 1)
+            if position != shown:
+                shown = position
+                try:
+                    await notice.edit(embed = self._queue_embed(position))
+
+                except nextcord.HTTPException:
+                    return
+
+    # --- Embed shown while a render waits for a free slot ---
+    @staticmethod
+    def _queue_embed(position: int) -> Embed:
+        return Embed(
+            title = "Queued",
+            description = f"Your avatar is **#{position}** in the render queue. It will appear here shortly.",
+            color = Color.orange()
+        )
 
-            # --- Macro clarity ---
-            img = img.filter(ImageFilter.UnsharpMask(radius = 1.6, percent = 110, threshold = 4))
+    # --- Render job for an avatar effect chain (effects run in order as one pipeline): (cache key, factory that renders it) ---
+    def _avatar_job(self, avatar: nextcord.Asset, filter_names: list) -> tuple:
+        size = max(self._resolve_avatar_size(name) for name in filter_names)
+        chain_name = "+".join(filter_names)
+        animated = avatar.is_animated() and self.avatar_animation.enabled
 
-            # --- Gentle brightness & contrast ---
-            img = ImageEnhance.Brightness(img).enhance(1.04)
-            img = ImageEnhance.Contrast(img).enhance(1.12)
+        # --- Request the CDN asset at the size we actually render ---
+        if animated:
+            size = min(size, self.avatar_animation.size)
+            source = avatar.with_size(size).with_format("gif")
+            chain_name += "+animated"
 
-            # --- Skin-sade color boost ---
-            img = ImageEnhance.Color(img).enhance(1.15)
+        else:
+            source = avatar.with_size(size).with_static_format(self.avatar_source_format)
 
-            # --- Potrait look ---
-            img = img.filter(ImageFilter.SMOOTH)
+        # --- Output settings are part of the key, so an encoding or animation change never serves stale renders ---
+        encoding = self._resolve_encoding(filter_names)
+        animation = thaw(self.avatar_animation) if animated else None
+        cache_key = RenderCache.make_key(avatar.key, chain_name, size, {"encoding": encoding, "animation": animation})
 
-            # --- Soft cinematic vignette ---
-            width, height = img.size
-            vignette = Image.new("L", (width, height), 255)
-            draw = ImageDraw.Draw(vignette)
+        return cache_key, lambda: self._render_avatar(source, filter_names, size, cache_key, encoding, animation)
 
-            draw.ellipse((-width * 0.15, -height * 0.15, width * 1.15, height * 1.15), fill = 0)
-            vignette = vignette.filter(ImageFilter.GaussianBlur(90))
+    # --- A job needs a worker slot unless its render is already in memory or being rendered for someone else ---
+    def _needs_worker(self, cache_key: str) -> bool:
+        return cache_key not in self.render_cache and cache_key not in self.render_flights
 
-            black = Image.new("RGB", img.size, (0, 0, 0))
-            img = Image.composite(black, img, vignette)
+    # --- Helper function for avatar command ---
+    async def _apply_filter(self, cache_key: str, factory: Callable[[], Awaitable[bytes]]) -> io.BytesIO:
+        # --- Concurrent identical requests await one shared render ---
+        rendered = await self.render_flights.run(cache_key, factory)
+
+        # --- Every caller gets its own buffer over the shared bytes ---
+        return io.BytesIO(rendered)
+
+    # --- Render size for an effect (per-effect override, then default) ---
+    def _resolve_avatar_size(self, filter_name: str) -> int:
+        return int(self.avatar_sizes.get(filter_name, self.avatar_sizes.get("default", DEFAULT_AVATAR_SIZE)))
+
+    # --- Encoding profile for an effect chain (global settings, then the last effect's overrides) ---
+    def _resolve_encoding(self, filter_names: list) -> dict:
+        profile = self.avatar_encoding
+        encoding = {key: value for key, value in profile.items() if key != "effects"}
+        encoding.update(profile.get("effects", {}).get(filter_names[-1], {}))
+        return encoding
+
+    # --- Record encode time vs. bytes produced for an effect ---
+    def _record_output(self, filter_name: str, encode_ms: float, size_bytes: int):
+        stats = self.avatar_output_stats.setdefault(filter_name, {"renders": 0, "encode_ms": 0.0, "bytes": 0})
+        stats["renders"] += 1
+        stats["encode_ms"] += encode_ms
+        stats["bytes"] += size_bytes
+
+    # --- Cache lookup, download and render for one avatar effect chain ---
+    async def _render_avatar(self, avatar: nextcord.Asset, filter_names: list, size: int, cache_key: str, encoding: dict, animation: dict = None) -> bytes:
+        # --- Serve repeats from the render cache (skips download and Pillow) ---
+        rendered = await self.render_cache.get(cache_key)
+        if rendered is not None:
+            self.logger.debug("Avatar render cache hit for %s (%s)", cache_key, self.render_cache.stats())
+            return rendered
+
+        # --- Downlaod the image through the bot's pooled session ---
+        image_data = await self.bot.http_pool.fetch_bytes(avatar.url)
+        self.logger.debug("Avatar downloaded (%d bytes, http pool: %s)", len(image_data), self.bot.http_pool.stats())
+
+        # --- Decode once, run the chain and encode once in a render worker ---
+        if self.render_executor.in_flight >= self.render_executor.max_workers:
+            self.logger.debug("Avatar render queued behind %d job(s)", self.render_executor.queue_depth + 1)
+
+        start = time.perf_counter()
+        if animation is not None:
+            rendered, encode_ms = await self.render_executor.run(render_animated_effects, image_data, filter_names, size, animation, encoding)
+
+        else:
+            rendered, encode_ms = await self.render_executor.run(render_effects, image_data, filter_names, size, encoding)
+
+        render_ms = (time.perf_counter() - start) * 1000
+
+        chain_name = "+".join(filter_names) + ("+animated" if animation is not None else "")
+        self._record_output(chain_name, encode_ms, len(rendered))
+        self.logger.debug(
+            "Avatar '%s' rendered in %.1f ms, encoded in %.1f ms (%d bytes in, %d bytes out)", chain_name, render_ms, encode_ms, len(image_data), len(rendered)
+        )
 
-        # Save to BytesIO
-        output = io.BytesIO()
-        img.save(output, format = 'PNG')
-        output.seek(0)
+        await self.render_cache.put(cache_key, rendered)
 
-        return output
+        return rendered
 
     # (1) Mock Command
     @slash_command(
@@ -754,32 +794,35 @@ class FunCommands(commands.Cog):
         interaction: Interaction
     ):
         try:
-            # --- Supported extensions ---
-            valid_extensions = {".png", ".jpg", ".jpeg", ".gif", ".webp"}
-
-            # --- Find head and tail images in the directory ---
-            head_files = [f for f in COIN_FLIP_PATH.iterdir() if f.stem.lower() == "head" and f.suffix.lower() in valid_extensions]
-            tail_files = [f for f in COIN_FLIP_PATH.iterdir() if f.stem.lower() == "tail" and f.suffix.lower() in valid_extensions]
+            # --- Find head and tail images in the asset store ---
+            head_file = self.bot.assets.find("coinflip", "head")
+            tail_file = self.bot.assets.find("coinflip", "tail")
 
             # --- Check if bot images exists ---
-            if not head_files or not tail_files:
+            if head_file is None or tail_file is None:
                 self.logger.error(f"Missing coin images in {COIN_FLIP_PATH}. Need both 'head' and 'tail' with valid extensions.")
                 raise FileNotFoundError
             
             # --- Randomly select side ---
             result_side = random.choice(["Heads", "Tails"])
-            chosen_file = head_files[0] if result_side == "Heads" else tail_files[0]
-
-            # --- Create file  ---
-            file = nextcord.File(chosen_file, filename = f"coin_{result_side.lower()}{chosen_file.suffix}")
+            chosen_file = head_file if result_side == "Heads" else tail_file
 
             # --- Building embed ---
             embed = Embed(
                 title = f"{result_side}",
                 color = Color.magenta()
             )
-            embed.set_image(url = f"attachment://{file.filename}")
-            await interaction.response.send_message(embed = embed, file = file)
+
+            # --- Reuse the already uploaded image when the attachment cache is on ---
+            image_url = await self.bot.attachments.url_for("coinflip", chosen_file)
+            if image_url:
+                embed.set_image(url = image_url)
+                await interaction.response.send_message(embed = embed)
+
+            else:
+                file = chosen_file.to_file(f"coin_{result_side.lower()}{chosen_file.suffix}")
+                embed.set_image(url = f"attachment://{file.filename}")
+                await interaction.response.send_message(embed = embed, file = file)
 
         except Exception as e:
             # --- Error Handling ---
@@ -810,30 +853,40 @@ class FunCommands(commands.Cog):
             name = "effect",
             description = "Apply a filter to the avatar",
             required = False,
-            choices = {
-                "Blur": "blur",
-                "Contour": "contour",
-                "Detail": "detail",
-                "Edge Enhance": "edge_enhance",
-                "Edge Enhance More": "edge_enhance_more",
-                "Emboss": "emboss",
-                "Find Edges": "find_edges",
-                "Sharpen": "sharpen",
-                "Smooth": "smooth",
-                "Smooth More": "smooth_more",
-                "Grayscale": "grayscale",
-                "Sepia": "sepia",
-                "Invert": "invert",
-                "Brighten": "brighten",
-                "Darken": "darken",
-                "High Contrast": "high_contrast",
-                "Low Contrast": "low_contrast",
-                "Saturate": "saturate",
-                "Desaturate": "desaturate",
-                "Pro Enhance": "pro_enhance"
-            }
+            choices = AVATAR_EFFECTS
+        ),
+        effect2: str = SlashOption(
+            name = "effect2",
+            description = "Second filter, applied after the first",
+            required = False,
+            choices = AVATAR_EFFECTS
+        ),
+        effect3: str = SlashOption(
+            name = "effect3",
+            description = "Third filter, applied after the second",
+            required = False,
+            choices = AVATAR_EFFECTS
         )
     ):
+        # --- Collect the effect chain in the order given ---
+        effects = [name for name in (effect, effect2, effect3) if name]
+
+        # --- Admission control: turn requests away right away when the render queue is full ---
+        #     (cache hits and requests joining an identical render already running need no worker, so they skip the queue)
+        ticket = None
+        job = self._avatar_job(user.display_avatar, effects) if effects else None
+        if job is not None and self._needs_worker(job[0]):
+            ticket = self.render_queue.try_enter()
+            if ticket is None:
+                embed = Embed(
+                    title = "Busy",
+                    description = "Too many avatars are being rendered right now. Please try again in a moment.",
+                    color = Color.orange()
+                )
+                await interaction.response.send_message(embed = embed, ephemeral = True)
+                self.logger.warning(f"Avatar render rejected: queue full ({self.render_queue.stats()})")
+                return
+
         try:
             # --- Defer response as image processing might take time ---
             await interaction.response.defer()
@@ -842,7 +895,7 @@ class FunCommands(commands.Cog):
             avatar_url = user.display_avatar.url
 
             # --- If no filter, just show the avatar ---
-            if not effect:
+            if not effects:
                 embed = Embed(
                     title = f"{user.display_name}'s Avatar",
                     color = Color.magenta()
@@ -851,20 +904,50 @@ class FunCommands(commands.Cog):
                 await interaction.followup.send(embed = embed)
 
             else:
-                # --- Apply filter to the avatar ---
-                filtered_image = await self._apply_filter(avatar_url, effect)
+                # --- Waiting for a slot: show the queue position and keep it current ---
+                notice = None
+                tracker = None
+                if ticket is not None and ticket.position:
+                    notice = await interaction.followup.send(embed = self._queue_embed(ticket.position), wait = True)
+                    tracker = asyncio.create_task(self._track_queue_position(ticket, notice))
 
-                # --- Create file from BytesIO ---
-                file = nextcord.File(filtered_image, filename = f"avatar_{effect}.png")
+                # --- Served from memory or shared with a running render: no slot was taken ---
+                if ticket is None:
+                    filtered_image = await self._apply_filter(*job)
+
+                else:
+                    try:
+                        async with ticket:
+                            if tracker is not None:
+                                tracker.cancel()
+
+                            # --- Apply the filters to the avatar (one download, one decode, one upload) ---
+                            filtered_image = await self._apply_filter(*job)
+
+                    finally:
+                        ticket = None
+                        if tracker is not None:
+                            tracker.cancel()
+
+                # --- Create file from BytesIO (extension follows the encoder's output format) ---
+                filename = f"avatar_{'-'.join(effects)}.{sniff_extension(filtered_image.getvalue())}"
+                file = nextcord.File(filtered_image, filename = filename)
 
                 # --- Building embed ---
+                label = "Filters" if len(effects) > 1 else "Filter"
                 embed = Embed(
                     title = f"{user.display_name}'s Avatar",
-                    description = f"Filter: **{effect.replace('_', ' ').title()}**",
+                    description = f"{label}: **{' → '.join(name.replace('_', ' ').title() for name in effects)}**",
                     color = Color.magenta()
                 )
-                embed.set_image(url = f"attachment://avatar_{effect}.png")
-                await interaction.followup.send(embed = embed, file = file)
+                embed.set_image(url = f"attachment://{filename}")
+
+                # --- Replace the queue message with the result when there is one ---
+                if notice is not None:
+                    await notice.edit(embed = embed, file = file)
+
+                else:
+                    await interaction.followup.send(embed = embed, file = file)
 
         except Exception as e:
             # --- Error Handling ---
@@ -878,6 +961,11 @@ class FunCommands(commands.Cog):
             self.logger.error(f"Error in avatar command: {e}")
             self.logger.error(sub_divider)
 
+        finally:
+            # --- Free the queue place if the request failed before its render ran ---
+            if ticket is not None:
+                ticket.discard()
+
 # SETUP FUNCTION -----------------------------------------------------------------------------------------------------------------------------------|
 def setup(bot: commands.Bot):
     bot.add_cog(FunCommands(bot))
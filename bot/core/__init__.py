@@ -1,7 +1,32 @@
-from .logger import get_logger
+from .config import ConfigFile, ConfigSnapshot, PermissionIndex, get_config, get_config_files, config_load_stats, thaw, snowflake
+from .logger import get_logger, shutdown_logger, logger_stats
+from .log_context import log_context, bind_log_context, reset_log_context, no_dedup
+from .config_watcher import ConfigWatcher
+from .http_pool import HttpPool
+from .assets import AssetStore, StoredAsset
+from .attachments import AttachmentCache
 from .client import BotClient
 
 __all__ = [
+    'ConfigFile',
+    'ConfigSnapshot',
+    'PermissionIndex',
+    'get_config',
+    'get_config_files',
+    'config_load_stats',
+    'thaw',
+    'snowflake',
+    'ConfigWatcher',
     'get_logger',
-    'BotClient'
+    'shutdown_logger',
+    'logger_stats',
+    'log_context',
+    'bind_log_context',
+    'reset_log_context',
+    'no_dedup',
+    'BotClient',
+    'HttpPool',
+    'AssetStore',
+    'StoredAsset',
+    'AttachmentCache'
 ]
@@ -0,0 +1,181 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import io
+import random
+import hashlib
+import asyncio
+import nextcord
+from pathlib import Path
+from functools import cached_property
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .logger import get_logger
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+IMAGE_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp"})    # Default file types indexed by the store
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) One resident file
+@dataclass(frozen = True)
+class StoredAsset:
+    name: str
+    data: bytes = field(repr = False)
+    mtime_ns: int
+    source_size: int = 0
+
+    @property
+    def stem(self) -> str:
+        return Path(self.name).stem
+
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix
+
+    # --- Content hash, computed once per loaded version of the file ---
+    @cached_property
+    def digest(self) -> str:
+        return hashlib.sha256(self.data).hexdigest()
+
+    # --- Fresh upload object over the resident bytes (a File is consumed by each send) ---
+    def to_file(self, filename: Optional[str] = None) -> nextcord.File:
+        return nextcord.File(io.BytesIO(self.data), filename = filename or self.name)
+
+# (2) Directories of images loaded once, kept in memory and refreshed off the hot path
+class AssetStore:
+    def __init__(self, refresh_seconds: float = 30.0):
+        self.refresh_seconds = refresh_seconds
+        self.logger = get_logger()
+
+        self._dirs: Dict[str, Path] = {}
+        self._extensions: Dict[str, frozenset] = {}
+        self._transforms: Dict[str, Optional[Callable[[str, bytes], Tuple[str, bytes]]]] = {}
+        self._assets: Dict[str, Dict[str, StoredAsset]] = {}
+        self._lists: Dict[str, List[StoredAsset]] = {}
+        self._watcher: Optional[asyncio.Task] = None
+
+        # --- Counters ---
+        self._served = 0
+        self._reloads = 0
+
+    # --- Index a directory and load its files (startup; safe to call again for the same name) ---
+    # --- transform(name, data) -> (name, data) runs whenever a file is (re)loaded, e.g. to keep an optimized variant ---
+    def register(
+        self,
+        group: str,
+        directory: Path,
+        extensions: Iterable[str] = IMAGE_EXTENSIONS,
+        transform: Optional[Callable[[str, bytes], Tuple[str, bytes]]] = None
+    ):
+        self._dirs[group] = directory
+        self._extensions[group] = frozenset(ext.lower() for ext in extensions)
+        self._transforms[group] = transform
+        self._assets.setdefault(group, {})
+        self._scan(group)
+
+    # --- Hot path: memory only (get() takes the file name on disk) ---
+    def get(self, group: str, name: str) -> Optional[StoredAsset]:
+        asset = self._assets.get(group, {}).get(name)
+        if asset is not None:
+            self._served += 1
+
+        return asset
+
+    def find(self, group: str, stem: str) -> Optional[StoredAsset]:
+        for asset in self._lists.get(group, ()):
+            if asset.stem.lower() == stem.lower():
+                self._served += 1
+                return asset
+
+        return None
+
+    def choice(self, group: str) -> Optional[StoredAsset]:
+        assets = self._lists.get(group)
+        if not assets:
+            return None
+
+        self._served += 1
+        return random.choice(assets)
+
+    def all(self, group: str) -> List[StoredAsset]:
+        return list(self._lists.get(group, ()))
+
+    def groups(self) -> List[str]:
+        return list(self._dirs)
+
+    # --- Re-read files whose mtime or size changed; drop deleted ones (runs in a worker thread) ---
+    def _scan(self, group: str):
+        directory = self._dirs[group]
+        transform = self._transforms.get(group)
+        current = self._assets[group]
+        seen = {}
+
+        if directory.is_dir():
+            for path in directory.iterdir():
+                if path.suffix.lower() not in self._extensions[group]:
+                    continue
+
+                try:
+                    stat = path.stat()
+                    if not path.is_file():
+                        continue
+
+                    old = current.get(path.name)
+                    if old is not None and old.mtime_ns == stat.st_mtime_ns and old.source_size == stat.st_size:
+                        seen[path.name] = old
+                        continue
+
+                    name, data = path.name, path.read_bytes()
+                    if transform is not None:
+                        try:
+                            name, data = transform(name, data)
+
+                        except Exception as e:
+                            self.logger.warning(f"Could not transform asset {path}, serving the original: {e}")
+
+                    seen[path.name] = StoredAsset(name, data, stat.st_mtime_ns, stat.st_size)
+                    if old is not None:
+                        self._reloads += 1
+                        self.logger.info(f"Asset reloaded: {group}/{path.name}")
+
+                except OSError as e:
+                    self.logger.warning(f"Could not load asset {path}: {e}")
+
+        # --- Swap in whole new mappings so readers never see a half-updated group ---
+        self._assets[group] = seen
+        self._lists[group] = sorted(seen.values(), key = lambda asset: asset.name)
+
+    def refresh(self):
+        for group in list(self._dirs):
+            self._scan(group)
+
+    # --- Background mtime polling; started once the event loop is running ---
+    def start_watching(self):
+        if self.refresh_seconds <= 0 or (self._watcher is not None and not self._watcher.done()):
+            return
+
+        self._watcher = asyncio.create_task(self._watch())
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self.refresh_seconds)
+            try:
+                await asyncio.to_thread(self.refresh)
+
+            except Exception as e:
+                self.logger.error(f"Asset refresh failed: {e}")
+
+    def stop_watching(self):
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher = None
+
+    # --- Snapshot of store counters ---
+    def stats(self) -> dict:
+        return {
+            "groups": len(self._dirs),
+            "files": sum(len(assets) for assets in self._assets.values()),
+            "bytes": sum(len(asset.data) for assets in self._assets.values() for asset in assets.values()),
+            "served": self._served,
+            "reloads": self._reloads,
+        }
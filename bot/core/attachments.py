@@ -0,0 +1,155 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import os
+import json
+import time
+import asyncio
+import nextcord
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .logger import get_logger
+from .assets import StoredAsset
+from .config import AttachmentCacheSection
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Project root (index paths in bot.yaml are relative to it)
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Expiry of a signed Discord CDN URL (the hex "ex" query parameter), 0 when it never expires
+def cdn_url_expiry(url: str) -> int:
+    value = parse_qs(urlparse(url).query).get("ex")
+    if not value:
+        return 0
+
+    try:
+        return int(value[0], 16)
+
+    except ValueError:
+        return 0
+
+# (2) Uploads each static image once to an asset channel and reuses its CDN URL in embeds
+class AttachmentCache:
+    def __init__(
+        self,
+        bot: nextcord.Client,
+        enabled: bool = False,
+        channel_id: int = 0,
+        index_path: Optional[Path] = None,
+        refresh_margin: float = 3600.0
+    ):
+        self.bot = bot
+        self.enabled = enabled and bool(channel_id)
+        self.channel_id = channel_id
+        self.index_path = index_path
+        self.refresh_margin = refresh_margin
+        self.logger = get_logger()
+
+        # --- "group/name" -> {"digest", "url", "expires", "size"} ---
+        self._index: Dict[str, dict] = self._load_index() if self.enabled else {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+        # --- Counters ---
+        self._hits = 0
+        self._uploads = 0
+        self._bytes_saved = 0
+        self._bytes_uploaded = 0
+
+    # --- Build from the 'attachment_cache' section of bot.yaml ---
+    @classmethod
+    def from_config(cls, bot: nextcord.Client, cfg: AttachmentCacheSection) -> "AttachmentCache":
+        return cls(
+            bot,
+            enabled = cfg.enabled,
+            channel_id = int(cfg.channel_id or 0),
+            index_path = ROOT_DIR / cfg.index_file,
+            refresh_margin = cfg.refresh_margin_seconds
+        )
+
+    # --- CDN URL for an asset, uploading it first if needed; None means "attach the file as usual" ---
+    async def url_for(self, group: str, asset: StoredAsset) -> Optional[str]:
+        if not self.enabled:
+            return None
+
+        key = f"{group}/{asset.name}"
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            entry = self._index.get(key)
+            if entry is not None and self._is_fresh(entry, asset):
+                self._hits += 1
+                self._bytes_saved += entry["size"]
+                return entry["url"]
+
+            return await self._upload(key, asset)
+
+    # --- Upload every asset of the given groups ahead of time (on ready) ---
+    async def warm(self, groups: Dict[str, list]):
+        if not self.enabled:
+            return
+
+        for group, assets in groups.items():
+            for asset in assets:
+                await self.url_for(group, asset)
+
+    # --- A cached URL is stale when the file changed or its signature is about to expire ---
+    def _is_fresh(self, entry: dict, asset: StoredAsset) -> bool:
+        if entry.get("digest") != asset.digest:
+            return False
+
+        expires = entry.get("expires", 0)
+        return not expires or expires - self.refresh_margin > time.time()
+
+    async def _upload(self, key: str, asset: StoredAsset) -> Optional[str]:
+        try:
+            channel = self.bot.get_channel(self.channel_id) or await self.bot.fetch_channel(self.channel_id)
+            message = await channel.send(file = asset.to_file())
+            url = message.attachments[0].url
+
+        except (nextcord.HTTPException, IndexError, AttributeError) as e:
+            self.logger.warning(f"Attachment cache upload failed for '{key}': {e}")
+            return None
+
+        self._index[key] = {
+            "digest": asset.digest,
+            "url": url,
+            "expires": cdn_url_expiry(url),
+            "size": len(asset.data),
+        }
+        self._uploads += 1
+        self._bytes_uploaded += len(asset.data)
+        self.logger.info(f"Attachment cache uploaded '{key}' ({len(asset.data)} bytes)")
+
+        await asyncio.to_thread(self._save_index, dict(self._index))
+        return url
+
+    # --- Index persistence (URLs survive restarts) ---
+    def _load_index(self) -> Dict[str, dict]:
+        try:
+            with self.index_path.open("r", encoding = "utf-8") as f:
+                return json.load(f)
+
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_index(self, index: Dict[str, dict]):
+        self.index_path.parent.mkdir(parents = True, exist_ok = True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+
+        with tmp_path.open("w", encoding = "utf-8") as f:
+            json.dump(index, f, indent = 2)
+
+        os.replace(tmp_path, self.index_path)
+
+    # --- Snapshot of cache counters ---
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._index),
+            "hits": self._hits,
+            "uploads": self._uploads,
+            "bytes_saved": self._bytes_saved,
+            "bytes_uploaded": self._bytes_uploaded,
+        }
@@ -1,6 +1,6 @@
 # LIBRARIES -----------------------------------------------------------------------------------------------------------------------------------------|
 import sys
-import yaml
+import time
 import nextcord
 import traceback
 from pathlib import Path
@@ -8,13 +8,18 @@ from datetime import datetime
 from nextcord.ext import commands
 
 # LOCAL IMPORTS -------------------------------------------------------------------------------------------------------------------------------------|
-from .logger import get_logger
+from .logger import get_logger, shutdown_logger, logger_stats
+from .log_context import bind_log_context, reset_log_context, STARTED_KEY
+from .config import get_config
+from .config_watcher import ConfigWatcher
+from .http_pool import HttpPool
+from .assets import AssetStore
+from .attachments import AttachmentCache
 from events import OnReadyEvent, OnMemberJoinEvent
 
 # PATHS -------------------------------------------------------------------------------------------------------------------------------------------|
-# (1) Config Files Path
+# (1) Project Root
 CONFIG_DIR = Path(__file__).resolve().parent.parent.parent
-CONFIG_PATH = CONFIG_DIR / "config" / "bot.yaml"
 
 # (2) Command Files Path
 COMMANDS_DIR = Path(__file__).resolve().parent.parent
@@ -22,35 +27,75 @@ COMMANDS_PATH = COMMANDS_DIR / "commands"
 
 # MAIN ----------------------------------------------------------------------------------------------------------------------------------------------|
 class BotClient(commands.Bot):
-    def __init__(self):
+    def __init__(self, config_validator = None):
         self.logger = get_logger()
-        self.config = self._load_config()
         self.start_time = datetime.now()
+        self.config_watcher = ConfigWatcher(
+            validate = config_validator,
+            enabled = self.config.config_watch.enabled,
+            poll_seconds = self.config.config_watch.poll_seconds,
+            debounce_ms = self.config.config_watch.debounce_ms
+        )
+        self.http_pool = HttpPool.from_config(self.config.http)
+        self.assets = AssetStore(refresh_seconds = self.config.assets.refresh_seconds)
+        self.attachments = AttachmentCache.from_config(self, self.config.attachment_cache)
 
         intents = self._build_intents()
 
         super().__init__(
             command_prefix = "/",
             intents = intents,
-            owner_ids = set(map(int, self.config["bot"]["owner_ids"]))
+            owner_ids = set(map(int, self.config.bot.owner_ids))
         )
+        self.application_command_before_invoke(self._bind_command_context)
+        self.application_command_after_invoke(self._clear_command_context)
         self.add_listener(OnReadyEvent(self).handle, "on_ready")
-        self.add_listener(OnMemberJoinEvent(self).handle, "on_member_join")
+        self.member_join_event = OnMemberJoinEvent(self)
+        self.add_listener(self.member_join_event.handle, "on_member_join")
         self._load_cogs()
 
-    # --- Load Bot Config ---
-    def _load_config(self) -> dict:
-        try:
-            with CONFIG_PATH.open("r", encoding = "utf-8") as f:
-                return yaml.safe_load(f)
-            
-        except FileNotFoundError:
-            self.logger.critical(f"Bot config not found: {CONFIG_PATH}")
-            raise RuntimeError("Missing bot.yaml")
+    # --- Current bot.yaml settings (swapped in place when the file is edited) ---
+    @property
+    def config(self):
+        return get_config().bot
+
+    # --- Log context for slash commands (hooks run in the command's own task, so the fields cover everything it logs) ---
+    async def _bind_command_context(self, interaction: nextcord.Interaction):
+        command = interaction.application_command
+        bind_log_context(**{
+            "command": command.qualified_name if command is not None else None,
+            "guild_id": interaction.guild_id,
+            "user_id": interaction.user.id if interaction.user is not None else None,
+            STARTED_KEY: time.time(),
+        })
+
+    async def _clear_command_context(self, interaction: nextcord.Interaction):
+        command = interaction.application_command
+        self.logger.debug("Command /%s finished", command.qualified_name if command is not None else "?")
+        reset_log_context()
+
+    # --- Shutdown: close pooled outbound HTTP connections before the gateway ---
+    async def close(self):
+        self.config_watcher.stop()
+        self.assets.stop_watching()
+        self.member_join_event.close()
+
+        # --- Cogs are not unloaded on shutdown by default; removing them runs cog_unload (render workers, final stats) ---
+        for name in list(self.cogs):
+            self.remove_cog(name)
+
+        self.logger.info(f"Config watcher stats: {self.config_watcher.stats()}")
+        self.logger.info(f"Asset store stats: {self.assets.stats()}")
+        self.logger.info(f"Attachment cache stats: {self.attachments.stats()}")
+        self.logger.info(f"HTTP pool stats: {self.http_pool.stats()}")
+        await self.http_pool.close()
+        await super().close()
+        self.logger.info(f"Logging queue stats: {logger_stats()}")
+        shutdown_logger()
 
     # --- Discord Intents ---
     def _build_intents(self) -> nextcord.Intents:
-        cfg = self.config["intents"]
+        cfg = self.config.intents
         intents = nextcord.Intents.none()
 
         for name, enabled in cfg.items():
@@ -92,10 +137,10 @@ class BotClient(commands.Bot):
     
     # --- Bot Activity ---
     def build_activity(self):
-        bot_cfg = self.config["bot"]
+        bot_cfg = self.config.bot
 
-        activity_type = bot_cfg["activity_type"].lower()
-        name = bot_cfg["activity_name"]
+        activity_type = bot_cfg.activity_type.lower()
+        name = bot_cfg.activity_name
 
         if activity_type == "playing":
             return nextcord.Game(name=name)
@@ -121,12 +166,12 @@ class BotClient(commands.Bot):
         if activity_type == "streaming":
             return nextcord.Streaming(
                 name = name,
-                url = bot_cfg["streaming_url"]
+                url = bot_cfg.streaming_url
             )
 
         return None
     
     # --- Bot Status ---
     def build_status(self):
-        status = self.config["bot"]["status"].lower()
+        status = self.config.bot.status.lower()
         return getattr(nextcord.Status, status, nextcord.Status.online)
@@ -0,0 +1,412 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import json
+import time
+import yaml
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple, get_type_hints
+from dataclasses import dataclass, field, fields, is_dataclass
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+CONFIG_DIR = Path(__file__).resolve().parent.parent.parent / "config"
+
+# (1) Every configuration file, parsed once per load
+CONFIG_FILES = {
+    "bot.yaml": CONFIG_DIR / "bot.yaml",
+    "logger.yaml": CONFIG_DIR / "logger.yaml",
+    "permissions.yaml": CONFIG_DIR / "permissions.yaml",
+    "fun.json": CONFIG_DIR / "commands" / "fun.json",
+    "help.json": CONFIG_DIR / "commands" / "help.json",
+}
+
+# HELPERS ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Read-only default for a mapping field
+def _mapping(value: Optional[dict] = None):
+    return field(default_factory = lambda: MappingProxyType(dict(value or {})))
+
+# (2) Deep-freeze parsed data: dicts become read-only mappings, lists become tuples
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+# (3) Plain (picklable, mutable) copy of a section or frozen mapping, e.g. to hand to a render worker
+def thaw(value: Any) -> Any:
+    if is_dataclass(value):
+        return {f.name: thaw(getattr(value, f.name)) for f in fields(value)}
+
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+
+    return value
+
+# (4) Build a section from parsed data; missing or null keys keep their defaults
+def _build(cls, data: Any):
+    data = data if isinstance(data, dict) else {}
+    hints = get_type_hints(cls)
+    values = {}
+
+    for f in fields(cls):
+        key = f.metadata.get("key", f.name)
+        if data.get(key) is None:
+            continue
+
+        hint = hints[f.name]
+        values[f.name] = _build(hint, data[key]) if is_dataclass(hint) else _freeze(data[key])
+
+    return cls(**values)
+
+# BOT.YAML -----------------------------------------------------------------------------------------------------------------------------------------|
+@dataclass(frozen = True, slots = True)
+class BotSection:
+    status: str = "online"
+    activity_type: str = "playing"
+    activity_name: str = ""
+    streaming_url: str = ""
+    owner_ids: Tuple[Any, ...] = ()
+    client_id: str = ""
+
+@dataclass(frozen = True, slots = True)
+class FeaturesSection:
+    welcome_messages: bool = False
+
+@dataclass(frozen = True, slots = True)
+class WelcomeCardSection:
+    enabled: bool = False
+    avatar_size: int = 128
+    budget_ms: int = 1500
+    max_workers: int = 1
+    font: str = ""
+    avatar_ratio: float = 0.5
+    font_ratio: float = 0.11
+    encoding: Mapping[str, Any] = _mapping({"format": "webp", "quality": 85})
+
+@dataclass(frozen = True, slots = True)
+class WelcomeBurstSection:
+    window_seconds: float = 10.0
+    threshold: int = 5
+    max_batch: int = 20
+
+@dataclass(frozen = True, slots = True)
+class RoleRetrySection:
+    max_attempts: int = 5
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+
+@dataclass(frozen = True, slots = True)
+class WelcomeSection:
+    optimize: bool = True
+    width: int = 400
+    encoding: Mapping[str, Any] = _mapping({"format": "webp", "quality": 85})
+    cache_dir: str = "cache/welcome"
+    card: WelcomeCardSection = field(default_factory = WelcomeCardSection)
+    burst: WelcomeBurstSection = field(default_factory = WelcomeBurstSection)
+    role_retry: RoleRetrySection = field(default_factory = RoleRetrySection)
+
+@dataclass(frozen = True, slots = True)
+class AnimatedSection:
+    enabled: bool = True
+    format: str = "webp"
+    size: int = 256
+    max_frames: int = 120
+    max_duration_ms: int = 10000
+    decimate: int = 1
+    quality: int = 80
+
+@dataclass(frozen = True, slots = True)
+class RenderCacheSection:
+    memory_mb: float = 64
+    disk: bool = True
+    disk_dir: str = "cache/avatars"
+    disk_max_mb: float = 512
+
+@dataclass(frozen = True, slots = True)
+class RenderQueueSection:
+    slots: int = 2
+    max_queue: int = 10
+
+@dataclass(frozen = True, slots = True)
+class AvatarSection:
+    executor: str = "process"
+    max_workers: int = 2
+    source_format: str = "png"
+    sizes: Mapping[str, int] = _mapping()
+    encoding: Mapping[str, Any] = _mapping()
+    animated: AnimatedSection = field(default_factory = AnimatedSection)
+    cache: RenderCacheSection = field(default_factory = RenderCacheSection)
+    queue: RenderQueueSection = field(default_factory = RenderQueueSection)
+
+@dataclass(frozen = True, slots = True)
+class AssetsSection:
+    refresh_seconds: float = 30
+
+@dataclass(frozen = True, slots = True)
+class AttachmentCacheSection:
+    enabled: bool = False
+    channel_id: int = 0
+    index_file: str = "cache/attachments.json"
+    refresh_margin_seconds: float = 3600
+
+@dataclass(frozen = True, slots = True)
+class HttpSection:
+    limit: int = 20
+    limit_per_host: int = 8
+    connect_timeout: float = 5.0
+    read_timeout: float = 15.0
+    keepalive_timeout: float = 60.0
+
+@dataclass(frozen = True, slots = True)
+class ConfigWatchSection:
+    enabled: bool = True
+    poll_seconds: float = 5
+    debounce_ms: int = 500
+
+@dataclass(frozen = True, slots = True)
+class BotConfig:
+    bot: BotSection = field(default_factory = BotSection)
+    features: FeaturesSection = field(default_factory = FeaturesSection)
+    welcome: WelcomeSection = field(default_factory = WelcomeSection)
+    avatar: AvatarSection = field(default_factory = AvatarSection)
+    assets: AssetsSection = field(default_factory = AssetsSection)
+    attachment_cache: AttachmentCacheSection = field(default_factory = AttachmentCacheSection)
+    http: HttpSection = field(default_factory = HttpSection)
+    config_watch: ConfigWatchSection = field(default_factory = ConfigWatchSection)
+    intents: Mapping[str, bool] = _mapping()
+
+# LOGGER.YAML --------------------------------------------------------------------------------------------------------------------------------------|
+@dataclass(frozen = True, slots = True)
+class LoggerSection:
+    name: str = "bot"
+    log_dir: str = "logs"
+
+@dataclass(frozen = True, slots = True)
+class ConsoleSection:
+    enabled: bool = True
+    level: str = "INFO"
+    colors: Mapping[str, str] = _mapping()
+
+@dataclass(frozen = True, slots = True)
+class RotationSection:
+    max_bytes: int = 10485760
+    backup_count: int = 5
+    compress: bool = True
+    max_age_days: float = 14
+    max_total_mb: float = 100
+
+@dataclass(frozen = True, slots = True)
+class FileSection:
+    enabled: bool = True
+    level: str = "DEBUG"
+    rotation: RotationSection = field(default_factory = RotationSection)
+    date_format: str = "%d-%m-%Y %H:%M:%S"
+
+@dataclass(frozen = True, slots = True)
+class FormatSection:
+    style: str = "text"
+    console: str = "[%(asctime)s] | %(levelname)s | %(message)s"
+    file: str = "[%(asctime)s] | %(levelname)s | %(message)s"
+    date_format: str = "%d-%m-%Y %H:%M:%S"
+
+@dataclass(frozen = True, slots = True)
+class ErrorHandlingSection:
+    show_traceback_console: bool = False
+    show_traceback_file: bool = True
+
+@dataclass(frozen = True, slots = True)
+class SeparateFilesSection:
+    enabled: bool = False
+    error_file: str = "error.log"
+    warning_file: str = "warning.log"
+
+@dataclass(frozen = True, slots = True)
+class AdvancedSection:
+    encoding: str = "utf-8"
+    propagate: bool = False
+    separate_files: SeparateFilesSection = field(default_factory = SeparateFilesSection)
+
+@dataclass(frozen = True, slots = True)
+class QueueSection:
+    enabled: bool = True
+    max_size: int = 10000
+    overflow: str = "drop_oldest"
+    block_timeout_ms: int = 50
+    flush_interval_ms: int = 50
+
+@dataclass(frozen = True, slots = True)
+class SamplingSection:
+    levels: Mapping[str, float] = _mapping()
+    loggers: Mapping[str, float] = _mapping()
+
+@dataclass(frozen = True, slots = True)
+class DedupSection:
+    enabled: bool = True
+    min_level: str = "WARNING"
+    window_seconds: float = 60
+    max_keys: int = 1000
+    sampling: SamplingSection = field(default_factory = SamplingSection)
+
+@dataclass(frozen = True, slots = True)
+class LoggerConfig:
+    logger: LoggerSection = field(default_factory = LoggerSection)
+    console: ConsoleSection = field(default_factory = ConsoleSection)
+    file: FileSection = field(default_factory = FileSection)
+    format: FormatSection = field(default_factory = FormatSection)
+    error_handling: ErrorHandlingSection = field(default_factory = ErrorHandlingSection)
+    advanced: AdvancedSection = field(default_factory = AdvancedSection)
+    queue: QueueSection = field(default_factory = QueueSection)
+    dedup: DedupSection = field(default_factory = DedupSection)
+
+# PERMISSIONS.YAML ---------------------------------------------------------------------------------------------------------------------------------|
+@dataclass(frozen = True, slots = True)
+class RolesSection:
+    admin: Tuple[Any, ...] = field(default = (), metadata = {"key": "Admin"})
+    mods: Tuple[Any, ...] = field(default = (), metadata = {"key": "Mods"})
+    new_member: Tuple[Any, ...] = field(default = (), metadata = {"key": "New_Member"})
+
+@dataclass(frozen = True, slots = True)
+class PermissionsConfig:
+    roles: RolesSection = field(default_factory = RolesSection, metadata = {"key": "Roles"})
+    mod_logs: Any = None
+    welcome: Any = None
+
+# (1) Snowflake ID from a config value ("123", 123); None for placeholders and empty values
+def snowflake(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+
+    if isinstance(value, int):
+        return value if value > 0 else None
+
+    text = str(value).strip() if value is not None else ""
+    return int(text) if text.isdigit() and int(text) > 0 else None
+
+def _snowflakes(values: Iterable[Any]) -> FrozenSet[int]:
+    return frozenset(filter(None, map(snowflake, values)))
+
+# (2) Role and channel IDs normalized to ints once per snapshot, so permission checks are set lookups
+@dataclass(frozen = True, slots = True)
+class PermissionIndex:
+    admin: FrozenSet[int] = frozenset()
+    mods: FrozenSet[int] = frozenset()
+    staff: FrozenSet[int] = frozenset()
+    new_member: Tuple[int, ...] = ()
+    mod_logs: Optional[int] = None
+    welcome: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, permissions: PermissionsConfig) -> "PermissionIndex":
+        admin = _snowflakes(permissions.roles.admin)
+        mods = _snowflakes(permissions.roles.mods)
+
+        return cls(
+            admin = admin,
+            mods = mods,
+            staff = admin | mods,
+            new_member = tuple(dict.fromkeys(filter(None, map(snowflake, permissions.roles.new_member)))),
+            mod_logs = snowflake(permissions.mod_logs),
+            welcome = snowflake(permissions.welcome)
+        )
+
+# SNAPSHOT -----------------------------------------------------------------------------------------------------------------------------------------|
+@dataclass(frozen = True, slots = True)
+class ConfigSnapshot:
+    bot: BotConfig
+    logger: LoggerConfig
+    permissions: PermissionsConfig
+    permission_index: PermissionIndex
+    fun: Mapping[str, Any]
+    help: Mapping[str, Any]
+
+# (1) One parsed file: its data, or the error that stopped it from loading
+@dataclass(frozen = True, slots = True)
+class ConfigFile:
+    name: str
+    path: Path
+    data: Any = None
+    error: Optional[Exception] = None
+
+# LOADER -------------------------------------------------------------------------------------------------------------------------------------------|
+_files: Optional[Dict[str, ConfigFile]] = None
+_snapshot: Optional[ConfigSnapshot] = None
+_load_stats = {"parses": {}, "parse_ms": {}, "build_ms": 0.0}
+
+# (1) Parse one file (every parse is counted and timed)
+def _parse(name: str, path: Path) -> ConfigFile:
+    start = time.perf_counter()
+
+    try:
+        with path.open("r", encoding = "utf-8") as f:
+            data = json.load(f) if path.suffix == ".json" else yaml.safe_load(f)
+
+        result = ConfigFile(name, path, data)
+
+    except Exception as e:
+        result = ConfigFile(name, path, error = e)
+
+    _load_stats["parses"][name] = _load_stats["parses"].get(name, 0) + 1
+    _load_stats["parse_ms"][name] = _load_stats["parse_ms"].get(name, 0.0) + (time.perf_counter() - start) * 1000
+    return result
+
+# (2) Parse every configuration file
+def parse_config_files() -> Dict[str, ConfigFile]:
+    return {name: _parse(name, path) for name, path in CONFIG_FILES.items()}
+
+# (3) Typed, read-only snapshot from parsed files
+def build_snapshot(files: Dict[str, ConfigFile]) -> ConfigSnapshot:
+    start = time.perf_counter()
+
+    permissions = _build(PermissionsConfig, files["permissions.yaml"].data)
+
+    snapshot = ConfigSnapshot(
+        bot = _build(BotConfig, files["bot.yaml"].data),
+        logger = _build(LoggerConfig, files["logger.yaml"].data),
+        permissions = permissions,
+        permission_index = PermissionIndex.from_config(permissions),
+        fun = _freeze(files["fun.json"].data or {}),
+        help = _freeze(files["help.json"].data or {})
+    )
+
+    _load_stats["build_ms"] += (time.perf_counter() - start) * 1000
+    return snapshot
+
+# (4) Parsed files shared by the validator and the snapshot (parsed on first use)
+def get_config_files() -> Dict[str, ConfigFile]:
+    global _files
+    if _files is None:
+        _files = parse_config_files()
+
+    return _files
+
+# (5) The shared configuration snapshot
+def get_config() -> ConfigSnapshot:
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = build_snapshot(get_config_files())
+
+    return _snapshot
+
+# (6) Replace the shared snapshot with one built from a newer (already validated) parse; readers see old or new, never a mix
+def swap_config(files: Dict[str, ConfigFile]) -> ConfigSnapshot:
+    global _files, _snapshot
+    snapshot = build_snapshot(files)
+    _files, _snapshot = files, snapshot
+    return snapshot
+
+# (7) Files whose parsed content differs between two parses
+def changed_files(old: Dict[str, ConfigFile], new: Dict[str, ConfigFile]) -> list:
+    return [name for name in CONFIG_FILES if old[name].data != new[name].data or type(old[name].error) is not type(new[name].error)]
+
+# (8) How often each file was parsed and how long loading took
+def config_load_stats() -> dict:
+    return {
+        "parses": dict(_load_stats["parses"]),
+        "parse_ms": round(sum(_load_stats["parse_ms"].values()), 2),
+        "build_ms": round(_load_stats["build_ms"], 2),
+    }
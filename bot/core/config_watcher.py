@@ -0,0 +1,228 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import os
+import time
+import ctypes
+import struct
+import asyncio
+import ctypes.util
+from typing import Callable, Dict, Optional, Set
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .logger import get_logger
+from .log_context import no_dedup
+from .config import CONFIG_FILES, ConfigFile, parse_config_files, get_config_files, changed_files, swap_config
+
+# DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
+divider = f"=" * 70
+sub_divider = f"-" * 70
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+# (1) inotify(7) events that mean "a file in this directory now has new content" (editors often save by rename)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")    # wd, mask, cookie, name length
+
+# (2) Read once at startup (the logger's handlers, levels, format and dedup are built from it); edits are reported, not applied
+RESTART_FILES = ("logger.yaml",)
+
+# INOTIFY ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Minimal inotify binding over libc (Linux only); raises OSError where it is unavailable
+class Inotify:
+    def __init__(self, directories):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno = True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available on this platform")
+
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        for directory in directories:
+            if libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK) < 0:
+                errno = ctypes.get_errno()
+                os.close(self.fd)
+                raise OSError(errno, f"inotify_add_watch failed for {directory}")
+
+    # --- Names of the files touched since the last read (never blocks) ---
+    def read(self) -> Set[str]:
+        names = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+
+            except BlockingIOError:
+                return names
+
+            offset = 0
+            while offset < len(data):
+                _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                names.add(data[offset:offset + length].rstrip(b"\0").decode(errors = "replace"))
+                offset += length
+
+    def close(self):
+        os.close(self.fd)
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Picks up edited config files in the background: re-parses, revalidates, and swaps the shared snapshot in one step
+class ConfigWatcher:
+    def __init__(
+        self,
+        validate: Callable[[Dict[str, ConfigFile]], bool] = None,
+        enabled: bool = True,
+        poll_seconds: float = 5,
+        debounce_ms: int = 500
+    ):
+        self.validate = validate
+        self.enabled = enabled
+        self.poll_seconds = poll_seconds
+        self.debounce = debounce_ms / 1000
+        self.logger = get_logger()
+        self.mode = None
+
+        self._task: Optional[asyncio.Task] = None
+        self._inotify: Optional[Inotify] = None
+        self._changed = asyncio.Event()
+        self._names = {path.name for path in CONFIG_FILES.values()}
+        self._restart_seen = {}
+
+        # --- Counters ---
+        self._reloads = 0
+        self._rejected = 0
+        self._last_reload = None
+
+    # --- Start watching (inotify where available, polling otherwise) ---
+    def start(self):
+        if not self.enabled or (self._task is not None and not self._task.done()):
+            return
+
+        try:
+            self._inotify = Inotify({path.parent for path in CONFIG_FILES.values()})
+            asyncio.get_running_loop().add_reader(self._inotify.fd, self._on_inotify)
+            self._task = asyncio.create_task(self._watch_inotify())
+            self.mode = "inotify"
+
+        except (OSError, NotImplementedError) as e:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+
+            if self.poll_seconds <= 0:
+                self.logger.warning(f"Config watcher disabled: inotify unavailable ({e}) and poll_seconds is 0")
+                return
+
+            self._task = asyncio.create_task(self._watch_polling())
+            self.mode = "polling"
+
+        self.logger.info(f"Watching config files for changes ({self.mode})")
+
+    # --- Drain inotify right away so the (level-triggered) reader does not fire again ---
+    def _on_inotify(self):
+        if self._inotify.read() & self._names:
+            self._changed.set()
+
+    async def _watch_inotify(self):
+        while True:
+            await self._changed.wait()
+            await asyncio.sleep(self.debounce)    # --- Let a burst of writes (save, rename, chmod) settle ---
+            self._changed.clear()
+            await self.check()
+
+    async def _watch_polling(self):
+        signature = await asyncio.to_thread(self._signature)
+        while True:
+            await asyncio.sleep(self.poll_seconds)
+            current = await asyncio.to_thread(self._signature)
+            if current != signature:
+                signature = current
+                await self.check()
+
+    # --- (mtime, size) of every config file; a missing file counts as a change too ---
+    def _signature(self) -> tuple:
+        signature = []
+        for path in CONFIG_FILES.values():
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+
+            except OSError:
+                signature.append(None)
+
+        return tuple(signature)
+
+    # --- Re-parse and validate off the event loop; swap only when the whole new config is valid.
+    #     Every line is written (no dedup), so a second bad edit in a row still shows why it was rejected ---
+    async def check(self) -> bool:
+        with no_dedup():
+            return await self._check()
+
+    async def _check(self) -> bool:
+        try:
+            files = await asyncio.to_thread(parse_config_files)
+            current = get_config_files()
+            self._report_restart_files(current, files)
+
+            # --- Startup-only files keep their running version in the snapshot ---
+            files.update({name: current[name] for name in RESTART_FILES})
+            changed = changed_files(current, files)
+            if not changed:
+                return False
+
+            valid = self.validate is None or await asyncio.to_thread(self.validate, files)
+            if not valid:
+                self._rejected += 1
+                self.logger.error(sub_divider)
+                self.logger.error(f"Rejected config change to {', '.join(changed)}; keeping the last good configuration")
+                self.logger.error(sub_divider)
+                return False
+
+            swap_config(files)
+
+        except Exception as e:
+            self._rejected += 1
+            self.logger.error(f"Config reload failed, keeping the last good configuration: {e}")
+            return False
+
+        self._reloads += 1
+        self._last_reload = time.time()
+        self.logger.info(f"Config reloaded: {', '.join(changed)}")
+        return True
+
+    # --- Warn once per new version of a startup-only file ---
+    def _report_restart_files(self, current: Dict[str, ConfigFile], files: Dict[str, ConfigFile]):
+        for name in RESTART_FILES:
+            if files[name].data == current[name].data:
+                self._restart_seen.pop(name, None)
+                continue
+
+            if self._restart_seen.get(name) != files[name].data:
+                self._restart_seen[name] = files[name].data
+                self.logger.warning(f"{name} changed; logging settings are only read at startup, restart the bot to apply them")
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        if self._inotify is not None:
+            try:
+                asyncio.get_running_loop().remove_reader(self._inotify.fd)
+
+            except RuntimeError:
+                pass
+
+            self._inotify.close()
+            self._inotify = None
+
+    # --- Snapshot of watcher counters ---
+    def stats(self) -> dict:
+        return {
+            "mode": self.mode,
+            "reloads": self._reloads,
+            "rejected": self._rejected,
+            "last_reload": self._last_reload,
+        }
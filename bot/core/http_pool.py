@@ -0,0 +1,108 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import aiohttp
+from typing import Optional
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .config import HttpSection
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+class HttpPool:
+    def __init__(
+        self,
+        limit: int = 20,
+        limit_per_host: int = 8,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        keepalive_timeout: float = 60.0
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(
+            total = None,
+            connect = connect_timeout,
+            sock_read = read_timeout
+        )
+        self.keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # --- Counters ---
+        self._requests = 0
+        self._connections_created = 0
+        self._connections_reused = 0
+        self._failures = 0
+
+    # --- Build from the 'http' section of bot.yaml ---
+    @classmethod
+    def from_config(cls, cfg: HttpSection) -> "HttpPool":
+        return cls(
+            limit = cfg.limit,
+            limit_per_host = cfg.limit_per_host,
+            connect_timeout = cfg.connect_timeout,
+            read_timeout = cfg.read_timeout,
+            keepalive_timeout = cfg.keepalive_timeout
+        )
+
+    # --- Trace hooks used for connection-reuse stats ---
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_end(session, ctx, params):
+            self._requests += 1
+
+        async def on_connection_create_end(session, ctx, params):
+            self._connections_created += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._connections_reused += 1
+
+        trace.on_request_end.append(on_request_end)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        trace.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace
+
+    # --- Long-lived session, created lazily inside the running event loop ---
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit = self.limit,
+                limit_per_host = self.limit_per_host,
+                keepalive_timeout = self.keepalive_timeout,
+                ttl_dns_cache = 300
+            )
+            self._session = aiohttp.ClientSession(
+                connector = connector,
+                timeout = self.timeout,
+                trace_configs = [self._build_trace_config()]
+            )
+
+        return self._session
+
+    # --- Download a resource and return its body ---
+    async def fetch_bytes(self, url: str) -> bytes:
+        try:
+            async with self.session.get(url) as resp:
+                if resp.status != 200:
+                    raise RuntimeError(f"Failed to download {url} (HTTP {resp.status})")
+
+                return await resp.read()
+
+        except Exception:
+            self._failures += 1
+            raise
+
+    # --- Snapshot of pool counters ---
+    def stats(self) -> dict:
+        return {
+            "requests": self._requests,
+            "connections_created": self._connections_created,
+            "connections_reused": self._connections_reused,
+            "failures": self._failures,
+        }
+
+    # --- Close the session and every pooled connection ---
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
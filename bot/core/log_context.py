@@ -0,0 +1,72 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import sys
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import MappingProxyType
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+EMPTY_CONTEXT = MappingProxyType({})
+STARTED_KEY = "_started"                   # Wall-clock start of the command/event, turned into latency_ms when a record is formatted
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Fields for the command or event the current task is handling (each task gets its own copy, so concurrent joins never mix)
+_log_context: ContextVar = ContextVar("log_context", default = EMPTY_CONTEXT)
+
+def get_log_context() -> MappingProxyType:
+    return _log_context.get()
+
+# (2) Add fields for the rest of the current task (the mapping is replaced, never mutated, so records can keep a reference)
+def bind_log_context(**fields):
+    merged = dict(_log_context.get())
+    merged.update(fields)
+    return _log_context.set(MappingProxyType(merged))
+
+def reset_log_context(token = None):
+    if token is None:
+        _log_context.set(EMPTY_CONTEXT)
+
+    else:
+        _log_context.reset(token)
+
+# (3) Scoped fields: with log_context(guild_id = ..., user_id = ...): ...
+@contextmanager
+def log_context(timed: bool = False, **fields):
+    if timed:
+        fields[STARTED_KEY] = time.time()
+
+    token = bind_log_context(**fields)
+    try:
+        yield
+
+    finally:
+        _log_context.reset(token)
+
+# (4) Records logged inside `with no_dedup():` skip the repeated-message filter (results the user is waiting on, e.g. a config reload)
+_dedup_exempt: ContextVar = ContextVar("dedup_exempt", default = False)
+
+def dedup_exempt() -> bool:
+    return _dedup_exempt.get()
+
+@contextmanager
+def no_dedup():
+    token = _dedup_exempt.set(True)
+    try:
+        yield
+
+    finally:
+        _dedup_exempt.reset(token)
+
+# (5) Logger filter (runs in the calling thread): pins the current context to the record and notes the exception being handled.
+#     Nothing is serialized here; formatters read record.context only if the record is actually written.
+class ContextFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        if "context" not in record.__dict__:
+            record.context = _log_context.get()
+
+        if record.levelno >= logging.ERROR and not record.exc_info:
+            exc_type = sys.exc_info()[0]
+            record.exc_type = exc_type.__name__ if exc_type is not None else None
+
+        return True
@@ -2,149 +2,831 @@
 import os
 import re
 import sys
-import yaml
+import glob
+import gzip
+import json
+import time
+import queue
+import atexit
+import shutil
 import logging
-from pathlib import Path
+import threading
+from collections import OrderedDict
 from colorama import Fore, Style
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
-# PATHS ----------------------------------------------------------------------------------------------------------------------------------------|
-LOGGER_DIR = Path(__file__).resolve().parent.parent.parent
-CONFIG_PATH = LOGGER_DIR / "config" / "logger.yaml"
+# --- Optional fast JSON serializer for format.style: json (falls back to the standard library) ---
+try:
+    import orjson
+
+except ImportError:
+    orjson = None
+
+# LOCAL IMPORTS --------------------------------------------------------------------------------------------------------------------------------|
+from .config import LoggerConfig, get_config, get_config_files
+from .log_context import ContextFilter, EMPTY_CONTEXT, STARTED_KEY, dedup_exempt
 
 # MAIN -----------------------------------------------------------------------------------------------------------------------------------------|
-# (1) Custom formatter for console output.
-class ColoredFormatter(logging.Formatter):
-    def __init__(self, fmt: str, datefmt: str, colors: dict, show_traceback: bool):
+# (1) Read-only view of a record for the format string, with the level name swapped in (the record is never copied).
+class _RecordView:
+    __slots__ = ("fields", "levelname")
+
+    def __init__(self, fields: dict, levelname: str):
+        self.fields = fields
+        self.levelname = levelname
+
+    def __getitem__(self, key: str):
+        return self.levelname if key == "levelname" else self.fields[key]
+
+# (2) Shared formatter: cached level strings and timestamps, ANSI stripping only when an escape byte is present.
+class _BaseFormatter(logging.Formatter):
+    # --- Regex pattern to strip ANSI escape codes ---
+    ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+
+    def __init__(self, fmt: str, datefmt: str, show_traceback: bool, strip_ansi: bool):
         super().__init__(fmt = fmt, datefmt = datefmt)
-        self.colors = colors
         self.show_traceback = show_traceback
+        self.strip_ansi = strip_ansi
+        self._levelnames = {}
+        self._time_key = None
+        self._time_text = ""
+
+    # --- Level text as shown in the output (subclasses add colors or strip them) ---
+    def _levelname(self, levelname: str) -> str:
+        return levelname
+
+    def _strip(self, text: str) -> str:
+        return self.ANSI_ESCAPE_PATTERN.sub('', text) if self.strip_ansi and "\x1b" in text else text
+
+    # --- Timestamps only change once a second with the configured date format ---
+    def formatTime(self, record, datefmt = None):
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+
+        key = int(record.created)
+        if key != self._time_key:
+            self._time_text = super().formatTime(record, datefmt)
+            self._time_key = key
+
+        return self._time_text
 
     def format(self, record):
-        # --- Create a deep copy to avoid modifying the original record ---
-        record_copy = logging.makeLogRecord(record.__dict__.copy())
-        
-        # --- Apply color only to the copy ---
-        color = self.colors.get(record_copy.levelname.lower(), "")
-        record_copy.levelname = f"{color}{record_copy.levelname}{Style.RESET_ALL}"
+        record.message = self._strip(record.getMessage())
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+
+        levelname = self._levelnames.get(record.levelname)
+        if levelname is None:
+            levelname = self._levelnames[record.levelname] = self._levelname(record.levelname)
 
-        log_msg = super().format(record_copy)
+        log_msg = self._fmt % _RecordView(record.__dict__, levelname)
 
-        if record_copy.exc_info and self.show_traceback:
-            log_msg += f"\n{self.formatException(record_copy.exc_info)}"
+        if self.show_traceback:
+            if record.exc_info and not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+
+            if record.exc_text:
+                log_msg += f"\n{self._strip(record.exc_text)}"
+
+            if record.stack_info:
+                log_msg += f"\n{self._strip(self.formatStack(record.stack_info))}"
 
         return log_msg
 
-# (2) Custom formatter for file output (NO COLORS).
-class FileFormatter(logging.Formatter):
-    # --- Regex pattern to strip ANSI escape codes ---
-    ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
-    
+# (3) Custom formatter for console output.
+class ColoredFormatter(_BaseFormatter):
+    def __init__(self, fmt: str, datefmt: str, colors: dict, show_traceback: bool):
+        super().__init__(fmt, datefmt, show_traceback, strip_ansi = False)
+        self.colors = colors
+
+    def _levelname(self, levelname: str) -> str:
+        return f"{self.colors.get(levelname.lower(), '')}{levelname}{Style.RESET_ALL}"
+
+# (4) Custom formatter for file output (NO COLORS).
+class FileFormatter(_BaseFormatter):
     def __init__(self, fmt: str, datefmt: str, show_traceback: bool):
-        super().__init__(fmt = fmt, datefmt = datefmt)
+        super().__init__(fmt, datefmt, show_traceback, strip_ansi = True)
+
+    def _levelname(self, levelname: str) -> str:
+        return self._strip(levelname)
+
+# (5) JSON formatter for file output: one object per line with context fields, built only when the record is written.
+class JsonFormatter(logging.Formatter):
+    ANSI_ESCAPE_PATTERN = re.compile(r'\x1b\[[0-9;]*m')
+
+    # --- Attributes every LogRecord has (anything else was passed through extra = {...}) ---
+    RESERVED = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime", "context", "exc_type", "taskName", "_dedup"}
+
+    def __init__(self, show_traceback: bool):
+        super().__init__()
         self.show_traceback = show_traceback
+        self._time_key = None
+        self._time_text = ""
+
+    # --- ISO 8601 UTC with milliseconds; the seconds part is cached like the text formatters do ---
+    def _timestamp(self, record) -> str:
+        key = int(record.created)
+        if key != self._time_key:
+            self._time_text = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(key))
+            self._time_key = key
+
+        return f"{self._time_text}.{int(record.msecs):03d}Z"
+
+    def _strip(self, text: str) -> str:
+        return self.ANSI_ESCAPE_PATTERN.sub('', text) if "\x1b" in text else text
 
     def format(self, record):
-        # --- Create a copy to avoid modifying the original record ---
-        record_copy = logging.makeLogRecord(record.__dict__.copy())
-        
-        # --- Strip any ANSI codes from the message itself ---
-        if hasattr(record_copy, 'msg') and isinstance(record_copy.msg, str):
-            record_copy.msg = self._strip_ansi_codes(record_copy.msg)
-        
-        # --- Ensure levelname has no color codes ---
-        if hasattr(record_copy, 'levelname'):
-            record_copy.levelname = self._strip_ansi_codes(str(record_copy.levelname))
-        
-        # --- Format the log message ---
-        log_msg = super().format(record_copy)
-        
-        # --- Strip any remaining ANSI codes from the final output ---
-        log_msg = self._strip_ansi_codes(log_msg)
-
-        if record_copy.exc_info and self.show_traceback:
-            exception_text = self.formatException(record_copy.exc_info)
-            exception_text = self._strip_ansi_codes(exception_text)
-            log_msg += f"\n{exception_text}"
+        payload = {
+            "ts": self._timestamp(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": self._strip(record.getMessage()),
+        }
 
-        return log_msg
-    
-    def _strip_ansi_codes(self, text: str) -> str:
-        """Remove all ANSI escape codes from text."""
-        return self.ANSI_ESCAPE_PATTERN.sub('', text)
+        context = getattr(record, "context", None)
+        if context:
+            for key, value in context.items():
+                if key == STARTED_KEY:
+                    payload["latency_ms"] = round((record.created - value) * 1000, 1)
+
+                else:
+                    payload[key] = value
+
+        for key, value in record.__dict__.items():
+            if key not in self.RESERVED:
+                payload[key] = value
+
+        if record.exc_info and record.exc_info[0] is not None:
+            payload["exc_type"] = record.exc_info[0].__name__
+            payload["exc_message"] = self._strip(str(record.exc_info[1]))
+
+            if self.show_traceback:
+                if not record.exc_text:
+                    record.exc_text = self.formatException(record.exc_info)
+
+                payload["traceback"] = self._strip(record.exc_text)
+
+        elif getattr(record, "exc_type", None):
+            payload["exc_type"] = record.exc_type
+
+        if record.stack_info and self.show_traceback:
+            payload["stack"] = self.formatStack(record.stack_info)
+
+        return self._dumps(payload)
+
+    # --- orjson when installed (several times faster); anything it cannot encode goes through json with str() fallbacks ---
+    @staticmethod
+    def _dumps(payload: dict) -> str:
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, default = str).decode()
+
+            except TypeError:
+                pass
+
+        return json.dumps(payload, default = str, ensure_ascii = False, separators = (",", ":"))
+
+# (6) Queue handler: records go on a bounded queue and a listener thread writes them out.
+class BoundedQueueHandler(QueueHandler):
+    def __init__(self, log_queue: queue.Queue, overflow: str = "drop_oldest", block_timeout: float = 0.05):
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+
+        # --- Counters ---
+        self.queued = 0
+        self.dropped = 0
+        self.max_depth = 0
+        self._unreported = 0
+
+    # --- Merge args now (they may change before the listener runs); keep exc_info so formatters decide on tracebacks ---
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.overflow == "block":
+                self.queue.put(record, timeout = self.block_timeout)
+
+            else:
+                self.queue.put_nowait(record)
+
+        except queue.Full:
+            if self.overflow != "drop_oldest":
+                self._drop()
+                return
+
+            try:
+                self.queue.get_nowait()
+                self._drop()
+                self.queue.put_nowait(record)
+
+            except (queue.Empty, queue.Full):
+                self._drop()
+                return
+
+        self.queued += 1
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+        # --- Say how much was lost once there is room again ---
+        if self._unreported and self.queue.qsize() < self.queue.maxsize // 2:
+            dropped, self._unreported = self._unreported, 0
+            notice = logging.LogRecord(record.name, logging.WARNING, __file__, 0, f"Logging queue full: dropped {dropped} record(s) ({self.overflow})", None, None)
+
+            try:
+                self.queue.put_nowait(notice)
+
+            except queue.Full:
+                self._unreported += dropped
+
+    def _drop(self):
+        self.dropped += 1
+        self._unreported += 1
+
+# (7) Queue listener that drains in batches: it naps while the queue is empty instead of blocking on it,
+#     so a logging call never has to wake the writer thread (a context switch per record on small hosts).
+class DrainingQueueListener(QueueListener):
+    def __init__(self, log_queue: queue.Queue, *handlers, respect_handler_level: bool = False, interval: float = 0.05):
+        super().__init__(log_queue, *handlers, respect_handler_level = respect_handler_level)
+        self.interval = interval
+
+    def dequeue(self, block: bool):
+        while block and self.queue.empty():
+            time.sleep(self.interval)
+
+        return self.queue.get(block)
+
+    # --- stop() waits for room instead of failing on a full queue ---
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+# (8) Background thread that gzips rotated log files and applies retention, so rollover itself is only a rename.
+class LogCompressor:
+    def __init__(self, compress_level: int = 6):
+        self.compress_level = compress_level
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        # --- Counters ---
+        self.compressed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.removed = 0
+
+    def submit(self, path: str, handler: "CompressingRotatingFileHandler"):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target = self._run, name = "log-compressor", daemon = True)
+                self._thread.start()
+
+        self._jobs.put((path, handler))
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                if job is None:
+                    return
+
+                path, handler = job
+                if path is not None and handler.compress:
+                    self._compress(path)
+
+                handler.prune()
+
+            except Exception as e:
+                sys.stderr.write(f"Log compression failed for {job[0]}: {e}\n")
+
+            finally:
+                self._jobs.task_done()
+
+    def _compress(self, path: str):
+        if not os.path.exists(path):
+            return
+
+        target = f"{path}.gz"
+        with open(path, "rb") as source, gzip.open(f"{target}.tmp", "wb", compresslevel = self.compress_level) as sink:
+            shutil.copyfileobj(source, sink, 1024 * 1024)
+
+        stat = os.stat(path)
+        self.bytes_in += stat.st_size
+        os.utime(f"{target}.tmp", ns = (stat.st_atime_ns, stat.st_mtime_ns))    # --- Age-based retention keeps counting from rotation ---
+        os.replace(f"{target}.tmp", target)
+        os.remove(path)
+        self.bytes_out += os.path.getsize(target)
+        self.compressed += 1
+
+    # --- Wait for queued compressions (shutdown) ---
+    def close(self):
+        if self._thread is not None and self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join()
+
+# (9) Size-rotating file handler: rotated files get a timestamped name, are gzipped off-thread, and are kept by count, age and total size.
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    def __init__(
+        self,
+        filename: str,
+        compressor: LogCompressor,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str = None,
+        compress: bool = True,
+        max_age_days: float = 0,
+        max_total_bytes: int = 0
+    ):
+        super().__init__(filename, maxBytes = maxBytes, backupCount = backupCount, encoding = encoding)
+        self.compressor = compressor
+        self.compress = compress
+        self.max_age = max_age_days * 86400
+        self.max_total_bytes = max_total_bytes
+
+        # --- Finish rotated files left uncompressed by an earlier run, then apply retention ---
+        for path in self._rotated_files():
+            if compress and not path.endswith(".gz"):
+                self.compressor.submit(path, self)
+
+        self.compressor.submit(None, self)
+
+    # --- bot.log.<timestamp>[.gz] files beside the live log (in-progress .tmp files excluded) ---
+    def _rotated_files(self) -> list:
+        return [path for path in glob.glob(f"{glob.escape(self.baseFilename)}.*") if not path.endswith(".tmp")]
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.exists(self.baseFilename):
+            rotated = f"{self.baseFilename}.{time.strftime('%Y%m%d-%H%M%S')}"
+            suffix = 1
+            while os.path.exists(rotated) or os.path.exists(f"{rotated}.gz"):
+                rotated = f"{self.baseFilename}.{time.strftime('%Y%m%d-%H%M%S')}-{suffix}"
+                suffix += 1
 
-# (3) Main logger class.
+            os.rename(self.baseFilename, rotated)
+            self.compressor.submit(rotated, self)
+
+        if not self.delay:
+            self.stream = self._open()
+
+    # --- Delete rotated files past the age limit, beyond backup_count, or over the total size budget (oldest first) ---
+    def prune(self):
+        files = []
+        for path in self._rotated_files():
+            try:
+                stat = os.stat(path)
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            except OSError:
+                continue
+
+        files.sort(reverse = True)
+        now = time.time()
+        total = 0
+
+        for index, (mtime, size, path) in enumerate(files):
+            total += size
+            expired = self.max_age and now - mtime > self.max_age
+            extra = self.backupCount and index >= self.backupCount
+            oversize = self.max_total_bytes and total > self.max_total_bytes
+
+            if expired or extra or oversize:
+                try:
+                    os.remove(path)
+                    self.compressor.removed += 1
+
+                except OSError:
+                    pass
+
+# (10) Logger filter for hot paths (runs in the calling thread, before anything is queued or formatted):
+#      the first record per (logger, level, message) goes through, repeats inside the window are counted and reported as one
+#      "Repeated N more time(s)" record once the window closes; sampling thins whole levels or loggers.
+#      Divider lines ("-----", "=====") are never deduplicated themselves: an opening divider is held until the next record
+#      shows whether its block is written, and the closing one follows the message, so a collapsed block loses both dividers.
+class DedupFilter(logging.Filter):
+    def __init__(
+        self,
+        logger: logging.Logger,
+        min_level: int = logging.WARNING,
+        window: float = 60,
+        max_keys: int = 1000,
+        level_ratios: dict = None,
+        logger_ratios: dict = None,
+        tick_interval: float = 0.5
+    ):
+        super().__init__()
+        self.logger = logger
+        self.min_level = min_level
+        self.window = window
+        self.max_keys = max_keys
+        self.level_ratios = dict(level_ratios or {})
+        self.logger_ratios = dict(logger_ratios or {})
+        self.tick_interval = tick_interval
+        self._sampling = bool(self.level_ratios or self.logger_ratios)
+        self._ratios = {}
+        self._credit = {}
+        self._seen = OrderedDict()    # (name, level, message) -> [window start, repeats], oldest window first
+        self._held = {}               # logger name -> opening divider waiting for its message
+        self._framed = {}             # logger name -> whether the message inside the current divider pair was written
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        # --- Counters ---
+        self.suppressed = 0
+        self.sampled_out = 0
+        self.summaries = 0
+        self.evicted = 0
+
+    # --- Divider lines: a message template made only of "-" / "=" ---
+    @staticmethod
+    def _is_divider(record: logging.LogRecord) -> bool:
+        msg = record.msg
+        return type(msg) is str and len(msg) >= 3 and not record.args and not msg.strip("-=")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if "_dedup" in record.__dict__:
+            return True
+
+        divider = self._is_divider(record)
+        if not divider and not self._held and not self._framed and not self._sampling and record.levelno < self.min_level:
+            return True
+
+        release = []
+        with self._lock:
+            if divider:
+                allowed = self._divider(record, release)
+
+            else:
+                # --- Records logged under no_dedup() (e.g. a config reload's validation) are always written ---
+                if record.levelno >= self.min_level and dedup_exempt():
+                    allowed = True
+
+                else:
+                    allowed = self._sample(record)
+                    if allowed and record.levelno >= self.min_level:
+                        allowed = self._first(record, release)
+
+                self._frame(record.name, allowed, release)
+
+        self._emit(release)
+        return allowed
+
+    # --- Keep `ratio` of the records for a level or logger (deterministic: 0.25 keeps every 4th, starting with the first) ---
+    def _sample(self, record: logging.LogRecord) -> bool:
+        if not self._sampling:
+            return True
+
+        key = (record.name, record.levelno)
+        ratio = self._ratios.get(key)
+        if ratio is None:
+            ratio = self._ratios[key] = self._resolve_ratio(record.name, record.levelno)
+
+        if ratio >= 1:
+            return True
+
+        credit = self._credit.get(key)
+        credit = 1.0 if credit is None else credit + ratio
+        if credit >= 1:
+            self._credit[key] = credit - 1
+            return True
+
+        self._credit[key] = credit
+        self.sampled_out += 1
+        return False
+
+    # --- The closest configured logger ("bot.commands" covers "bot.commands.fun") wins over the level ratio ---
+    def _resolve_ratio(self, name: str, levelno: int) -> float:
+        parts = name.split(".")
+        for end in range(len(parts), 0, -1):
+            ratio = self.logger_ratios.get(".".join(parts[:end]))
+            if ratio is not None:
+                return ratio
+
+        return self.level_ratios.get(levelno, 1.0)
+
+    # --- True for the first record of its message in the current window ---
+    def _first(self, record: logging.LogRecord, release: list) -> bool:
+        self._expire(record.created, release)
+        key = (record.name, record.levelno, record.getMessage())
+
+        entry = self._seen.get(key)
+        if entry is not None:
+            entry[1] += 1
+            self.suppressed += 1
+            return False
+
+        if len(self._seen) >= self.max_keys:
+            oldest, (started, repeats) = self._seen.popitem(last = False)
+            self.evicted += 1
+            if repeats:
+                release.append(self._summary(oldest, started, repeats, record.created))
+
+        self._seen[key] = [record.created, 0]
+        return True
+
+    # --- Close windows that have run their length (summaries for the ones with repeats) ---
+    def _expire(self, now: float, release: list):
+        while self._seen:
+            key, (started, repeats) = next(iter(self._seen.items()))
+            if now - started < self.window:
+                break
+
+            del self._seen[key]
+            if repeats:
+                release.append(self._summary(key, started, repeats, now))
+
+    # --- Closing divider (right after a framed message): follows that message. Opening divider: held for the next record ---
+    def _divider(self, record: logging.LogRecord, release: list) -> bool:
+        written = self._framed.pop(record.name, None)
+        if written is not None:
+            return written
+
+        held = self._held.pop(record.name, None)
+        if held is not None:
+            release.append(held)
+
+        self._held[record.name] = record
+        return False
+
+    # --- A message after a held divider is framed by it: the divider is written only with the message ---
+    def _frame(self, name: str, allowed: bool, release: list):
+        held = self._held.pop(name, None)
+        if held is None:
+            return
+
+        if allowed:
+            release.append(held)
+
+        self._framed[name] = allowed
+
+    def _summary(self, key: tuple, started: float, repeats: int, now: float) -> logging.LogRecord:
+        name, levelno, message = key
+        summary = logging.LogRecord(
+            name, levelno, __file__, 0,
+            "Repeated %d more time(s) in %.0fs: %s", (repeats, min(now - started, self.window), message), None
+        )
+        summary.context = EMPTY_CONTEXT
+        summary.repeated = repeats
+        self.summaries += 1
+        return summary
+
+    # --- Released records go to the logger's handlers, marked so they pass this filter unchanged ---
+    def _emit(self, release: list):
+        for record in release:
+            record._dedup = True
+            self.logger.callHandlers(record)
+
+    # --- Periodic pass (background thread): close expired windows; a divider nothing followed is written after all ---
+    def tick(self, now: float = None):
+        now = time.time() if now is None else now
+        release = []
+        with self._lock:
+            self._expire(now, release)
+            for name, record in list(self._held.items()):
+                if now - record.created >= self.tick_interval:
+                    del self._held[name]
+                    release.append(record)
+
+        self._emit(release)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target = self._run, name = "log-dedup", daemon = True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.tick_interval):
+            try:
+                self.tick()
+
+            except Exception as e:
+                sys.stderr.write(f"Log dedup tick failed: {e}\n")
+
+    # --- Write any held divider and report every open window that has repeats (shutdown) ---
+    def flush(self):
+        now = time.time()
+        with self._lock:
+            release = list(self._held.values())
+            release += [self._summary(key, started, repeats, now) for key, (started, repeats) in self._seen.items() if repeats]
+            self._held.clear()
+            self._framed.clear()
+            self._seen.clear()
+
+        self._emit(release)
+
+    def close(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        self.flush()
+
+# (11) Main logger class.
 class BotLogger:
-    def __init__(self, config_path: Path = CONFIG_PATH):
-        self.config = self._load_config(config_path)
+    def __init__(self, config: LoggerConfig = None):
+        self.config = config or self._load_config()
         self.logger = None
+        self.handlers = []
+        self.queue_handler = None
+        self.listener = None
+        self.dedup_filter = None
+        self.compressor = LogCompressor()
         self._setup_logger()
 
-    # --- Load logger configuration from YAML file ---
-    def _load_config(self, config_path: Path) -> dict:
-        try:
-            with config_path.open("r", encoding = "utf-8") as f:
-                return yaml.safe_load(f)
-            
-        except FileNotFoundError:
-            raise RuntimeError(f"Logger config not found: {config_path}")
+    # --- Logger section of the shared config snapshot ---
+    def _load_config(self) -> LoggerConfig:
+        source = get_config_files()["logger.yaml"]
+        if isinstance(source.error, FileNotFoundError):
+            raise RuntimeError(f"Logger config not found: {source.path}")
+
+        return get_config().logger
 
     # --- Setup the logger with handlers ---
     def _setup_logger(self):
         cfg = self.config
 
-        self.logger = logging.getLogger(cfg["logger"]["name"])
+        self.logger = logging.getLogger(cfg.logger.name)
         self.logger.setLevel(logging.DEBUG)
         self.logger.handlers.clear()
-        self.logger.propagate = cfg["advanced"]["propagate"]
+        self.logger.filters.clear()
+        self.logger.propagate = cfg.advanced.propagate
 
-        if cfg["console"]["enabled"]:
+        if cfg.console.enabled:
             self._setup_console_handler()
 
-        if cfg["file"]["enabled"]:
+        if cfg.file.enabled:
             self._setup_file_handler()
 
+        if cfg.queue.enabled:
+            self._setup_queue()
+
+        else:
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+
+        # --- Collapse repeats before anything else runs, then attach the task's log context (command, guild_id, user_id, ...);
+        #     on the queue handler these also see records from child loggers (bot.*), still in the calling thread ---
+        entry = self.queue_handler or self.logger
+        if cfg.dedup.enabled:
+            entry.addFilter(self._build_dedup_filter())
+
+        entry.addFilter(ContextFilter())
+
+    # --- Deduplication and sampling filter (dropped records are never queued or formatted) ---
+    def _build_dedup_filter(self) -> "DedupFilter":
+        cfg = self.config.dedup
+
+        self.dedup_filter = DedupFilter(
+            self.logger,
+            min_level = getattr(logging, cfg.min_level),
+            window = cfg.window_seconds,
+            max_keys = cfg.max_keys,
+            level_ratios = {getattr(logging, level.upper()): ratio for level, ratio in cfg.sampling.levels.items()},
+            logger_ratios = dict(cfg.sampling.loggers)
+        )
+        self.dedup_filter.start()
+        return self.dedup_filter
+
+    # --- Route records through a queue; a listener thread owns the console and file handlers ---
+    def _setup_queue(self):
+        cfg = self.config.queue
+
+        self.queue_handler = BoundedQueueHandler(
+            queue.Queue(maxsize = cfg.max_size),
+            overflow = cfg.overflow,
+            block_timeout = cfg.block_timeout_ms / 1000
+        )
+        self.listener = DrainingQueueListener(
+            self.queue_handler.queue,
+            *self.handlers,
+            respect_handler_level = True,
+            interval = cfg.flush_interval_ms / 1000
+        )
+        self.logger.addHandler(self.queue_handler)
+        self.listener.start()
+
+    # --- Flush everything still queued and hand the handlers back to the logger (later records are written directly) ---
+    def shutdown(self):
+        if self.dedup_filter is not None:
+            self.dedup_filter.close()
+
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.logger.removeHandler(self.queue_handler)
+
+            for record_filter in self.queue_handler.filters:
+                self.logger.addFilter(record_filter)
+
+            for handler in self.handlers:
+                self.logger.addHandler(handler)
+                handler.flush()
+
+            if self.queue_handler._unreported:
+                self.logger.warning(f"Logging queue full: dropped {self.queue_handler._unreported} record(s) ({self.queue_handler.overflow})")
+                self.queue_handler._unreported = 0
+
+        self.compressor.close()
+
+    # --- Snapshot of queue, rotation and dedup counters ---
+    def stats(self) -> dict:
+        stats = {
+            "compressed": self.compressor.compressed,
+            "compressed_bytes_in": self.compressor.bytes_in,
+            "compressed_bytes_out": self.compressor.bytes_out,
+            "removed": self.compressor.removed,
+        }
+
+        if self.dedup_filter is not None:
+            stats.update({
+                "suppressed": self.dedup_filter.suppressed,
+                "sampled_out": self.dedup_filter.sampled_out,
+                "summaries": self.dedup_filter.summaries,
+                "dedup_evicted": self.dedup_filter.evicted,
+            })
+
+        if self.queue_handler is None:
+            return {"queue": False, **stats}
+
+        return {
+            "queued": self.queue_handler.queued,
+            "dropped": self.queue_handler.dropped,
+            "max_depth": self.queue_handler.max_depth,
+            "pending": self.queue_handler.queue.qsize(),
+            **stats,
+        }
+
     # --- Setup console handler ---
     def _setup_console_handler(self):
         cfg = self.config
 
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, cfg["console"]["level"]))
+        console_handler.setLevel(getattr(logging, cfg.console.level))
 
         formatter = ColoredFormatter(
-            fmt = cfg["format"]["console"],
-            datefmt = cfg["format"]["date_format"],
-            colors = self._resolve_colors(cfg["console"]["colors"]),
-            show_traceback = cfg["error_handling"]["show_traceback_console"],
+            fmt = cfg.format.console,
+            datefmt = cfg.format.date_format,
+            colors = self._resolve_colors(cfg.console.colors),
+            show_traceback = cfg.error_handling.show_traceback_console,
         )
 
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        self.handlers.append(console_handler)
 
-    # --- Setup rotating file handler ---
+    # --- Setup rotating file handlers (bot.log, plus error.log / warning.log when separate_files is on) ---
     def _setup_file_handler(self):
         cfg = self.config
 
-        os.makedirs(cfg["logger"]["log_dir"], exist_ok=True)
+        os.makedirs(cfg.logger.log_dir, exist_ok=True)
 
-        file_handler = RotatingFileHandler(
-            filename = os.path.join(cfg["logger"]["log_dir"], "bot.log"),
-            maxBytes = cfg["file"]["rotation"]["max_bytes"],
-            backupCount = cfg["file"]["rotation"]["backup_count"],
-            encoding = cfg["advanced"]["encoding"],
-        )
+        self.handlers.append(self._build_file_handler("bot.log", getattr(logging, cfg.file.level)))
+
+        separate = cfg.advanced.separate_files
+        if separate.enabled:
+            self.handlers.append(self._build_file_handler(separate.error_file, logging.ERROR))
 
-        file_handler.setLevel(getattr(logging, cfg["file"]["level"]))
+            warning_handler = self._build_file_handler(separate.warning_file, logging.WARNING)
+            warning_handler.addFilter(lambda record: record.levelno < logging.ERROR)
+            self.handlers.append(warning_handler)
+
+    def _build_file_handler(self, file_name: str, level: int) -> CompressingRotatingFileHandler:
+        cfg = self.config
+        rotation = cfg.file.rotation
 
-        # --- Use FileFormatter (no colors) for file output ---
-        formatter = FileFormatter(
-            fmt = cfg["format"]["file"],
-            datefmt = cfg["format"]["date_format"],
-            show_traceback = cfg["error_handling"]["show_traceback_file"],
+        file_handler = CompressingRotatingFileHandler(
+            filename = os.path.join(cfg.logger.log_dir, file_name),
+            compressor = self.compressor,
+            maxBytes = rotation.max_bytes,
+            backupCount = rotation.backup_count,
+            encoding = cfg.advanced.encoding,
+            compress = rotation.compress,
+            max_age_days = rotation.max_age_days,
+            max_total_bytes = int(rotation.max_total_mb * 1024 * 1024),
         )
 
+        file_handler.setLevel(level)
+
+        # --- JSON lines or FileFormatter (no colors) for file output; one per handler, since each caches its own strings ---
+        if cfg.format.style == "json":
+            formatter = JsonFormatter(show_traceback = cfg.error_handling.show_traceback_file)
+
+        else:
+            formatter = FileFormatter(
+                fmt = cfg.format.file,
+                datefmt = cfg.format.date_format,
+                show_traceback = cfg.error_handling.show_traceback_file,
+            )
+
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        return file_handler
 
     # --- Resolve color names from YAML to colorama ---
     def _resolve_colors(self, colors: dict) -> dict:
@@ -164,11 +846,23 @@ class BotLogger:
         }
 
 # GLOBAL INSTANCE --------------------------------------------------------------------------------------------------------------------------------|
+_bot_logger = None
 _logger_instance = None
 
 def get_logger() -> logging.Logger:
-    global _logger_instance
+    global _bot_logger, _logger_instance
     if _logger_instance is None:
-        _logger_instance = BotLogger().logger
+        _bot_logger = BotLogger()
+        _logger_instance = _bot_logger.logger
+        atexit.register(shutdown_logger)
 
     return _logger_instance
+
+# (1) Write out everything still queued (safe to call more than once).
+def shutdown_logger():
+    if _bot_logger is not None:
+        _bot_logger.shutdown()
+
+# (2) Logging queue counters.
+def logger_stats() -> dict:
+    return _bot_logger.stats() if _bot_logger is not None else {}
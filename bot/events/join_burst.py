@@ -0,0 +1,114 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import time
+import asyncio
+import nextcord
+from collections import deque
+from typing import Awaitable, Callable, List, Optional
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from core import get_logger
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+WINDOW_HISTORY = 60    # Finished windows kept for stats()
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Sends welcomes one by one while joins are slow; batches joiners into one message during a burst
+class JoinBurstAggregator:
+    def __init__(
+        self,
+        send_one: Callable[[nextcord.Member, str], Awaitable[None]],
+        send_batch: Callable[[List[nextcord.Member], str], Awaitable[None]],
+        window_seconds: float = 10.0,
+        threshold: int = 5,
+        max_batch: int = 20
+    ):
+        self.send_one = send_one
+        self.send_batch = send_batch
+        self.window_seconds = window_seconds
+        self.threshold = threshold
+        self.max_batch = max_batch
+        self.logger = get_logger()
+
+        # --- Tumbling window of join counts ---
+        self._window_start = time.monotonic()
+        self._window_joins = 0
+        self.window_counts = deque(maxlen = WINDOW_HISTORY)
+
+        # --- Joiners waiting for the batched welcome ---
+        self._pending: List[nextcord.Member] = []
+        self._pending_roles = ""
+        self._flush_task: Optional[asyncio.Task] = None
+
+        # --- Counters ---
+        self._individual = 0
+        self._batched = 0
+        self._batches = 0
+
+    # --- Roll the window over once it has run its length (quiet windows are recorded as 0) ---
+    def _tick(self, now: float):
+        elapsed = int((now - self._window_start) // self.window_seconds)
+        if elapsed < 1:
+            return
+
+        self.window_counts.append(self._window_joins)
+        self.window_counts.extend([0] * min(elapsed - 1, WINDOW_HISTORY))
+        self._window_start += elapsed * self.window_seconds
+        self._window_joins = 0
+
+    # --- Register a join; sends or queues its welcome (role_names: the roles handle() resolved for it) ---
+    async def add(self, member: nextcord.Member, role_names: str):
+        self._tick(time.monotonic())
+        self._window_joins += 1
+
+        # --- Quiet: welcome right away, exactly as before ---
+        if not self._pending and self._window_joins <= self.threshold:
+            self._individual += 1
+            await self.send_one(member, role_names)
+            return
+
+        # --- Burst: collect until the batch is full or the window closes ---
+        self._pending.append(member)
+        self._pending_roles = role_names
+
+        if len(self._pending) >= self.max_batch:
+            await self._flush()
+
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window_seconds)
+        self._flush_task = None
+        await self._flush()
+
+    async def _flush(self):
+        if self._flush_task is not None and self._flush_task is not asyncio.current_task():
+            self._flush_task.cancel()
+            self._flush_task = None
+
+        members, self._pending = self._pending, []
+        if not members:
+            return
+
+        self._batched += len(members)
+        self._batches += 1
+        self.logger.info(f"Welcome burst: batching {len(members)} member(s) ({self._window_joins} join(s) in the current window)")
+
+        try:
+            await self.send_batch(members, self._pending_roles)
+
+        except Exception as e:
+            self.logger.error(f"Failed to send batched welcome for {len(members)} member(s): {e}")
+
+    # --- Snapshot of join counters (window_counts: joins per finished window, oldest first) ---
+    def stats(self) -> dict:
+        self._tick(time.monotonic())
+        return {
+            "current_window": self._window_joins,
+            "window_counts": list(self.window_counts),
+            "peak_window": max([self._window_joins, *self.window_counts]),
+            "pending": len(self._pending),
+            "individual": self._individual,
+            "batched": self._batched,
+            "batches": self._batches,
+        }
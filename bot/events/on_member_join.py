@@ -1,26 +1,28 @@
 # LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
-import yaml
-import random
+import io
+import time
+import asyncio
 import nextcord
 import traceback
 from pathlib import Path
+from datetime import datetime, timezone
+from typing import List, Optional
 from nextcord import Embed, Color
 
 # LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
-from core import get_logger
+from core import get_logger, get_config, thaw, log_context, StoredAsset
+from imaging import VariantCache, RenderExecutor, render_welcome_card, sniff_extension
+
+from .join_burst import JoinBurstAggregator
+from .role_retry import RoleRetryQueue, is_retryable
 
 # PATHS -------------------------------------------------------------------------------------------------------------------------------------------|
 # (1) Welcome Images Path
 WELCOME_IMAGE_DIR = Path(__file__).resolve().parent.parent.parent
 WELCOME_IMAGE_PATH = WELCOME_IMAGE_DIR / "assets" / "welcome"
 
-# (2) Config Files Path
+# (2) Project Root (cache paths in bot.yaml are relative to it)
 CONFIG_DIR = Path(__file__).resolve().parent.parent.parent
-CONFIG_PATH = CONFIG_DIR / "config" / "bot.yaml"
-
-# (3) Premissions Config Path
-PERMISSIONS_DIR = Path(__file__).resolve().parent.parent.parent
-PERMISSIONS_PATH = PERMISSIONS_DIR / "config" / "permissions.yaml"
 
 # DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
 divider = f"=" * 70
@@ -31,128 +33,314 @@ class OnMemberJoinEvent:
     def __init__(self, bot: nextcord.Client):
         self.bot = bot
         self.logger = get_logger()
-        self.config = self._load_config()
-        self.permissions = self._load_permissions()
 
-    # --- Load Bot Config ---
-    def _load_config(self) -> dict:
-        try:
-            with CONFIG_PATH.open("r", encoding = "utf-8") as f:
-                return yaml.safe_load(f)
-            
-        except FileNotFoundError:
-            return {}
-        
-    # --- Load Permissions Config ---
-    def _load_permissions(self) -> dict:
-        try:
-            with PERMISSIONS_PATH.open("r", encoding = "utf-8") as f:
-                return yaml.safe_load(f)
-            
-        except FileNotFoundError:
-            return {}
-        
-    # --- Get Random Welcome Image ---
-    def _get_random_welcome_image(self) -> Path:
-        if not WELCOME_IMAGE_PATH.exists():
+        # --- Welcome images stay resident as display-sized variants; joins never touch the filesystem ---
+        self.welcome_variants = self._build_variant_cache()
+        self.bot.assets.register("welcome", WELCOME_IMAGE_PATH, [".png", ".jpg", ".jpeg"], transform = self.welcome_variants)
+
+        if self.welcome_variants is not None:
+            self.welcome_variants.prune()
+            self.logger.info(f"Welcome image variants ready: {self.welcome_variants.stats()}")
+
+        # --- Personalized welcome cards (avatar + name composited onto the template, off the event loop) ---
+        card_cfg = self.config.welcome.card
+        self.card_enabled = card_cfg.enabled
+        self.card_budget = card_cfg.budget_ms / 1000
+        self.card_avatar_size = card_cfg.avatar_size
+        self.card_options = {
+            "avatar_ratio": card_cfg.avatar_ratio,
+            "font": card_cfg.font,
+            "font_ratio": card_cfg.font_ratio,
+            "encoding": thaw(card_cfg.encoding)
+        }
+        self.card_executor = RenderExecutor(kind = "thread", max_workers = card_cfg.max_workers) if self.card_enabled else None
+        self.card_stats = {"rendered": 0, "fallbacks": 0, "render_ms": 0.0}
+
+        # --- Join bursts: past the threshold, joiners in a window share one welcome message ---
+        burst_cfg = self.config.welcome.burst
+        self.join_bursts = JoinBurstAggregator(
+            send_one = self._send_welcome,
+            send_batch = self._send_batch_welcome,
+            window_seconds = burst_cfg.window_seconds,
+            threshold = burst_cfg.threshold,
+            max_batch = burst_cfg.max_batch
+        )
+
+        # --- Rate-limited role assignments are retried in the background ---
+        retry_cfg = self.config.welcome.role_retry
+        self.role_retries = RoleRetryQueue(
+            max_attempts = retry_cfg.max_attempts,
+            base_delay = retry_cfg.base_delay,
+            max_delay = retry_cfg.max_delay
+        )
+
+        # --- Join-to-welcome latency (from Discord's join timestamp to the welcome being sent) ---
+        self.welcome_latency = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+
+    # --- Current bot.yaml / permissions.yaml settings (swapped in place when the files are edited) ---
+    @property
+    def config(self):
+        return get_config().bot
+
+    @property
+    def permissions(self):
+        return get_config().permission_index
+
+    # --- Recompressed welcome images at embed width, cached on disk by source hash ---
+    def _build_variant_cache(self) -> Optional[VariantCache]:
+        welcome_cfg = self.config.welcome
+        if not welcome_cfg.optimize:
             return None
-        
-        # --- Get all supported image files ---
-        image_extensions = [".png", ".jpg", ".jpeg"]
-        images = [img for img in WELCOME_IMAGE_PATH.iterdir() if img.is_file() and img.suffix.lower() in image_extensions]
 
-        if not images:
+        return VariantCache(
+            cache_dir = CONFIG_DIR / welcome_cfg.cache_dir,
+            width = welcome_cfg.width,
+            encoding = thaw(welcome_cfg.encoding)
+        )
+
+    # --- Get Random Welcome Image ---
+    def _get_random_welcome_image(self) -> Optional[StoredAsset]:
+        image = self.bot.assets.choice("welcome")
+
+        if image is None:
             self.logger.error(sub_divider)
             self.logger.warning(f"No Welcome images found at: {WELCOME_IMAGE_PATH}")
             self.logger.error(sub_divider)
             return None
         
-        return random.choice(images)
+        return image
+
+    # --- Fetch the member's avatar small and composite the card in a render worker ---
+    async def _render_card(self, member: nextcord.Member, template: StoredAsset) -> bytes:
+        avatar = member.display_avatar.with_size(self.card_avatar_size).with_static_format("png")
+        avatar_data = await self.bot.http_pool.fetch_bytes(avatar.url)
+
+        return await self.card_executor.run(
+            render_welcome_card,
+            template.digest,
+            template.data,
+            avatar_data,
+            member.display_name,
+            self.card_options
+        )
+
+    # --- Personalized card, or None to fall back to the plain template ---
+    async def _build_card(self, member: nextcord.Member, template: StoredAsset) -> Optional[nextcord.File]:
+        start = time.perf_counter()
+
+        # --- Join wave: renders already waiting would push this one past the budget ---
+        if self.card_stats["rendered"]:
+            avg_seconds = self.card_stats["render_ms"] / self.card_stats["rendered"] / 1000
+            if (self.card_executor.queue_depth + 1) * avg_seconds > self.card_budget:
+                self.card_stats["fallbacks"] += 1
+                self.logger.debug("Welcome card skipped for %s: render queue over budget", member.name)
+                return None
 
-    # --- OnMemberJoin Event Handler ---
-    async def handle(self, member: nextcord.Member):
         try:
-            # --- Check if welcome messages are enabled ---
-            if not self.config.get("features", {}).get("welcome_messages", False):
-                self.logger.error(sub_divider)
-                self.logger.debug(f"Welcome messages disabled. Skipping for {member.name}")
-                self.logger.error(sub_divider)
-                return
-            
-            # --- Get welcome channel ID ---
-            welcome_channel_id = self.permissions.get("welcome")
+            data = await asyncio.wait_for(self._render_card(member, template), timeout = self.card_budget)
 
-            if not welcome_channel_id:
-                self.logger.error(sub_divider)
-                self.logger.error("Welcome channel ID not found in permissions.yaml")
-                self.logger.error(sub_divider)
-                return
-            
-            # --- Get welcome channel ---
-            welcome_channel = self.bot.get_channel(welcome_channel_id)
+        except asyncio.TimeoutError:
+            self.card_stats["fallbacks"] += 1
+            self.logger.warning("Welcome card for %s exceeded %.0f ms, sending the plain template", member.name, self.card_budget * 1000)
+            return None
 
-            if not welcome_channel:
-                return
-            
-            # --- Assign new member role ---
-            new_member_role_ids = self.permissions.get("Roles", {}).get("New_Member", [])
-
-            if new_member_role_ids:
-                for role_id in new_member_role_ids:
-                    role = member.guild.get_role(role_id)
-
-                    if role:
-                        try:
-                            await member.add_roles(role)
-                            self.logger.info(f"Assigned role '{role.name}' to '{member.name}'")
-
-                        except nextcord.Forbidden:
-                            self.logger.error(sub_divider)
-                            self.logger.error(f"Missing permissions to assign role '{role.name}' to '{member.name}'")
-                            self.logger.error(sub_divider)
-
-                        except Exception as e:
-                            self.logger.error(sub_divider)
-                            self.logger.error(f"Error assigning role to {member.name}: {e}")
-                            self.logger.error(sub_divider)
-
-                    else:
-                        self.logger.error(sub_divider)
-                        self.logger.warning(f"Role with ID {role_id} not found")
-                        self.logger.error(sub_divider)
-
-            # --- Building welcome embed ---
-            welcome_image = self._get_random_welcome_image()
-
-            embed = Embed(
-                title = "🎉 Welcome to the Server!",
-                description = f'''
-                Welcome {member.mention}! We're glad to have you here.
-
-                We have assigned you {role.name} which will let you interact with the server.
-
-                __**GETTING STARTED**__
-                • Introduce yourself to the community in `👋│introductions channel`.
-                • Go through the server rule ` ` to avoid getting any penalties.
-                • Get yourself some fun roles from ` ` channel.
-                • Stay update with ` ` channel.
-                • Type `/help` to get more information about the community.
-
-                Hope you will enjoy your stay here.
-                ''',
-                color = Color.blurple()
+        except Exception as e:
+            self.card_stats["fallbacks"] += 1
+            self.logger.warning("Welcome card for %s failed, sending the plain template: %s", member.name, e)
+            return None
+
+        self.card_stats["rendered"] += 1
+        self.card_stats["render_ms"] += (time.perf_counter() - start) * 1000
+        return nextcord.File(io.BytesIO(data), filename = f"welcome_card.{sniff_extension(data)}")
+
+    # --- Shutdown: log join stats and release the card workers ---
+    def close(self):
+        self.role_retries.close()
+        self.logger.info(f"Join burst stats: {self.join_bursts.stats()}")
+        self.logger.info(f"Role retry stats: {self.role_retries.stats()}")
+
+        if self.welcome_latency["count"]:
+            self.logger.info(
+                f"Join-to-welcome latency: {self.welcome_latency['count']} welcome(s), "
+                f"avg {self.welcome_latency['total_ms'] / self.welcome_latency['count']:.0f} ms, max {self.welcome_latency['max_ms']:.0f} ms"
             )
-            if welcome_image:
-                file = nextcord.File(welcome_image, filename = welcome_image.name)
-                embed.set_image(url = f"attachment://{welcome_image.name}")
-                
-                await welcome_channel.send(embed = embed, file = file)
+
+        if self.card_executor is not None:
+            self.card_executor.shutdown()
+            self.logger.info(f"Welcome card stats: {self.card_stats}")
+
+    # --- Resolve the configured new member roles in a guild ---
+    def _new_member_roles(self, guild: nextcord.Guild) -> List[nextcord.Role]:
+        roles = []
+
+        for role_id in self.permissions.new_member:
+            role = guild.get_role(role_id)
+
+            if role:
+                roles.append(role)
 
             else:
-                await welcome_channel.send(embed = embed)
+                self.logger.error(sub_divider)
+                self.logger.warning(f"Role with ID {role_id} not found")
+                self.logger.error(sub_divider)
+
+        return roles
+
+    # --- Apply every new member role in one request; rate limits go to the retry queue ---
+    async def _assign_roles(self, member: nextcord.Member, roles: List[nextcord.Role]):
+        try:
+            await member.add_roles(*roles, reason = "New member roles")
+            self.logger.info(f"Assigned role(s) {', '.join(role.name for role in roles)} to '{member.name}'")
+
+        except nextcord.Forbidden:
+            self.logger.error(sub_divider)
+            self.logger.error("Missing permissions to assign role(s) %s to '%s'", ", ".join(role.name for role in roles), member.name)
+            self.logger.error(sub_divider)
 
         except Exception as e:
+            if is_retryable(e):
+                self.logger.warning("Role assignment for '%s' rate limited or failed upstream, retrying in the background: %s", member.name, e)
+                self.role_retries.submit(member, roles)
+                return
+
+            self.logger.error(sub_divider)
+            self.logger.error("Error assigning role to %s: %s", member.name, e)
+            self.logger.error(sub_divider)
+
+    # --- Record how long after joining a member was welcomed ---
+    def _record_welcome_latency(self, members: List[nextcord.Member]):
+        now = datetime.now(timezone.utc)
+
+        for member in members:
+            if member.joined_at is None:
+                continue
+
+            latency_ms = (now - member.joined_at).total_seconds() * 1000
+            self.welcome_latency["count"] += 1
+            self.welcome_latency["total_ms"] += latency_ms
+            self.welcome_latency["max_ms"] = max(self.welcome_latency["max_ms"], latency_ms)
+            self.logger.info(f"Join-to-welcome latency for '{member.name}': {latency_ms:.0f} ms")
+
+    # --- Get welcome channel ---
+    def _get_welcome_channel(self) -> Optional[nextcord.abc.Messageable]:
+        welcome_channel_id = self.permissions.welcome
+
+        if not welcome_channel_id:
             self.logger.error(sub_divider)
-            self.logger.error(f"Error in OnMemberJoin event for {member.name}: {e}")
-            self.logger.error(traceback.format_exc())
+            self.logger.error("Welcome channel ID not found in permissions.yaml")
             self.logger.error(sub_divider)
+            return None
+
+        return self.bot.get_channel(welcome_channel_id)
+
+    # --- Attach the welcome image (or reuse its uploaded URL) and send ---
+    async def _send_with_image(self, channel: nextcord.abc.Messageable, embed: Embed, welcome_image: Optional[StoredAsset], card: Optional[nextcord.File] = None):
+        welcome_url = await self.bot.attachments.url_for("welcome", welcome_image) if welcome_image and card is None else None
+        if card is not None:
+            embed.set_image(url = f"attachment://{card.filename}")
+            await channel.send(embed = embed, file = card)
+
+        elif welcome_url:
+            embed.set_image(url = welcome_url)
+            await channel.send(embed = embed)
+
+        elif welcome_image:
+            file = welcome_image.to_file()
+            embed.set_image(url = f"attachment://{welcome_image.name}")
+            
+            await channel.send(embed = embed, file = file)
+
+        else:
+            await channel.send(embed = embed)
+
+    # --- One welcome for one member ---
+    async def _send_welcome(self, member: nextcord.Member, role_names: str):
+        welcome_channel = self._get_welcome_channel()
+
+        if not welcome_channel:
+            return
+
+        # --- Building welcome embed ---
+        welcome_image = self._get_random_welcome_image()
+
+        embed = Embed(
+            title = "🎉 Welcome to the Server!",
+            description = f'''
+            Welcome {member.mention}! We're glad to have you here.
+
+            We have assigned you {role_names} which will let you interact with the server.
+
+            __**GETTING STARTED**__
+            • Introduce yourself to the community in `👋│introductions channel`.
+            • Go through the server rule ` ` to avoid getting any penalties.
+            • Get yourself some fun roles from ` ` channel.
+            • Stay update with ` ` channel.
+            • Type `/help` to get more information about the community.
+
+            Hope you will enjoy your stay here.
+            ''',
+            color = Color.blurple()
+        )
+        card = await self._build_card(member, welcome_image) if self.card_enabled and welcome_image else None
+        await self._send_with_image(welcome_channel, embed, welcome_image, card)
+        self._record_welcome_latency([member])
+
+    # --- One welcome for a burst of members ---
+    async def _send_batch_welcome(self, members: List[nextcord.Member], role_names: str):
+        welcome_channel = self._get_welcome_channel()
+
+        if not welcome_channel:
+            return
+
+        welcome_image = self._get_random_welcome_image()
+
+        embed = Embed(
+            title = f"🎉 Welcome to our {len(members)} new members!",
+            description = f'''
+            Welcome {", ".join(member.mention for member in members)}! We're glad to have you all here.
+
+            We have assigned you {role_names} which will let you interact with the server.
+
+            __**GETTING STARTED**__
+            • Introduce yourself to the community in `👋│introductions channel`.
+            • Go through the server rule ` ` to avoid getting any penalties.
+            • Get yourself some fun roles from ` ` channel.
+            • Stay update with ` ` channel.
+            • Type `/help` to get more information about the community.
+
+            Hope you will enjoy your stay here.
+            ''',
+            color = Color.blurple()
+        )
+        await self._send_with_image(welcome_channel, embed, welcome_image)
+        self._record_welcome_latency(members)
+
+    # --- OnMemberJoin Event Handler ---
+    async def handle(self, member: nextcord.Member):
+        # --- Tag every record logged while handling this join (JSON log lines carry these as fields) ---
+        with log_context(timed = True, event = "member_join", guild_id = member.guild.id, user_id = member.id):
+            try:
+                # --- Check if welcome messages are enabled ---
+                if not self.config.features.welcome_messages:
+                    self.logger.error(sub_divider)
+                    self.logger.debug("Welcome messages disabled. Skipping for %s", member.name)
+                    self.logger.error(sub_divider)
+                    return
+            
+                # --- Assign new member roles while the welcome goes out (now, or batched during a join burst);
+                #     roles are resolved once here and only their names travel to the welcome ---
+                roles = self._new_member_roles(member.guild)
+                role_names = ", ".join(role.name for role in roles) or "the member role"
+                welcome = self.join_bursts.add(member, role_names)
+
+                if roles:
+                    await asyncio.gather(self._assign_roles(member, roles), welcome)
+
+                else:
+                    await welcome
+
+            except Exception as e:
+                self.logger.error(sub_divider)
+                self.logger.error("Error in OnMemberJoin event for %s: %s", member.name, e)
+                self.logger.error(traceback.format_exc())
+                self.logger.error(sub_divider)
@@ -19,6 +19,12 @@ class OnReadyEvent:
         # --- ENSURE websocket is fully ready ---
         await self.bot.wait_until_ready()
 
+        # --- Start picking up edited asset files in the background ---
+        self.bot.assets.start_watching()
+
+        # --- Apply edits to the config files without a restart ---
+        self.bot.config_watcher.start()
+
         # --- Set Bot Presence (NOW RELIABLE) ---
         activity = self.bot.build_activity()
         status = self.bot.build_status()
@@ -73,3 +79,6 @@ class OnReadyEvent:
             self.logger.info(f"Boosts          : {guild.premium_subscription_count}")
 
             self.logger.info(divider)
+
+        # --- Upload static images to the asset channel once, so later sends only carry a URL ---
+        await self.bot.attachments.warm({group: self.bot.assets.all(group) for group in self.bot.assets.groups()})
@@ -0,0 +1,111 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import time
+import heapq
+import asyncio
+import itertools
+import nextcord
+from typing import List, Optional
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from core import get_logger
+
+# DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
+divider = f"=" * 70
+sub_divider = f"-" * 70
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Failures worth retrying: rate limits and Discord server errors
+def is_retryable(error: Exception) -> bool:
+    return isinstance(error, nextcord.HTTPException) and (error.status == 429 or error.status >= 500)
+
+# (2) Background queue that re-applies roles after rate-limited failures, with exponential backoff
+class RoleRetryQueue:
+    def __init__(self, max_attempts: int = 5, base_delay: float = 2.0, max_delay: float = 60.0, max_size: int = 1000):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.logger = get_logger()
+
+        # --- Heap ordered by due time; the worker sleeps until the head is due or a new entry wakes it,
+        #     so a long backoff never holds up a shorter one submitted later ---
+        self._heap: list = []
+        self._max_size = max_size
+        self._wake = asyncio.Event()
+        self._sequence = itertools.count()
+        self._worker: Optional[asyncio.Task] = None
+
+        # --- Counters ---
+        self._queued = 0
+        self._succeeded = 0
+        self._given_up = 0
+        self._dropped = 0
+
+    # --- Delay before the given (1-based) retry ---
+    def _backoff(self, attempt: int) -> float:
+        return min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+
+    # --- Schedule another try of add_roles(*roles) ---
+    def submit(self, member: nextcord.Member, roles: List[nextcord.Role], attempt: int = 1):
+        if len(self._heap) >= self._max_size:
+            self._dropped += 1
+            self.logger.error("Role retry queue full, dropping role assignment for '%s'", member.name)
+            return
+
+        heapq.heappush(self._heap, (time.monotonic() + self._backoff(attempt), next(self._sequence), member, roles, attempt))
+        self._queued += 1
+        self._wake.set()
+
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            if not self._heap:
+                self._wake.clear()
+                await self._wake.wait()
+                continue
+
+            # --- Wait for the head to come due; any submit wakes us to re-check which entry is first ---
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout = delay)
+
+                except asyncio.TimeoutError:
+                    pass
+
+                continue
+
+            _, _, member, roles, attempt = heapq.heappop(self._heap)
+
+            try:
+                await member.add_roles(*roles, reason = "New member roles (retry)")
+                self._succeeded += 1
+                self.logger.info(f"Assigned role(s) {', '.join(role.name for role in roles)} to '{member.name}' on retry {attempt}")
+
+            except Exception as e:
+                if is_retryable(e) and attempt < self.max_attempts:
+                    self.submit(member, roles, attempt + 1)
+
+                else:
+                    self._given_up += 1
+                    self.logger.error(sub_divider)
+                    self.logger.error("Giving up assigning role(s) to '%s' after %d retr%s: %s", member.name, attempt, "y" if attempt == 1 else "ies", e)
+                    self.logger.error(sub_divider)
+
+    # --- Stop retrying (shutdown) ---
+    def close(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    # --- Snapshot of retry counters ---
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._heap),
+            "queued": self._queued,
+            "succeeded": self._succeeded,
+            "given_up": self._given_up,
+            "dropped": self._dropped,
+        }
@@ -1,36 +1,21 @@
 #LIBRARIES------------------------------------------------------------------------------------------------------------------------------------------|
 import json
 import yaml
-from pathlib import Path
 from typing import Dict, Any
 
 #LOCAL IMPORTS--------------------------------------------------------------------------------------------------------------------------------------|
 from core import get_logger
+from core import ConfigFile, get_config_files, snowflake
 
 # DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
 divider = f"=" * 70
 sub_divider = f"-" * 70
 
-# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
-CONFIG_DIR = Path(__file__).resolve().parent.parent.parent
-
-# (1) Bot Config Path
-BOT_PATH = CONFIG_DIR / "config" / "bot.yaml"
-
-# (2) Logger Config Path
-LOGGER_PATH = CONFIG_DIR / "config" / "logger.yaml"
-
-# (3) Permissions Config Path
-PERMISSIONS_PATH = CONFIG_DIR / "config" / "permissions.yaml"
-
-# (4) Responses Config Path
-FUN_CONFIG_PATH = CONFIG_DIR / "config" / "commands" / "fun.json"
-HELP_CONFIG_PATH = CONFIG_DIR / "config" / "commands" / "help.json"
-
 # MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
 class ConfigCheck:
-    def __init__(self):
+    def __init__(self, files: Dict[str, ConfigFile] = None):
         self.logger = get_logger()
+        self.files = files if files is not None else get_config_files()
         self.errors = []
         
     # --- Check all configuration files ---
@@ -45,8 +30,8 @@ class ConfigCheck:
         self._check_permissions_config()
         
         # --- Check JSON files ---
-        self._check_json_file(FUN_CONFIG_PATH, "fun.json")
-        self._check_json_file(HELP_CONFIG_PATH, "help.json")
+        self._check_json_file("fun.json")
+        self._check_json_file("help.json")
         
         # --- Report results ---
         if self.errors:
@@ -65,39 +50,43 @@ class ConfigCheck:
             self.logger.info("All configuration files validated successfully!")
             return True
     
-    # --- Check if a file exists ---
-    def _check_file_exists(self, path: Path, file_name: str) -> bool:
-        if not path.exists():
-            self.errors.append(f"{file_name} not found at {path}")
+    # --- Check that a file was found and parsed ---
+    def _check_parsed(self, file_name: str) -> bool:
+        source = self.files[file_name]
+
+        if isinstance(source.error, FileNotFoundError):
+            self.errors.append(f"{file_name} not found at {source.path}")
+            return False
+
+        if isinstance(source.error, yaml.YAMLError):
+            self.errors.append(f"{file_name} has invalid YAML syntax: {source.error}")
+            return False
+
+        if isinstance(source.error, json.JSONDecodeError):
+            self.errors.append(f"{file_name} has invalid JSON syntax: {source.error}")
+            return False
+
+        if source.error is not None:
+            self.errors.append(f"Error reading {file_name}: {source.error}")
             return False
+
         return True
     
-    # --- Load and parse YAML file ---
-    def _load_yaml(self, path: Path, file_name: str) -> Dict[str, Any] | None:
-        if not self._check_file_exists(path, file_name):
-            return None
-        
-        try:
-            with open(path, 'r', encoding = 'utf-8') as f:
-                data = yaml.safe_load(f)
-                
-            if data is None:
-                self.errors.append(f"{file_name} is empty")
-                return None
-                
-            return data
-        
-        except yaml.YAMLError as e:
-            self.errors.append(f"{file_name} has invalid YAML syntax: {e}")
+    # --- Parsed YAML file (from the shared config parse) ---
+    def _load_yaml(self, file_name: str) -> Dict[str, Any] | None:
+        if not self._check_parsed(file_name):
             return None
         
-        except Exception as e:
-            self.errors.append(f"Error reading {file_name}: {e}")
+        data = self.files[file_name].data
+        if data is None:
+            self.errors.append(f"{file_name} is empty")
             return None
+            
+        return data
     
     # --- Validate bot.yaml configuration ---
     def _check_bot_config(self):
-        data = self._load_yaml(BOT_PATH, "bot.yaml")
+        data = self._load_yaml("bot.yaml")
         if data is None:
             return
         
@@ -143,6 +132,179 @@ class ConfigCheck:
         if 'features' not in data:
             self.errors.append("bot.yaml: Missing 'features' section")
         
+        # --- Validate welcome section (optional) ---
+        if 'welcome' in data:
+            welcome = data['welcome']
+            if not isinstance(welcome, dict):
+                self.errors.append("bot.yaml: 'welcome' section must be a mapping")
+
+            else:
+                if 'width' in welcome and (not isinstance(welcome['width'], int) or welcome['width'] < 1):
+                    self.errors.append("bot.yaml: 'welcome.width' must be a positive integer")
+
+                if 'encoding' in welcome:
+                    encoding = welcome['encoding']
+                    valid_formats = ['auto', 'png', 'webp', 'webp_lossless', 'jpeg']
+
+                    if not isinstance(encoding, dict):
+                        self.errors.append("bot.yaml: 'welcome.encoding' must be a mapping")
+
+                    else:
+                        if 'format' in encoding and encoding['format'] not in valid_formats:
+                            self.errors.append(f"bot.yaml: Invalid welcome encoding format '{encoding['format']}'. Must be one of: {valid_formats}")
+
+                        if 'quality' in encoding and not (isinstance(encoding['quality'], int) and 1 <= encoding['quality'] <= 100):
+                            self.errors.append("bot.yaml: welcome encoding 'quality' must be an integer between 1 and 100")
+
+                if 'card' in welcome:
+                    card = welcome['card']
+                    if not isinstance(card, dict):
+                        self.errors.append("bot.yaml: 'welcome.card' must be a mapping")
+
+                    else:
+                        if 'avatar_size' in card and card['avatar_size'] not in [2 ** i for i in range(4, 13)]:
+                            self.errors.append(f"bot.yaml: Invalid welcome card avatar_size '{card['avatar_size']}'. Must be a power of 2 between 16 and 4096")
+
+                        for field in ['budget_ms', 'max_workers']:
+                            if field in card and (not isinstance(card[field], int) or card[field] < 1):
+                                self.errors.append(f"bot.yaml: 'welcome.card.{field}' must be a positive integer")
+
+                if 'burst' in welcome:
+                    burst = welcome['burst']
+                    if not isinstance(burst, dict):
+                        self.errors.append("bot.yaml: 'welcome.burst' must be a mapping")
+
+                    else:
+                        for field in ['window_seconds', 'threshold', 'max_batch']:
+                            if field in burst and (not isinstance(burst[field], (int, float)) or burst[field] <= 0):
+                                self.errors.append(f"bot.yaml: 'welcome.burst.{field}' must be a positive number")
+
+                if 'role_retry' in welcome:
+                    role_retry = welcome['role_retry']
+                    if not isinstance(role_retry, dict):
+                        self.errors.append("bot.yaml: 'welcome.role_retry' must be a mapping")
+
+                    else:
+                        for field in ['max_attempts', 'base_delay', 'max_delay']:
+                            if field in role_retry and (not isinstance(role_retry[field], (int, float)) or role_retry[field] <= 0):
+                                self.errors.append(f"bot.yaml: 'welcome.role_retry.{field}' must be a positive number")
+        
+        # --- Validate avatar section (optional) ---
+        if 'avatar' in data:
+            avatar = data['avatar']
+            if not isinstance(avatar, dict):
+                self.errors.append("bot.yaml: 'avatar' section must be a mapping")
+
+            else:
+                if 'executor' in avatar and avatar['executor'] not in ['process', 'thread']:
+                    self.errors.append(f"bot.yaml: Invalid avatar executor '{avatar['executor']}'. Must be one of: ['process', 'thread']")
+
+                if 'max_workers' in avatar and (not isinstance(avatar['max_workers'], int) or avatar['max_workers'] < 1):
+                    self.errors.append("bot.yaml: 'avatar.max_workers' must be a positive integer")
+
+                if 'source_format' in avatar and avatar['source_format'] not in ['png', 'jpg', 'jpeg', 'webp']:
+                    self.errors.append(f"bot.yaml: Invalid avatar source_format '{avatar['source_format']}'. Must be one of: ['png', 'jpg', 'jpeg', 'webp']")
+
+                if 'sizes' in avatar:
+                    valid_sizes = [2 ** i for i in range(4, 13)]
+                    if not isinstance(avatar['sizes'], dict):
+                        self.errors.append("bot.yaml: 'avatar.sizes' must be a mapping of effect -> size")
+
+                    else:
+                        for effect, size in avatar['sizes'].items():
+                            if size not in valid_sizes:
+                                self.errors.append(f"bot.yaml: Invalid avatar size '{size}' for '{effect}'. Must be one of: {valid_sizes}")
+
+                if 'encoding' in avatar:
+                    encoding = avatar['encoding']
+                    valid_formats = ['auto', 'png', 'webp', 'webp_lossless', 'jpeg']
+                    profiles = [encoding] + list((encoding.get('effects') or {}).values()) if isinstance(encoding, dict) else []
+
+                    if not isinstance(encoding, dict):
+                        self.errors.append("bot.yaml: 'avatar.encoding' must be a mapping")
+
+                    for profile in profiles:
+                        if 'format' in profile and profile['format'] not in valid_formats:
+                            self.errors.append(f"bot.yaml: Invalid avatar encoding format '{profile['format']}'. Must be one of: {valid_formats}")
+
+                        if 'quality' in profile and not (isinstance(profile['quality'], int) and 1 <= profile['quality'] <= 100):
+                            self.errors.append("bot.yaml: avatar encoding 'quality' must be an integer between 1 and 100")
+
+                        if 'compress_level' in profile and not (isinstance(profile['compress_level'], int) and 0 <= profile['compress_level'] <= 9):
+                            self.errors.append("bot.yaml: avatar encoding 'compress_level' must be an integer between 0 and 9")
+
+                if 'animated' in avatar:
+                    animated = avatar['animated']
+                    if not isinstance(animated, dict):
+                        self.errors.append("bot.yaml: 'avatar.animated' must be a mapping")
+
+                    else:
+                        if 'format' in animated and animated['format'] not in ['webp', 'gif']:
+                            self.errors.append(f"bot.yaml: Invalid animated avatar format '{animated['format']}'. Must be one of: ['webp', 'gif']")
+
+                        for field in ['size', 'max_frames', 'max_duration_ms', 'decimate']:
+                            if field in animated and (not isinstance(animated[field], int) or animated[field] < 1):
+                                self.errors.append(f"bot.yaml: 'avatar.animated.{field}' must be a positive integer")
+
+                if 'cache' in avatar and not isinstance(avatar['cache'], dict):
+                    self.errors.append("bot.yaml: 'avatar.cache' must be a mapping")
+
+                if 'queue' in avatar:
+                    queue = avatar['queue']
+                    if not isinstance(queue, dict):
+                        self.errors.append("bot.yaml: 'avatar.queue' must be a mapping")
+
+                    else:
+                        if 'slots' in queue and (not isinstance(queue['slots'], int) or queue['slots'] < 1):
+                            self.errors.append("bot.yaml: 'avatar.queue.slots' must be a positive integer")
+
+                        if 'max_queue' in queue and (not isinstance(queue['max_queue'], int) or queue['max_queue'] < 0):
+                            self.errors.append("bot.yaml: 'avatar.queue.max_queue' must be a non-negative integer")
+        
+        # --- Validate assets section (optional) ---
+        if 'assets' in data:
+            assets = data['assets']
+            if not isinstance(assets, dict):
+                self.errors.append("bot.yaml: 'assets' section must be a mapping")
+
+            elif 'refresh_seconds' in assets and (not isinstance(assets['refresh_seconds'], (int, float)) or assets['refresh_seconds'] < 0):
+                self.errors.append("bot.yaml: 'assets.refresh_seconds' must be a non-negative number")
+        
+        # --- Validate attachment_cache section (optional) ---
+        if 'attachment_cache' in data:
+            attachment_cache = data['attachment_cache']
+            if not isinstance(attachment_cache, dict):
+                self.errors.append("bot.yaml: 'attachment_cache' section must be a mapping")
+
+            else:
+                if attachment_cache.get('enabled') and not str(attachment_cache.get('channel_id', '')).isdigit():
+                    self.errors.append("bot.yaml: 'attachment_cache.channel_id' must be a channel ID when the cache is enabled")
+
+                if 'refresh_margin_seconds' in attachment_cache and (not isinstance(attachment_cache['refresh_margin_seconds'], (int, float)) or attachment_cache['refresh_margin_seconds'] < 0):
+                    self.errors.append("bot.yaml: 'attachment_cache.refresh_margin_seconds' must be a non-negative number")
+        
+        # --- Validate http section (optional) ---
+        if 'http' in data:
+            http = data['http']
+            if not isinstance(http, dict):
+                self.errors.append("bot.yaml: 'http' section must be a mapping")
+
+            else:
+                for field in ['limit', 'limit_per_host', 'connect_timeout', 'read_timeout', 'keepalive_timeout']:
+                    if field in http and (not isinstance(http[field], (int, float)) or http[field] <= 0):
+                        self.errors.append(f"bot.yaml: 'http.{field}' must be a positive number")
+        
+        # --- Validate config_watch section (optional) ---
+        if 'config_watch' in data:
+            config_watch = data['config_watch']
+            if not isinstance(config_watch, dict):
+                self.errors.append("bot.yaml: 'config_watch' section must be a mapping")
+
+            else:
+                for field in ['poll_seconds', 'debounce_ms']:
+                    if field in config_watch and (not isinstance(config_watch[field], (int, float)) or config_watch[field] < 0):
+                        self.errors.append(f"bot.yaml: 'config_watch.{field}' must be a non-negative number")
+        
         # --- Check intents section ---
         if 'intents' not in data:
             self.errors.append("bot.yaml: Missing 'intents' section")
@@ -157,7 +319,7 @@ class ConfigCheck:
     
     # --- Validate logger.yaml configuration ---
     def _check_logger_config(self):
-        data = self._load_yaml(LOGGER_PATH, "logger.yaml")
+        data = self._load_yaml("logger.yaml")
         if data is None:
             return
         
@@ -199,17 +361,85 @@ class ConfigCheck:
                 valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
                 if file['level'] not in valid_levels:
                     self.errors.append(f"logger.yaml: Invalid file log level '{file['level']}'")
+            
+            # --- Validate rotation and retention ---
+            rotation = file.get('rotation', {})
+            if not isinstance(rotation, dict):
+                self.errors.append("logger.yaml: 'file.rotation' must be a mapping")
+
+            else:
+                for field in ['max_bytes', 'backup_count', 'max_age_days', 'max_total_mb']:
+                    if field in rotation and (not isinstance(rotation[field], (int, float)) or rotation[field] < 0):
+                        self.errors.append(f"logger.yaml: 'file.rotation.{field}' must be a non-negative number")
         
         # --- Check format section ---
         if 'format' not in data:
             self.errors.append("logger.yaml: Missing 'format' section")
+
+        elif not isinstance(data['format'], dict):
+            self.errors.append("logger.yaml: 'format' section must be a mapping (set 'format.style: json' for JSON log lines)")
+
+        elif 'style' in data['format'] and data['format']['style'] not in ['text', 'json']:
+            self.errors.append(f"logger.yaml: Invalid format style '{data['format']['style']}'. Must be one of: ['text', 'json']")
         
+        # --- Validate queue section (optional) ---
+        if 'queue' in data:
+            log_queue = data['queue']
+            if not isinstance(log_queue, dict):
+                self.errors.append("logger.yaml: 'queue' section must be a mapping")
+
+            else:
+                if 'max_size' in log_queue and (not isinstance(log_queue['max_size'], int) or log_queue['max_size'] < 1):
+                    self.errors.append("logger.yaml: 'queue.max_size' must be a positive integer")
+
+                if 'overflow' in log_queue and log_queue['overflow'] not in ['drop_oldest', 'drop_new', 'block']:
+                    self.errors.append(f"logger.yaml: Invalid queue overflow policy '{log_queue['overflow']}'. Must be one of: ['drop_oldest', 'drop_new', 'block']")
+
+                for field in ['block_timeout_ms', 'flush_interval_ms']:
+                    if field in log_queue and (not isinstance(log_queue[field], (int, float)) or log_queue[field] < 0):
+                        self.errors.append(f"logger.yaml: 'queue.{field}' must be a non-negative number")
+        
+        # --- Validate dedup section (optional) ---
+        if 'dedup' in data:
+            dedup = data['dedup']
+            if not isinstance(dedup, dict):
+                self.errors.append("logger.yaml: 'dedup' section must be a mapping")
+
+            else:
+                valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+                if 'min_level' in dedup and dedup['min_level'] not in valid_levels:
+                    self.errors.append(f"logger.yaml: Invalid dedup min_level '{dedup['min_level']}'")
+
+                if 'window_seconds' in dedup and (not isinstance(dedup['window_seconds'], (int, float)) or dedup['window_seconds'] <= 0):
+                    self.errors.append("logger.yaml: 'dedup.window_seconds' must be a positive number")
+
+                if 'max_keys' in dedup and (not isinstance(dedup['max_keys'], int) or dedup['max_keys'] < 1):
+                    self.errors.append("logger.yaml: 'dedup.max_keys' must be a positive integer")
+
+                sampling = dedup.get('sampling') or {}
+                if not isinstance(sampling, dict):
+                    self.errors.append("logger.yaml: 'dedup.sampling' must be a mapping")
+
+                else:
+                    for group in ['levels', 'loggers']:
+                        ratios = sampling.get(group) or {}
+                        if not isinstance(ratios, dict):
+                            self.errors.append(f"logger.yaml: 'dedup.sampling.{group}' must be a mapping")
+                            continue
+
+                        for name, ratio in ratios.items():
+                            if group == 'levels' and str(name).upper() not in valid_levels:
+                                self.errors.append(f"logger.yaml: Invalid sampling level '{name}'")
+
+                            if not isinstance(ratio, (int, float)) or isinstance(ratio, bool) or not 0 <= ratio <= 1:
+                                self.errors.append(f"logger.yaml: 'dedup.sampling.{group}.{name}' must be a number between 0 and 1")
+
         if not self.errors or not any("logger.yaml" in e for e in self.errors):
             self.logger.info("logger.yaml is valid")
     
     # --- Validate permissions.yaml configuration ---
     def _check_permissions_config(self):
-        data = self._load_yaml(PERMISSIONS_PATH, "permissions.yaml")
+        data = self._load_yaml("permissions.yaml")
         if data is None:
             return
         
@@ -230,6 +460,11 @@ class ConfigCheck:
 
                 elif len(roles[role]) == 0:
                     self.errors.append(f"permissions.yaml: Role '{role}' cannot be empty")
+
+                else:
+                    for entry in roles[role]:
+                        if snowflake(entry) is None:
+                            self.logger.warning(f"permissions.yaml: '{entry}' in '{role}' is not a role ID and will be ignored")
         
         # --- Check channel IDs ---
         if 'mod_logs' not in data:
@@ -248,26 +483,16 @@ class ConfigCheck:
             self.logger.info("permissions.yaml is valid")
     
     # --- Check if JSON file exists and is valid ---
-    def _check_json_file(self, path: Path, file_name: str):
-        if not self._check_file_exists(path, file_name):
+    def _check_json_file(self, file_name: str):
+        if not self._check_parsed(file_name):
             return
         
-        try:
-            with open(path, 'r', encoding = 'utf-8') as f:
-                data = json.load(f)
-                
-            if data is None:
-                self.errors.append(f"{file_name} is empty")
-            else:
-                self.logger.info(f"{file_name} is valid")
-                
-        except json.JSONDecodeError as e:
-            self.errors.append(f"{file_name} has invalid JSON syntax: {e}")
-
-        except Exception as e:
-            self.errors.append(f"Error reading {file_name}: {e}")
+        if self.files[file_name].data is None:
+            self.errors.append(f"{file_name} is empty")
+        else:
+            self.logger.info(f"{file_name} is valid")
 
 # HELPER FUNCTION TO RUN VALIDATION ----------------------------------------------------------------------------------------------------------------|
-def validate_configs() -> bool:
-    checker = ConfigCheck()
+def validate_configs(files: Dict[str, ConfigFile] = None) -> bool:
+    checker = ConfigCheck(files)
     return checker.check_all()
@@ -0,0 +1,25 @@
+from .effects import render_effect, render_effects, warm_render_caches
+from .animation import render_animated_effects
+from .encoder import encode_image, sniff_extension
+from .executor import RenderExecutor
+from .cache import RenderCache
+from .singleflight import SingleFlight
+from .admission import RenderQueue
+from .variants import build_variant, VariantCache
+from .welcome_card import render_welcome_card
+
+__all__ = [
+    "render_effect",
+    "render_effects",
+    "warm_render_caches",
+    "render_animated_effects",
+    "encode_image",
+    "sniff_extension",
+    "RenderExecutor",
+    "RenderCache",
+    "SingleFlight",
+    "RenderQueue",
+    "build_variant",
+    "VariantCache",
+    "render_welcome_card"
+]
@@ -0,0 +1,117 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import asyncio
+from typing import Deque, Optional
+from collections import deque
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Place in the render queue, used as "async with ticket:" around the work
+class RenderTicket:
+    def __init__(self, queue: "RenderQueue", waiter: Optional[asyncio.Future]):
+        self._queue = queue
+        self._waiter = waiter
+
+    # --- 0 when the ticket already holds a slot, otherwise 1-based place in line ---
+    @property
+    def position(self) -> int:
+        return self._queue._position(self._waiter)
+
+    async def __aenter__(self) -> "RenderTicket":
+        if self._waiter is not None:
+            try:
+                await self._waiter
+
+            except asyncio.CancelledError:
+                self._queue._abandon(self._waiter)
+                raise
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._queue._release()
+
+    # --- Give the place back without running (e.g. the request failed before its turn) ---
+    def discard(self):
+        if self._waiter is None:
+            self._queue._release()
+
+        else:
+            self._queue._abandon(self._waiter)
+
+# (2) Bounded render queue: a fixed number of worker slots plus a capped waiting line
+class RenderQueue:
+    def __init__(self, slots: int = 2, max_queue: int = 10):
+        self.slots = max(1, int(slots))
+        self.max_queue = max(0, int(max_queue))
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+        # --- Counters ---
+        self._admitted = 0
+        self._rejected = 0
+        self._peak_waiting = 0
+
+    # --- Jobs waiting for a slot ---
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    # --- Admit a job, or return None when every slot and queue place is taken ---
+    def try_enter(self) -> Optional[RenderTicket]:
+        if self._active < self.slots and not self._waiters:
+            self._active += 1
+            self._admitted += 1
+            return RenderTicket(self, None)
+
+        if len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            return None
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._admitted += 1
+        self._peak_waiting = max(self._peak_waiting, len(self._waiters))
+        return RenderTicket(self, waiter)
+
+    # --- Place of a waiter in line ---
+    def _position(self, waiter: Optional[asyncio.Future]) -> int:
+        if waiter is None or waiter.done():
+            return 0
+
+        try:
+            return self._waiters.index(waiter) + 1
+
+        except ValueError:
+            return 0
+
+    # --- Free a slot and hand it straight to the next waiter ---
+    def _release(self):
+        self._active -= 1
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+                break
+
+    # --- A waiting job was cancelled ---
+    def _abandon(self, waiter: asyncio.Future):
+        try:
+            self._waiters.remove(waiter)
+
+        except ValueError:
+            # --- The slot was already handed over; give it back ---
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+
+    # --- Snapshot of queue counters ---
+    def stats(self) -> dict:
+        return {
+            "slots": self.slots,
+            "active": self._active,
+            "waiting": len(self._waiters),
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+            "peak_waiting": self._peak_waiting,
+        }
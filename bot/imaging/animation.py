@@ -0,0 +1,85 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import io
+import time
+from PIL import Image, ImageSequence
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .effects import to_rgb, fit_to_size, apply_effects, render_effects
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+DEFAULT_ANIMATION = {
+    "format": "webp",            # webp, gif
+    "max_frames": 120,           # Frames kept after decimation; the rest of the animation is cut
+    "max_duration_ms": 10000,    # Playback time kept; the rest of the animation is cut
+    "decimate": 1,               # Keep every Nth frame (dropped frames' time is added to the kept one)
+    "quality": 80,               # WebP quality
+}
+
+MIN_FRAME_MS = 20                # Browsers clamp shorter GIF delays, so never emit less than this
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Render an effect chain over every frame of an animated GIF/WebP (runs inside a render worker): (encoded bytes, encode time in ms)
+def render_animated_effects(image_data: bytes, effects: list, target_size: int = 0, animation: dict = None, encoding: dict = None) -> tuple:
+    options = {**DEFAULT_ANIMATION, **(animation or {})}
+    source = Image.open(io.BytesIO(image_data))
+
+    # --- Not actually animated: use the static pipeline (and the static encoding profile) ---
+    if not getattr(source, "is_animated", False):
+        return render_effects(image_data, effects, target_size, encoding)
+
+    decimate = max(1, int(options["decimate"]))
+    frames = []
+    durations = []
+    elapsed = 0
+
+    # --- Decode one source frame at a time; only processed, size-capped frames are kept ---
+    for index, frame in enumerate(ImageSequence.Iterator(source)):
+        duration = int(frame.info.get("duration", 100) or 100)
+
+        if elapsed >= options["max_duration_ms"]:
+            break
+
+        elapsed += duration
+
+        # --- Dropped frames lend their time to the last kept frame so playback speed is unchanged ---
+        if index % decimate and durations:
+            durations[-1] += duration
+            continue
+
+        if len(frames) >= options["max_frames"]:
+            break
+
+        img = apply_effects(fit_to_size(to_rgb(frame), target_size), effects)
+        frames.append(img.convert("P", palette = Image.ADAPTIVE) if options["format"] == "gif" else img)
+        durations.append(duration)
+
+    durations = [max(MIN_FRAME_MS, value) for value in durations]
+
+    # --- Encode every kept frame into one animated file ---
+    start = time.perf_counter()
+    output = io.BytesIO()
+    if options["format"] == "gif":
+        frames[0].save(
+            output,
+            format = "GIF",
+            save_all = True,
+            append_images = frames[1:],
+            duration = durations,
+            loop = 0,
+            optimize = False,
+            disposal = 1
+        )
+
+    else:
+        frames[0].save(
+            output,
+            format = "WEBP",
+            save_all = True,
+            append_images = frames[1:],
+            duration = durations,
+            loop = 0,
+            quality = options["quality"],
+            method = 4
+        )
+
+    return output.getvalue(), (time.perf_counter() - start) * 1000
@@ -0,0 +1,147 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import os
+import json
+import asyncio
+import hashlib
+import threading
+from pathlib import Path
+from typing import Optional
+from collections import OrderedDict
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+class RenderCache:
+    def __init__(self, max_bytes: int, disk_dir: Optional[Path] = None, disk_max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+
+        # --- Memory tier (LRU, bounded by total bytes) ---
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+
+        # --- Disk tier (survives restarts) ---
+        self._disk_lock = threading.Lock()
+        self._disk_size = 0
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents = True, exist_ok = True)
+            self._disk_size = sum(f.stat().st_size for f in self.disk_dir.glob("*.bin"))
+
+        # --- Counters ---
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._disk_evictions = 0
+
+    # --- Cache key for one rendered avatar (settings that change the output bytes are hashed in, so editing them re-renders) ---
+    @staticmethod
+    def make_key(avatar_hash: str, effect: str, size: int, settings: Optional[dict] = None) -> str:
+        digest = hashlib.sha256(json.dumps(settings or {}, sort_keys = True, default = str).encode("utf-8")).hexdigest()[:12]
+        return f"{avatar_hash}_{effect}_{size}_{digest}"
+
+    # --- Render held in the memory tier (no counters, no LRU update) ---
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    # --- Look up a render (memory first, then disk) ---
+    async def get(self, key: str) -> Optional[bytes]:
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return data
+
+        if self.disk_dir is not None:
+            data = await asyncio.to_thread(self._read_disk, key)
+            if data is not None:
+                self._disk_hits += 1
+                self._remember(key, data)
+                return data
+
+        self._misses += 1
+        return None
+
+    # --- Store a render in both tiers ---
+    async def put(self, key: str, data: bytes):
+        self._remember(key, data)
+
+        if self.disk_dir is not None:
+            await asyncio.to_thread(self._write_disk, key, data)
+
+    # --- Insert into the memory tier and evict least recently used entries ---
+    def _remember(self, key: str, data: bytes):
+        if len(data) > self.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+
+        self._entries[key] = data
+        self._size += len(data)
+
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last = False)
+            self._size -= len(evicted)
+            self._evictions += 1
+
+    # --- Disk helpers (run in a worker thread) ---
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.bin"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+            return data
+
+        except FileNotFoundError:
+            return None
+
+    def _write_disk(self, key: str, data: bytes):
+        path = self._disk_path(key)
+
+        with self._disk_lock:
+            if path.exists():
+                return
+
+            # --- Write atomically so a crash never leaves a truncated render behind ---
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._disk_size += len(data)
+
+            if self.disk_max_bytes and self._disk_size > self.disk_max_bytes:
+                self._prune_disk()
+
+    # --- Drop the oldest files until the disk tier is back under 90% of its limit ---
+    def _prune_disk(self):
+        files = sorted(self.disk_dir.glob("*.bin"), key = lambda f: f.stat().st_mtime)
+        target = int(self.disk_max_bytes * 0.9)
+
+        for file in files:
+            if self._disk_size <= target:
+                break
+
+            try:
+                size = file.stat().st_size
+                file.unlink()
+                self._disk_size -= size
+                self._disk_evictions += 1
+
+            except FileNotFoundError:
+                continue
+
+    # --- Snapshot of cache counters ---
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self._hits,
+            "disk_hits": self._disk_hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "disk_bytes": self._disk_size,
+            "disk_evictions": self._disk_evictions,
+        }
@@ -0,0 +1,194 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import io
+import time
+from functools import lru_cache
+from PIL import Image, ImageFilter, ImageEnhance, ImageOps, ImageDraw
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .pointops import is_point_effect, apply_point_effect, compile_point_ops, apply_point_ops
+from .encoder import encode_image
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+PRO_ENHANCE_SIZE = (512, 512)        # pro_enhance output size
+
+PRO_ENHANCE_UNSHARP = ImageFilter.UnsharpMask(radius = 1.6, percent = 110, threshold = 4)     # Macro clarity kernel
+
+# SIZE-ONLY ARTIFACTS (cached per worker) ----------------------------------------------------------------------------------------------------------|
+# (1) Soft cinematic vignette mask: an ellipse blurred with a radius-90 Gaussian
+@lru_cache(maxsize = 8)
+def _vignette_mask(size: tuple) -> Image.Image:
+    width, height = size
+    vignette = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(vignette)
+
+    draw.ellipse((-width * 0.15, -height * 0.15, width * 1.15, height * 1.15), fill = 0)
+    return vignette.filter(ImageFilter.GaussianBlur(90))
+
+# (2) Solid black layer the vignette fades into
+@lru_cache(maxsize = 8)
+def _black_layer(size: tuple) -> Image.Image:
+    return Image.new("RGB", size, (0, 0, 0))
+
+# (3) Build the artifacts for the default pro_enhance size (used as a render worker initializer)
+def warm_render_caches():
+    _vignette_mask(PRO_ENHANCE_SIZE)
+    _black_layer(PRO_ENHANCE_SIZE)
+
+# DECODING -----------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Flatten any mode to RGB (transparent pixels land on white)
+def to_rgb(img: Image.Image) -> Image.Image:
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+
+        background.paste(img, mask = img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+
+    return img
+
+# (2) Shrink an image so its longest side is at most target_size
+def fit_to_size(img: Image.Image, target_size: int) -> Image.Image:
+    if not target_size:
+        return img
+
+    # --- Cheap integer box reduction first, then a precise resize for whatever is left ---
+    factor = min(img.size) // target_size
+    if factor >= 2:
+        img = img.reduce(factor)
+
+    if max(img.size) > target_size:
+        scale = target_size / max(img.size)
+        img = img.resize((max(1, round(img.width * scale)), max(1, round(img.height * scale))), Image.LANCZOS)
+
+    return img
+
+# (3) Decode an avatar no larger than it will be rendered
+def _decode(image_data: bytes, target_size: int = 0) -> Image.Image:
+    img = Image.open(io.BytesIO(image_data))
+
+    # --- JPEG: let the decoder work at a reduced DCT scale (must happen before load) ---
+    if target_size and img.format == "JPEG":
+        img.draft("RGB", (target_size, target_size))
+
+    return fit_to_size(to_rgb(img), target_size)
+
+# EFFECTS ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Apply one named effect to a decoded RGB image
+def apply_effect(img: Image.Image, filter_name: str) -> Image.Image:
+    # --- Tone and colour effects (grayscale, sepia, invert, brightness, contrast, colour) run as one LUT/matrix pass ---
+    if is_point_effect(filter_name):
+        img = apply_point_effect(img, filter_name)
+
+    # (1) Applies a basic blur effect
+    elif filter_name == "blur":
+        img = img.filter(ImageFilter.BLUR)
+
+    # (2) Outlines edges in the image
+    elif filter_name == "contour":
+        img = img.filter(ImageFilter.CONTOUR)
+
+    # (3) Enhance fine details
+    elif filter_name == "detail":
+        img = img.filter(ImageFilter.DETAIL)
+
+    # (4) Sharpens the edges moderately
+    elif filter_name == "edge_enhance":
+        img = img.filter(ImageFilter.EDGE_ENHANCE)
+
+    # (5) Aggresive edge sharpening
+    elif filter_name == "edge_enhance_more":
+        img = img.filter(ImageFilter.EDGE_ENHANCE_MORE)
+
+    # (6) Create a 3D raised/curved effect
+    elif filter_name == "emboss":
+        img = img.filter(ImageFilter.EMBOSS)
+
+    # (7) Detects and highlights all edges
+    elif filter_name == "find_edges":
+        img = img.filter(ImageFilter.FIND_EDGES)
+
+    # (8) Makes the entire image crisper
+    elif filter_name == "sharpen":
+        img = img.filter(ImageFilter.SHARPEN)
+
+    # (9) Light smoothing effect
+    elif filter_name == "smooth":
+        img = img.filter(ImageFilter.SMOOTH)
+
+    # (10) Stronger smoothing
+    elif filter_name == "smooth_more":
+        img = img.filter(ImageFilter.SMOOTH_MORE)
+
+    # (11) Give the avatar an artistic touch
+    elif filter_name == "pro_enhance":
+        # --- Resize for consistency ---
+        img = img.resize(PRO_ENHANCE_SIZE, Image.LANCZOS)
+
+        # --- Smart contrast & exposure ---
+        img = ImageOps.autocontrast(img, cutoff = 1)
+
+        # --- Macro clarity ---
+        img = img.filter(PRO_ENHANCE_UNSHARP)
+
+        # --- Gentle brightness & contrast ---
+        img = ImageEnhance.Brightness(img).enhance(1.04)
+        img = ImageEnhance.Contrast(img).enhance(1.12)
+
+        # --- Skin-sade color boost ---
+        img = ImageEnhance.Color(img).enhance(1.15)
+
+        # --- Potrait look ---
+        img = img.filter(ImageFilter.SMOOTH)
+
+        # --- Soft cinematic vignette (mask and black layer depend only on size, so they are cached) ---
+        img = Image.composite(_black_layer(img.size), img, _vignette_mask(img.size))
+
+    return img
+
+# PIPELINE -----------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Split an ordered effect chain into stages; runs of adjacent point effects become one fused stage
+def plan_effects(effects: list) -> list:
+    stages = []
+
+    for name in effects:
+        if is_point_effect(name) and stages and stages[-1][0] == "point":
+            stages[-1][1].append(name)
+
+        elif is_point_effect(name):
+            stages.append(("point", [name]))
+
+        else:
+            stages.append(("filter", name))
+
+    return stages
+
+# (2) Apply an ordered effect chain to a decoded RGB image
+def apply_effects(img: Image.Image, effects: list) -> Image.Image:
+    for kind, spec in plan_effects(effects):
+        if kind == "point":
+            img = apply_point_ops(img, compile_point_ops(spec))
+
+        else:
+            img = apply_effect(img, spec)
+
+    return img
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Decode once, run an effect chain and encode once (runs inside a render worker, never on the event loop).
+#     Returns (encoded bytes, encode time in ms); the time covers the encoder alone, not decode, filters or pool wait.
+def render_effects(image_data: bytes, effects: list, target_size: int = 0, encoding: dict = None) -> tuple:
+    img = _decode(image_data, target_size)
+    img = apply_effects(img, effects)
+
+    # --- Encode with the chain's output profile ---
+    start = time.perf_counter()
+    data = encode_image(img, encoding)
+    return data, (time.perf_counter() - start) * 1000
+
+# (2) Decode, filter and encode an avatar with a single effect: (encoded bytes, encode time in ms)
+def render_effect(image_data: bytes, filter_name: str, target_size: int = 0, encoding: dict = None) -> tuple:
+    return render_effects(image_data, [filter_name], target_size, encoding)
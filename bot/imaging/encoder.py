@@ -0,0 +1,84 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import io
+from PIL import Image
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+VALID_FORMATS = ("auto", "png", "webp", "webp_lossless", "jpeg")    # Supported output formats
+
+FLAT_COLOR_LIMIT = 64                      # "auto": images with this many colours or fewer are flat artwork
+FALLBACK_QUALITIES = (80, 70, 55, 40)      # Qualities tried in order when an encode exceeds max_bytes
+
+DEFAULT_ENCODING = {
+    "format": "auto",
+    "quality": 90,
+    "compress_level": 6,
+    "max_bytes": 0,
+}
+
+# ENCODERS -----------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Save an image with one concrete format and quality
+def _save(img: Image.Image, fmt: str, quality: int, compress_level: int) -> bytes:
+    output = io.BytesIO()
+
+    if fmt == "png":
+        img.save(output, format = "PNG", compress_level = compress_level)
+
+    elif fmt == "webp":
+        img.save(output, format = "WEBP", quality = quality, method = 4)
+
+    elif fmt == "webp_lossless":
+        img.save(output, format = "WEBP", lossless = True, quality = 50, method = 2)
+
+    else:
+        img.convert("RGB").save(output, format = "JPEG", quality = quality, optimize = True, progressive = True)
+
+    return output.getvalue()
+
+# (2) Pick a concrete format for "auto": flat artwork compresses best losslessly, photos as lossy WebP
+def _choose_format(img: Image.Image, fmt: str) -> str:
+    if fmt != "auto":
+        return fmt
+
+    if img.getcolors(maxcolors = FLAT_COLOR_LIMIT) is not None:
+        return "png"
+
+    return "webp"
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Encode a rendered image according to an encoding profile (see DEFAULT_ENCODING)
+def encode_image(img: Image.Image, encoding: dict = None) -> bytes:
+    profile = {**DEFAULT_ENCODING, **(encoding or {})}
+
+    fmt = _choose_format(img, profile["format"])
+    data = _save(img, fmt, profile["quality"], profile["compress_level"])
+
+    # --- Size ceiling: step down through lossy qualities until the output fits ---
+    max_bytes = profile["max_bytes"]
+    if max_bytes and len(data) > max_bytes:
+        lossy_format = fmt if fmt in ("webp", "jpeg") else "webp"
+
+        for quality in FALLBACK_QUALITIES:
+            if quality >= profile["quality"] and lossy_format == fmt:
+                continue
+
+            data = _save(img, lossy_format, quality, profile["compress_level"])
+            if len(data) <= max_bytes:
+                break
+
+    return data
+
+# (2) File extension for encoded bytes, read from the format's magic number
+def sniff_extension(data: bytes) -> str:
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "webp"
+
+    if data[:3] == b"\xff\xd8\xff":
+        return "jpg"
+
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+
+    return "png"
@@ -0,0 +1,100 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import asyncio
+import threading
+import multiprocessing
+from typing import Callable, Any, Optional
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+VALID_KINDS = ("process", "thread")  # Supported executor backends
+
+# HELPERS ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Start workers from a clean process: by the time the pool starts, the bot already runs logging, compressor and to_thread threads,
+#     and forking a multi-threaded process can hand the child a lock some other thread was holding.
+#     The fork server preloads only the imaging package, not the bot's __main__, so it stays single-threaded.
+def _process_context():
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("spawn")
+
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["imaging"])
+    return ctx
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+class RenderExecutor:
+    def __init__(self, kind: str = "process", max_workers: int = 2, initializer: Optional[Callable[[], None]] = None):
+        if kind not in VALID_KINDS:
+            raise ValueError(f"Invalid render executor '{kind}'. Must be one of: {list(VALID_KINDS)}")
+
+        self.kind = kind
+        self.max_workers = max(1, int(max_workers))
+        self.initializer = initializer
+        self._executor = self._build_executor()
+
+        # --- Counters (jobs finish on worker/pool threads, so updates take the lock) ---
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+
+    # --- Build the underlying pool ---
+    def _build_executor(self) -> Executor:
+        if self.kind == "process":
+            return ProcessPoolExecutor(max_workers = self.max_workers, mp_context = _process_context(), initializer = self.initializer)
+
+        return ThreadPoolExecutor(max_workers = self.max_workers, thread_name_prefix = "render", initializer = self.initializer)
+
+    # --- Jobs submitted and not yet finished ---
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    # --- Jobs waiting for a free worker ---
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self._in_flight - self.max_workers)
+
+    # --- Run a picklable function (bytes in, bytes out) off the event loop ---
+    #     A caller that stops waiting (e.g. asyncio.wait_for timeout) only drops its await: a job a worker already started
+    #     keeps counting as in flight until the worker actually finishes it
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        with self._lock:
+            self._in_flight += 1
+
+        try:
+            future = self._executor.submit(func, *args)
+
+        except Exception:
+            self._job_done(None)
+            raise
+
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
+
+    # --- Done callback of the pool future (a job cancelled before it started never ran and counts as neither) ---
+    def _job_done(self, future: Optional[Future]):
+        with self._lock:
+            self._in_flight -= 1
+            if future is None or future.cancelled():
+                return
+
+            if future.exception() is None:
+                self._completed += 1
+
+            else:
+                self._failed += 1
+
+    # --- Snapshot of executor counters ---
+    def stats(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.max_workers,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self._completed,
+            "failed": self._failed,
+        }
+
+    # --- Stop accepting work and release the workers ---
+    def shutdown(self):
+        self._executor.shutdown(wait = False, cancel_futures = True)
@@ -0,0 +1,173 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+from functools import lru_cache
+from PIL import Image
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+LUMA = (0.299, 0.587, 0.114)  # ITU-R 601 weights, the same ones Image.convert("L") uses
+
+GRAYSCALE_MATRIX = LUMA + (0.0,) + LUMA + (0.0,) + LUMA + (0.0,)
+
+# POINT-OP DEFINITIONS -----------------------------------------------------------------------------------------------------------------------------|
+# Every effect compiles to one of three stage kinds, each applied in a single C-level pass:
+#   ("matrix", m)     -> 12-float colour matrix for Image.convert("RGB", m)
+#   ("lut", table)    -> 768-entry lookup table for Image.point
+#   ("contrast", f)   -> lookup table built from the image's mean gray level at apply time
+POINT_EFFECTS = {
+    "grayscale": ("matrix", "grayscale"),
+    "sepia": ("matrix", "sepia"),
+    "saturate": ("matrix", 2.0),
+    "desaturate": ("matrix", 0.3),
+    "invert": ("lut", "invert"),
+    "brighten": ("lut", 1.5),
+    "darken": ("lut", 0.6),
+    "high_contrast": ("contrast", 2.0),
+    "low_contrast": ("contrast", 0.5),
+}
+
+# MATRIX BUILDERS ----------------------------------------------------------------------------------------------------------------------------------|
+# (1) Colour matrix for a named tone or a saturation factor
+@lru_cache(maxsize = None)
+def _build_matrix(spec) -> tuple:
+    r, g, b = LUMA
+
+    # --- Every channel becomes the luma ---
+    if spec == "grayscale":
+        return GRAYSCALE_MATRIX
+
+    # --- Luma tinted brown (gray, gray * 0.95, gray * 0.82) ---
+    if spec == "sepia":
+        return (
+            r, g, b, 0.0,
+            r * 0.95, g * 0.95, b * 0.95, 0.0,
+            r * 0.82, g * 0.82, b * 0.82, 0.0,
+        )
+
+    # --- Saturation: blend every channel with the luma (same maths as ImageEnhance.Color) ---
+    factor = float(spec)
+    inverse = 1.0 - factor
+    return (
+        factor + inverse * r, inverse * g, inverse * b, 0.0,
+        inverse * r, factor + inverse * g, inverse * b, 0.0,
+        inverse * r, inverse * g, factor + inverse * b, 0.0,
+    )
+
+# (2) Compose two colour matrices (first applied, then second)
+def _compose_matrices(first: tuple, second: tuple) -> tuple:
+    result = []
+    for row in range(3):
+        a = second[row * 4: row * 4 + 4]
+        for col in range(3):
+            result.append(sum(a[k] * first[k * 4 + col] for k in range(3)))
+
+        result.append(sum(a[k] * first[k * 4 + 3] for k in range(3)) + a[3])
+
+    return tuple(result)
+
+# LUT BUILDERS -------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Lookup table for a named curve or a brightness factor
+@lru_cache(maxsize = None)
+def _build_lut(spec) -> tuple:
+    # --- Reverse every channel ---
+    if spec == "invert":
+        return tuple(255 - v for v in range(256)) * 3
+
+    # --- Brightness: scale towards black (same maths as ImageEnhance.Brightness) ---
+    factor = float(spec)
+    return tuple(min(255, max(0, int(v * factor))) for v in range(256)) * 3
+
+# (2) Contrast table around a mean gray level (same maths as ImageEnhance.Contrast)
+@lru_cache(maxsize = 2048)
+def _build_contrast_lut(factor: float, mean: int) -> tuple:
+    return tuple(min(255, max(0, int(mean + (v - mean) * factor))) for v in range(256)) * 3
+
+# (3) Compose two lookup tables (first applied, then second)
+def _compose_luts(first: tuple, second: tuple) -> tuple:
+    return tuple(second[band * 256 + first[band * 256 + v]] for band in range(3) for v in range(256))
+
+# (4) Mean gray level of an image after an optional pending LUT, taken from its per-band histograms
+def _mean_gray(img: Image.Image, lut: tuple = None) -> int:
+    histogram = img.histogram()
+    total = (img.width * img.height) or 1
+    mean = 0.0
+
+    for band, weight in enumerate(LUMA):
+        counts = histogram[band * 256: band * 256 + 256]
+        values = lut[band * 256: band * 256 + 256] if lut is not None else range(256)
+        mean += weight * sum(count * value for count, value in zip(counts, values)) / total
+
+    return int(mean + 0.5)
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Check if an effect is handled by the point-op engine
+def is_point_effect(name: str) -> bool:
+    return name in POINT_EFFECTS
+
+# (2) Compile an ordered list of point effects into stages, merging neighbours of the same kind
+def compile_point_ops(effects: list) -> list:
+    return list(_compile_point_ops(tuple(effects)))
+
+@lru_cache(maxsize = 256)
+def _compile_point_ops(effects: tuple) -> tuple:
+    stages = []
+
+    for name in effects:
+        kind, spec = POINT_EFFECTS[name]
+
+        if kind == "matrix":
+            stage = ("matrix", _build_matrix(spec))
+
+        elif kind == "lut":
+            stage = ("lut", _build_lut(spec))
+
+        else:
+            stage = ("contrast", float(spec))
+
+        # --- Fuse with the previous stage when both are static and of the same kind ---
+        if stages and stages[-1][0] == stage[0] == "matrix":
+            stages[-1] = ("matrix", _compose_matrices(stages[-1][1], stage[1]))
+
+        elif stages and stages[-1][0] == stage[0] == "lut":
+            stages[-1] = ("lut", _compose_luts(stages[-1][1], stage[1]))
+
+        else:
+            stages.append(stage)
+
+    return tuple(stages)
+
+# (3) Apply compiled stages to an RGB image
+def apply_point_ops(img: Image.Image, stages: list) -> Image.Image:
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+
+    # --- LUT and contrast stages accumulate into one pending table; only a matrix forces a pass ---
+    pending = None
+
+    for kind, spec in stages:
+        if kind == "lut":
+            pending = spec if pending is None else _compose_luts(pending, spec)
+
+        elif kind == "contrast":
+            # --- The mean after the pending table is computable from the current histogram ---
+            table = _build_contrast_lut(spec, _mean_gray(img, pending))
+            pending = table if pending is None else _compose_luts(pending, table)
+
+        else:
+            if pending is not None:
+                img = img.point(list(pending))
+                pending = None
+
+            # --- Plain luma uses Pillow's fixed-point gray conversion, which beats any float matrix ---
+            if spec == GRAYSCALE_MATRIX:
+                img = img.convert("L").convert("RGB")
+
+            else:
+                img = img.convert("RGB", spec)
+
+    if pending is not None:
+        img = img.point(list(pending))
+
+    return img
+
+# (4) Apply a single named point effect
+def apply_point_effect(img: Image.Image, name: str) -> Image.Image:
+    return apply_point_ops(img, compile_point_ops([name]))
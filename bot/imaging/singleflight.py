@@ -0,0 +1,54 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+class SingleFlight:
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+        # --- Counters ---
+        self._started = 0
+        self._coalesced = 0
+
+    # --- Number of distinct jobs currently running ---
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    # --- A job for this key is running right now ---
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    # --- Run factory() once per key; concurrent callers with the same key await the same result ---
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            self._started += 1
+
+        else:
+            self._coalesced += 1
+
+        # --- Shield the shared job so one cancelled caller does not cancel it for everyone ---
+        return await asyncio.shield(task)
+
+    # --- Forget a finished job ---
+    def _finish(self, key: Hashable, task: asyncio.Future):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+
+        # --- Mark the exception as retrieved even if every caller was cancelled ---
+        if not task.cancelled():
+            task.exception()
+
+    # --- Snapshot of coalescing counters ---
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._calls),
+            "started": self._started,
+            "coalesced": self._coalesced,
+        }
@@ -0,0 +1,91 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import io
+import os
+import hashlib
+from pathlib import Path
+from PIL import Image
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .encoder import encode_image, sniff_extension
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Downscale an image to a display width (aspect ratio kept, never upscaled) and re-encode it
+def build_variant(image_data: bytes, width: int, encoding: dict = None) -> bytes:
+    img = Image.open(io.BytesIO(image_data))
+    img.load()
+
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+
+    if width and img.width > width:
+        height = max(1, round(img.height * width / img.width))
+        img = img.resize((width, height), Image.LANCZOS)
+
+    return encode_image(img, encoding)
+
+# (2) Display-sized variants kept on disk, keyed by the source file's hash and the build settings
+class VariantCache:
+    def __init__(self, cache_dir: Path, width: int, encoding: dict = None):
+        self.cache_dir = cache_dir
+        self.width = width
+        self.encoding = encoding or {}
+
+        self.cache_dir.mkdir(parents = True, exist_ok = True)
+        self._current = {}
+
+        # --- Counters ---
+        self._built = 0
+        self._reused = 0
+        self._source_bytes = 0
+        self._variant_bytes = 0
+
+    # --- Settings that change the output are part of the key, so editing them rebuilds ---
+    def _key(self, image_data: bytes) -> str:
+        settings = f"{self.width}:{sorted(self.encoding.items())}".encode("utf-8")
+        return hashlib.sha256(image_data + settings).hexdigest()[:24]
+
+    # --- AssetStore transform: (name, source bytes) -> (variant name, variant bytes) ---
+    def __call__(self, name: str, image_data: bytes):
+        path = self.cache_dir / f"{Path(name).stem}-{self._key(image_data)}.bin"
+
+        try:
+            data = path.read_bytes()
+            self._reused += 1
+
+        except FileNotFoundError:
+            data = build_variant(image_data, self.width, self.encoding)
+
+            # --- Never keep a "variant" larger than what it replaces ---
+            if len(data) >= len(image_data):
+                data = image_data
+
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            self._built += 1
+
+        self._current[name] = path.name
+        self._source_bytes += len(image_data)
+        self._variant_bytes += len(data)
+        return f"{Path(name).stem}.{sniff_extension(data)}", data
+
+    # --- Remove variants left behind by edited or deleted sources (or old settings) ---
+    def prune(self):
+        keep = set(self._current.values())
+
+        for file in self.cache_dir.glob("*.bin"):
+            if file.name not in keep:
+                try:
+                    file.unlink()
+
+                except FileNotFoundError:
+                    continue
+
+    # --- Snapshot of build counters ---
+    def stats(self) -> dict:
+        return {
+            "built": self._built,
+            "reused": self._reused,
+            "source_bytes": self._source_bytes,
+            "variant_bytes": self._variant_bytes,
+        }
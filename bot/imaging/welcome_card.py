@@ -0,0 +1,110 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import io
+import threading
+from functools import lru_cache
+from collections import OrderedDict
+from PIL import Image, ImageDraw, ImageFont
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from .effects import to_rgb
+from .encoder import encode_image
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+DEFAULT_CARD = {
+    "avatar_ratio": 0.5,         # Avatar diameter as a fraction of the template height
+    "font": "",                  # TTF/OTF file for the name; Pillow's built-in font when empty
+    "font_ratio": 0.11,          # Name text size as a fraction of the template height
+    "encoding": {"format": "webp", "quality": 85},
+}
+
+MAX_TEMPLATES = 8                # Decoded templates kept per worker
+MASK_SUPERSAMPLE = 4             # Circle masks are drawn this much larger and shrunk for smooth edges
+
+# CACHED ARTIFACTS (per worker) --------------------------------------------------------------------------------------------------------------------|
+_templates: "OrderedDict[str, Image.Image]" = OrderedDict()
+_templates_lock = threading.Lock()
+
+# (1) Decoded template, keyed by the asset's content hash
+def _template(key: str, data: bytes) -> Image.Image:
+    with _templates_lock:
+        img = _templates.get(key)
+        if img is not None:
+            _templates.move_to_end(key)
+            return img
+
+    img = to_rgb(Image.open(io.BytesIO(data)))
+    img.load()
+
+    with _templates_lock:
+        _templates[key] = img
+        if len(_templates) > MAX_TEMPLATES:
+            _templates.popitem(last = False)
+
+    return img
+
+# (2) Anti-aliased circular mask for the avatar
+@lru_cache(maxsize = 8)
+def _circle_mask(diameter: int) -> Image.Image:
+    size = diameter * MASK_SUPERSAMPLE
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size - 1, size - 1), fill = 255)
+    return mask.resize((diameter, diameter), Image.LANCZOS)
+
+# (3) Font at a pixel size
+@lru_cache(maxsize = 8)
+def _font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    if path:
+        try:
+            return ImageFont.truetype(path, size)
+
+        except OSError:
+            pass
+
+    return ImageFont.load_default(size)
+
+# MAIN ---------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Shorten a name until it fits the card width
+def _fit_text(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> str:
+    if draw.textlength(text, font = font) <= max_width:
+        return text
+
+    while len(text) > 1 and draw.textlength(text + "…", font = font) > max_width:
+        text = text[:-1]
+
+    return text + "…"
+
+# (2) Composite a member's avatar and name onto a welcome template (runs inside a render worker)
+def render_welcome_card(template_key: str, template_data: bytes, avatar_data: bytes, display_name: str, options: dict = None) -> bytes:
+    options = {**DEFAULT_CARD, **(options or {})}
+    card = _template(template_key, template_data).copy()
+    width, height = card.size
+
+    diameter = max(16, int(height * options["avatar_ratio"]))
+    center_x, center_y = width // 2, int(height * 0.42)
+    draw = ImageDraw.Draw(card)
+
+    # --- Avatar inside a white ring ---
+    if avatar_data:
+        avatar = to_rgb(Image.open(io.BytesIO(avatar_data)))
+        if avatar.size != (diameter, diameter):
+            avatar = avatar.resize((diameter, diameter), Image.LANCZOS)
+
+        ring = max(2, diameter // 24)
+        left, top = center_x - diameter // 2, center_y - diameter // 2
+        draw.ellipse((left - ring, top - ring, left + diameter + ring, top + diameter + ring), fill = (255, 255, 255))
+        card.paste(avatar, (left, top), _circle_mask(diameter))
+
+    # --- Name under the avatar ---
+    font = _font(options["font"], max(10, int(height * options["font_ratio"])))
+    text = _fit_text(draw, display_name, font, int(width * 0.9))
+    draw.text(
+        (center_x, center_y + diameter // 2 + height // 20),
+        text,
+        font = font,
+        fill = (255, 255, 255),
+        anchor = "mt",
+        stroke_width = max(1, font.size // 12),
+        stroke_fill = (0, 0, 0)
+    )
+
+    return encode_image(card, options["encoding"])
@@ -5,23 +5,17 @@ from dotenv import load_dotenv
 # LOCAL IMPORTS--------------------------------------------------------------------------------------------------------------------------------------|
 from core import get_logger
 from core import BotClient
+from core import get_config, config_load_stats
 
 from helpers import validate_configs
 from helpers import validate_assets
 
-#INITIALIZATION-------------------------------------------------------------------------------------------------------------------------------------|
-# (1) Load environment variables
-load_dotenv()
-
-# (2) Logger
-logger = get_logger()
-
 # DECORATORS ---------------------------------------------------------------------------------------------------------------------------------------|
 divider = f"=" * 70
 sub_divider = f"-" * 70
 
 # BOT TOKEN------------------------------------------------------------------------------------------------------------------------------------------|
-def bot_token():
+def bot_token(logger):
     token = os.getenv("TOKEN")
     if token:
         logger.info("Bot token successfully retrieved.")
@@ -34,12 +28,21 @@ def bot_token():
         raise RuntimeError("Missing Discord bot token.")
 
 # MAIN-----------------------------------------------------------------------------------------------------------------------------------------------|
+# Runs only when started as a script: render workers re-import this module as __mp_main__ and must not build their own logger
 def main():
+    # Environment variables and logger
+    load_dotenv()
+    logger = get_logger()
+
     # Configuration validation
     if not validate_configs():
         logger.critical("Configuration validation failed. Please fix the above errors and restart the bot.")
         exit(1)
 
+    # Configuration snapshot (built from the files parsed for validation)
+    get_config()
+    logger.info(f"Configuration loaded: {config_load_stats()}")
+
     # Assets validation
     if not validate_assets():
         logger.critical("Assets validation failed. Please fix the above errors and restart the bot.")
@@ -47,10 +50,10 @@ def main():
 
     # Bot token
     logger.info(divider)
-    TOKEN = bot_token()
+    TOKEN = bot_token(logger)
 
     # Starting bot
-    bot = BotClient()
+    bot = BotClient(config_validator = validate_configs)
     bot.run(TOKEN)
 
 # RUNNING THE BOT------------------------------------------------------------------------------------------------------------------------------------|
@@ -0,0 +1,21 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import sys
+import pytest
+from pathlib import Path
+
+# PATHS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) The bot runs from bot/, so its packages (core, events, imaging, ...) are imported top-level
+BOT_DIR = Path(__file__).resolve().parent.parent / "bot"
+
+if str(BOT_DIR) not in sys.path:
+    sys.path.insert(0, str(BOT_DIR))
+
+# (2) Same import order as main.py: core first (core.client imports the events package)
+import core  # noqa: E402
+
+# FIXTURES -----------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Flush the bot logger while pytest's captured stdout is still open (atexit runs after it is closed)
+@pytest.fixture(scope = "session", autouse = True)
+def _shutdown_bot_logger():
+    yield
+    core.shutdown_logger()
@@ -0,0 +1,118 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import time
+import logging
+import itertools
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from core import no_dedup
+from core.logger import DedupFilter
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+sub_divider = f"-" * 70
+
+_names = itertools.count()
+
+# HELPERS ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Handler that keeps the written messages
+class _Collect(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(record.getMessage())
+
+# (2) Fresh logger with only the dedup filter and a collecting handler (the background tick is driven by hand)
+def _logger(**options):
+    logger = logging.getLogger(f"test-dedup-{next(_names)}")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+
+    handler = _Collect()
+    logger.addHandler(handler)
+
+    dedup = DedupFilter(logger, **options)
+    logger.addFilter(dedup)
+    return logger, dedup, handler.lines
+
+# (3) The repo's error block: divider, message, divider
+def _block(logger: logging.Logger, message: str, *args):
+    logger.error(sub_divider)
+    logger.error(message, *args)
+    logger.error(sub_divider)
+
+# TESTS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Repeated blocks collapse whole: one framed block, then one framed summary once the window closes
+def test_repeated_error_blocks_keep_their_dividers():
+    logger, dedup, lines = _logger(window = 60)
+
+    for _ in range(3):
+        _block(logger, "Welcome channel ID not found in permissions.yaml")
+
+    dedup.tick(time.time() + 1)
+    assert lines == [sub_divider, "Welcome channel ID not found in permissions.yaml", sub_divider]
+
+    dedup.tick(time.time() + 61)
+    assert lines[3:] == ["Repeated 2 more time(s) in 60s: Welcome channel ID not found in permissions.yaml"]
+
+# (2) Lines between the blocks (a join's INFO record) must not bring the dividers of a collapsed block back
+def test_collapsed_blocks_between_other_records_leave_no_bare_dividers():
+    logger, dedup, lines = _logger(window = 60)
+
+    for index in range(3):
+        _block(logger, "Welcome channel ID not found in permissions.yaml")
+        logger.info("Assigned role to user%d", index)
+
+    dedup.tick(time.time() + 1)
+    assert lines == [
+        sub_divider, "Welcome channel ID not found in permissions.yaml", sub_divider,
+        "Assigned role to user0", "Assigned role to user1", "Assigned role to user2",
+    ]
+
+# (3) Same template, different content: every message is written, each inside its own dividers
+def test_different_messages_with_one_template_are_all_written():
+    logger, dedup, lines = _logger(window = 60)
+
+    _block(logger, "Role with ID %s not found", 1)
+    _block(logger, "Role with ID %s not found", 2)
+    dedup.tick(time.time() + 1)
+
+    assert lines == [
+        sub_divider, "Role with ID 1 not found", sub_divider,
+        sub_divider, "Role with ID 2 not found", sub_divider,
+    ]
+
+# (4) Windows close on the timer, without waiting for another record
+def test_summary_is_written_by_tick_without_new_records():
+    logger, dedup, lines = _logger(window = 5)
+
+    logger.warning("Rate limited")
+    logger.warning("Rate limited")
+    assert lines == ["Rate limited"]
+
+    dedup.tick(time.time() + 6)
+    assert lines == ["Rate limited", "Repeated 1 more time(s) in 5s: Rate limited"]
+
+# (5) Records below min_level and records logged under no_dedup() are never collapsed
+def test_low_levels_and_no_dedup_records_pass():
+    logger, dedup, lines = _logger(window = 60)
+
+    logger.info("Assigned role")
+    logger.info("Assigned role")
+
+    with no_dedup():
+        _block(logger, "Rejected config change to bot.yaml")
+        _block(logger, "Rejected config change to bot.yaml")
+
+    dedup.tick(time.time() + 1)
+    assert lines == ["Assigned role", "Assigned role"] + [sub_divider, "Rejected config change to bot.yaml", sub_divider] * 2
+
+# (6) Sampling keeps a fixed share of a level, starting with the first record
+def test_level_sampling_keeps_every_nth_record():
+    logger, dedup, lines = _logger(level_ratios = {logging.DEBUG: 0.25})
+
+    for index in range(8):
+        logger.debug("tick %d", index)
+
+    assert lines == ["tick 0", "tick 4"]
+    assert dedup.sampled_out == 6
@@ -0,0 +1,38 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import asyncio
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from commands.fun import FunCommands
+from imaging import RenderCache, SingleFlight
+
+# HELPERS ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Cog with only the render cache and single-flight table (no bot needed for the admission decision)
+def _cog() -> FunCommands:
+    cog = FunCommands.__new__(FunCommands)
+    cog.render_cache = RenderCache(max_bytes = 1024)
+    cog.render_flights = SingleFlight()
+    return cog
+
+# TESTS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Only renders that are neither in memory nor already running take a worker slot
+def test_cache_hits_and_joins_skip_admission():
+    async def scenario():
+        cog = _cog()
+        await cog.render_cache.put("cached", b"bytes")
+
+        release = asyncio.Event()
+
+        async def render():
+            await release.wait()
+            return b"bytes"
+
+        running = asyncio.create_task(cog.render_flights.run("running", render))
+        await asyncio.sleep(0)
+
+        needs = {key: cog._needs_worker(key) for key in ("cached", "running", "new")}
+
+        release.set()
+        await running
+        return needs
+
+    assert asyncio.run(scenario()) == {"cached": False, "running": False, "new": True}
@@ -0,0 +1,35 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import asyncio
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from imaging import RenderCache
+
+# CONSTANTS ----------------------------------------------------------------------------------------------------------------------------------------|
+WEBP = {"format": "webp", "quality": 80, "max_bytes": 0}
+PNG = {"format": "png", "quality": 80, "max_bytes": 0}
+
+# TESTS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Changing the encoding profile or the animation settings must change the key
+def test_key_changes_with_output_settings():
+    base = RenderCache.make_key("a_1", "blur", 512, {"encoding": WEBP, "animation": None})
+
+    assert base == RenderCache.make_key("a_1", "blur", 512, {"animation": None, "encoding": dict(reversed(list(WEBP.items())))})
+    assert base != RenderCache.make_key("a_1", "blur", 512, {"encoding": PNG, "animation": None})
+    assert base != RenderCache.make_key("a_1", "blur", 512, {"encoding": {**WEBP, "quality": 90}, "animation": None})
+    assert base != RenderCache.make_key("a_1", "blur", 512, {"encoding": WEBP, "animation": {"max_frames": 60}})
+
+# (2) A render stored on disk under the old profile is not served after the profile changes
+def test_disk_tier_misses_after_encoding_change(tmp_path):
+    async def scenario():
+        old_key = RenderCache.make_key("a_1", "blur", 512, {"encoding": PNG, "animation": None})
+        new_key = RenderCache.make_key("a_1", "blur", 512, {"encoding": WEBP, "animation": None})
+
+        await RenderCache(max_bytes = 1024, disk_dir = tmp_path).put(old_key, b"png bytes")
+
+        restarted = RenderCache(max_bytes = 1024, disk_dir = tmp_path)
+        return await restarted.get(old_key), await restarted.get(new_key)
+
+    old, new = asyncio.run(scenario())
+
+    assert old == b"png bytes"
+    assert new is None
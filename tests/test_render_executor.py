@@ -0,0 +1,30 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import time
+import asyncio
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from imaging import RenderExecutor
+
+# TESTS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) A job whose caller timed out still counts as in flight until the worker finishes it
+def test_timed_out_job_counts_until_worker_finishes():
+    async def scenario():
+        executor = RenderExecutor(kind = "thread", max_workers = 1)
+        try:
+            await asyncio.wait_for(executor.run(time.sleep, 0.3), timeout = 0.05)
+
+        except asyncio.TimeoutError:
+            pass
+
+        after_timeout = executor.stats()
+        await asyncio.sleep(0.4)
+        after_finish = executor.stats()
+
+        executor.shutdown()
+        return after_timeout, after_finish
+
+    after_timeout, after_finish = asyncio.run(scenario())
+
+    assert after_timeout["in_flight"] == 1
+    assert after_finish["in_flight"] == 0
+    assert after_finish["completed"] == 1
@@ -0,0 +1,39 @@
+# LIBRARIES ----------------------------------------------------------------------------------------------------------------------------------------|
+import time
+import asyncio
+from types import SimpleNamespace
+
+# LOCAL IMPORTS ------------------------------------------------------------------------------------------------------------------------------------|
+from events.role_retry import RoleRetryQueue
+
+# HELPERS ------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) Member stand-in that records when its roles were applied
+def _member(name: str, finished: list):
+    async def add_roles(*roles, reason = None):
+        finished.append((name, time.monotonic()))
+
+    return SimpleNamespace(name = name, add_roles = add_roles)
+
+# TESTS --------------------------------------------------------------------------------------------------------------------------------------------|
+# (1) A later submission with a shorter backoff must not wait behind an earlier, longer one
+def test_shorter_backoff_submitted_later_finishes_first():
+    async def scenario():
+        finished = []
+        retries = RoleRetryQueue(base_delay = 0.05, max_delay = 10)
+        start = time.monotonic()
+
+        retries.submit(_member("slow", finished), [], attempt = 4)    # due after 0.4 s
+        await asyncio.sleep(0.01)
+        retries.submit(_member("fast", finished), [], attempt = 1)    # due after 0.05 s
+
+        while len(finished) < 2:
+            await asyncio.sleep(0.01)
+
+        retries.close()
+        return start, finished
+
+    start, finished = asyncio.run(scenario())
+
+    assert [name for name, _ in finished] == ["fast", "slow"]
+    assert finished[0][1] - start < 0.3
+    assert finished[1][1] - start >= 0.4